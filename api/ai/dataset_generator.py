@@ -2,7 +2,8 @@
 Dataset generator for AI training.
 
 Generates synthetic workloads with varying characteristics, runs them
-through all scheduling algorithms, and labels each workload with the
+through all scheduling algorithms (in lockstep batches with the
+vectorized BatchSimulator), and labels each workload with the
 best-performing algorithm. This produces training data for the ML
 classifier.
 """
@@ -15,6 +16,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from comparison.comparator import AlgorithmComparator
+from kernel.batch_engine import BatchSimulator, metrics_dicts
 from ai.feature_engineering import extract_features, features_to_vector
 
 
@@ -22,6 +24,7 @@ class DatasetGenerator:
     """Generate labeled training data for the AI recommender."""
 
     QUANTUMS = [1, 2, 4, 8]
+    BATCH_SIZE = 2048   # Workloads simulated together by the BatchSimulator
 
     def __init__(self, seed: int = 42):
         self.rng = random.Random(seed)
@@ -41,34 +44,42 @@ class DatasetGenerator:
         labels = []
         raw_records = []
 
-        for i in range(n_samples):
-            # Generate random workload
-            workload = self._random_workload()
-            quantum = self.rng.choice(self.QUANTUMS)
-
-            # Extract features
-            feats = extract_features(workload, quantum)
-            feat_vec = features_to_vector(feats)
-
-            # Run all algorithms and find the best
-            try:
-                results = self.comparator.compare(workload, quantum)
+        # Draw every workload first (same RNG sequence as one at a time)
+        workloads, quanta = [], []
+        for _ in range(n_samples):
+            workloads.append(self._random_workload())
+            quanta.append(self.rng.choice(self.QUANTUMS))
+
+        # Run all algorithms in lockstep batches and find the best
+        for lo in range(0, n_samples, self.BATCH_SIZE):
+            hi = min(lo + self.BATCH_SIZE, n_samples)
+            batch = BatchSimulator.from_workloads(workloads[lo:hi])
+            per_algo = {
+                algo: metrics_dicts(batch.run(algo, quanta[lo:hi]))
+                for algo in AlgorithmComparator.ALGORITHMS
+            }
+
+            for i in range(lo, hi):
+                workload, quantum = workloads[i], quanta[i]
+
+                # Extract features
+                feats = extract_features(workload, quantum)
+                feat_vec = features_to_vector(feats)
+
+                results = {algo: per_algo[algo][i - lo] for algo in per_algo}
                 best_algo = self._pick_best(results)
-            except Exception:
-                continue
-
-            features_list.append(feat_vec)
-            labels.append(best_algo)
-            raw_records.append({
-                "workload": workload,
-                "quantum": quantum,
-                "features": feats,
-                "results": results,
-                "best": best_algo,
-            })
 
-            if (i + 1) % 500 == 0:
-                print(f"  Generated {i + 1}/{n_samples} samples...")
+                features_list.append(feat_vec)
+                labels.append(best_algo)
+                raw_records.append({
+                    "workload": workload,
+                    "quantum": quantum,
+                    "features": feats,
+                    "results": results,
+                    "best": best_algo,
+                })
+
+            print(f"  Generated {hi}/{n_samples} samples...")
 
         return features_list, labels, raw_records
 
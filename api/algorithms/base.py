@@ -33,6 +33,19 @@ class SchedulerPolicy(ABC):
         """Whether this algorithm uses time quantum (Round Robin)."""
         return False
 
+    @property
+    def ready_key(self):
+        """
+        Function mapping a PCB to the key this policy selects by (lowest
+        first), or None for plain FIFO order.
+
+        The engine keys its ReadyQueue with it, so select_next() and
+        should_preempt() can read the best candidate via peek_best()
+        instead of scanning the queue. Ties go to the earliest-enqueued
+        process. The key must not change while a process is READY.
+        """
+        return None
+
     @abstractmethod
     def select_next(self, ready_queue, processes: list) -> int:
         """
@@ -62,3 +75,18 @@ class SchedulerPolicy(ABC):
             True if the running process should be preempted.
         """
         return False
+
+    def ticks_until_preempt(self, running_pid: int, ready_queue, processes: list):
+        """
+        How many upcoming ticks the running process is guaranteed to keep
+        the CPU, assuming the ready queue does not change.
+
+        Used by the event-driven engine mode to fast-forward the clock.
+        Only called for preemptive algorithms. The default is
+        conservative (0 = re-check every tick); policies that know when
+        should_preempt() can next fire override it.
+
+        Returns:
+            Number of ticks, or None if no policy preemption can occur.
+        """
+        return 0
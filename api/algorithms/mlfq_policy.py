@@ -1,7 +1,8 @@
 """
 MLFQPolicy — Multi-Level Feedback Queue scheduling policy.
 
-Implements a 3-level feedback queue compatible with the SimulationEngine:
+Implements an N-level feedback queue compatible with the SimulationEngine.
+The default is 3 levels:
   Queue 0 (highest priority) — Round Robin, quantum = 4
   Queue 1 (medium priority)  — Round Robin, quantum = 8
   Queue 2 (lowest priority)  — FCFS (run to completion)
@@ -9,19 +10,56 @@ Implements a 3-level feedback queue compatible with the SimulationEngine:
 A new process enters Queue 0. If it uses its full quantum without
 completing, it is demoted to the next queue. A process in a lower
 queue is preempted when a higher-priority queue becomes non-empty.
+With a boost interval S, every S ticks all processes are moved back
+to Queue 0 so long-running jobs cannot starve.
+
+The engine partitions its ReadyQueue into one FIFO deque per level
+(via ready_level), so selection and preemption checks cost O(levels)
+rather than a scan of the whole ready queue.
 """
 
+import math
+
 from .base import SchedulerPolicy
 
 
 class MLFQPolicy(SchedulerPolicy):
-    """Multi-Level Feedback Queue — 3-level with quantum demotion."""
+    """Multi-Level Feedback Queue — N levels with quantum demotion and optional boost."""
 
     QUANTUMS = [4, 8, None]  # None = FCFS (no quantum limit)
 
-    def __init__(self):
-        # Track which queue level each PID is in
-        self.process_levels: dict[int, int] = {}  # pid -> queue_level (0,1,2)
+    def __init__(self, levels: int | None = None, quanta: list | None = None,
+                 boost_interval: int | None = None):
+        """
+        Args:
+            levels:         Number of queues. Defaults to len(quanta), or 3.
+            quanta:         Per-level quantum; None on a level means FCFS.
+                            Defaults to 4, 8, 16, ... with FCFS on the last level.
+            boost_interval: Ticks between priority boosts (None/0 = never).
+
+        Raises:
+            ValueError: If the configuration is inconsistent.
+        """
+        if quanta is None and levels is None:
+            quanta = self.QUANTUMS
+        elif quanta is None:
+            if int(levels) < 1:
+                raise ValueError("MLFQ needs at least one level")
+            quanta = [4 * 2 ** i for i in range(int(levels) - 1)] + [None]
+        quanta = [None if q is None else int(q) for q in quanta]
+        if not quanta:
+            raise ValueError("MLFQ needs at least one level")
+        if levels is not None and int(levels) != len(quanta):
+            raise ValueError("MLFQ levels does not match the number of quanta")
+        if any(q is not None and q < 1 for q in quanta):
+            raise ValueError("MLFQ quanta must be positive (or null for FCFS)")
+        if boost_interval is not None and int(boost_interval) < 0:
+            raise ValueError("MLFQ boost interval must be non-negative")
+
+        self.quanta: list = quanta
+        self.boost_interval: int | None = int(boost_interval) if boost_interval else None
+        # Track which queue level each PID is in (absent = level 0)
+        self.process_levels: dict[int, int] = {}
 
     @property
     def name(self) -> str:
@@ -35,64 +73,79 @@ class MLFQPolicy(SchedulerPolicy):
     def uses_quantum(self) -> bool:
         return True
 
-    def get_quantum_for_pid(self, pid: int) -> int:
+    @property
+    def levels(self) -> int:
+        return len(self.quanta)
+
+    def ready_level(self, pid: int) -> int:
+        """Queue level a PID is placed on when it enters the ready queue."""
+        return self.process_levels.get(pid, 0)
+
+    def get_quantum_for_pid(self, pid: int) -> float:
         """Return the quantum for the queue level this PID is in."""
-        level = self.process_levels.get(pid, 0)
-        q = self.QUANTUMS[level]
-        return q if q is not None else 999999  # FCFS = effectively infinite
+        q = self.quanta[self.process_levels.get(pid, 0)]
+        return q if q is not None else math.inf  # FCFS = no quantum limit
 
     def select_next(self, ready_queue, processes: list) -> int:
-        """Pick from highest-priority (lowest index) non-empty queue."""
-        if len(ready_queue) == 0:
+        """Pick the front of the highest-priority (lowest index) non-empty queue."""
+        level = ready_queue.highest_level()
+        if level == -1:
             return -1
-
-        # Initialize any new processes to queue 0
-        for pid in ready_queue:
-            if pid not in self.process_levels:
-                self.process_levels[pid] = 0
-
-        # Pick process from highest priority queue
-        best_pid = -1
-        best_level = 999
-        for pid in ready_queue:
-            level = self.process_levels.get(pid, 0)
-            if level < best_level:
-                best_level = level
-                best_pid = pid
-            elif level == best_level and best_pid == -1:
-                best_pid = pid
-        return best_pid
+        return ready_queue.peek_level(level)
 
     def should_preempt(self, running_pid: int, ready_queue, processes: list) -> bool:
         """Preempt if a process in a higher-priority queue exists."""
-        if len(ready_queue) == 0:
-            return False
+        level = ready_queue.highest_level()
+        return level != -1 and level < self.process_levels.get(running_pid, 0)
 
-        running_level = self.process_levels.get(running_pid, 0)
-        for pid in ready_queue:
-            if self.process_levels.get(pid, 0) < running_level:
-                return True
-        return False
+    def ticks_until_preempt(self, running_pid: int, ready_queue, processes: list):
+        """Higher-queue preemption only changes when the ready queue does."""
+        if self.should_preempt(running_pid, ready_queue, processes):
+            return 0
+        return None
 
     def on_quantum_expire(self, pid: int):
         """Demote a process to the next lower queue after using its quantum."""
         current = self.process_levels.get(pid, 0)
-        self.process_levels[pid] = min(current + 1, 2)
+        self.process_levels[pid] = min(current + 1, self.levels - 1)
+
+    def on_tick(self, now: int, ready_queue) -> bool:
+        """
+        Apply the periodic priority boost at the start of a tick.
+
+        Returns:
+            True if every process was moved back to Queue 0.
+        """
+        if not self.boost_interval or now == 0 or now % self.boost_interval:
+            return False
+        self.process_levels.clear()
+        ready_queue.relevel()
+        return True
+
+    def next_event_time(self, now: int):
+        """Clock value of the next boost at or after `now`, or None."""
+        if not self.boost_interval:
+            return None
+        return max(-(-now // self.boost_interval) * self.boost_interval, self.boost_interval)
 
     def get_queue_state(self, ready_queue) -> dict:
-        """Return the current state of all 3 queues for visualization."""
-        queues = {0: [], 1: [], 2: []}
-        for pid in ready_queue:
-            level = self.process_levels.get(pid, 0)
-            queues[level].append(pid)
+        """Return the current state of every queue for visualization."""
         return {
             "queues": [
-                {"level": 0, "quantum": 4, "pids": queues[0]},
-                {"level": 1, "quantum": 8, "pids": queues[1]},
-                {"level": 2, "quantum": None, "pids": queues[2]},
-            ]
+                {"level": level, "quantum": q, "pids": ready_queue.level_list(level)}
+                for level, q in enumerate(self.quanta)
+            ],
+            "boostInterval": self.boost_interval,
         }
 
+    def checkpoint_state(self) -> dict:
+        """Copy of the queue levels, for engine checkpoints."""
+        return dict(self.process_levels)
+
+    def restore_state(self, state: dict):
+        """Restore queue levels saved by checkpoint_state()."""
+        self.process_levels = dict(state)
+
     def reset(self):
         """Clear queue level tracking."""
         self.process_levels.clear()
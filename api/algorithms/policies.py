@@ -9,6 +9,26 @@ from .base import SchedulerPolicy
 from .mlfq_policy import MLFQPolicy
 
 
+def _burst(p):
+    return p.burst_time
+
+
+def _neg_burst(p):
+    return -p.burst_time
+
+
+def _remaining(p):
+    return p.remaining_time
+
+
+def _neg_remaining(p):
+    return -p.remaining_time
+
+
+def _priority(p):
+    return p.priority
+
+
 # ── FCFS (First Come First Served) ──────────────────────────────────────
 
 class FCFSPolicy(SchedulerPolicy):
@@ -37,10 +57,12 @@ class SJFPolicy(SchedulerPolicy):
     def is_preemptive(self) -> bool:
         return False
 
+    @property
+    def ready_key(self):
+        return _burst
+
     def select_next(self, ready_queue, processes: list) -> int:
-        if len(ready_queue) == 0:
-            return -1
-        return min(ready_queue, key=lambda pid: processes[pid].burst_time)
+        return ready_queue.peek_best()
 
 
 # ── SRTF (Shortest Remaining Time First) ────────────────────────────────
@@ -54,17 +76,26 @@ class SRTFPolicy(SchedulerPolicy):
     def is_preemptive(self) -> bool:
         return True
 
+    @property
+    def ready_key(self):
+        return _remaining
+
     def select_next(self, ready_queue, processes: list) -> int:
-        if len(ready_queue) == 0:
-            return -1
-        return min(ready_queue, key=lambda pid: processes[pid].remaining_time)
+        return ready_queue.peek_best()
 
     def should_preempt(self, running_pid: int, ready_queue, processes: list) -> bool:
-        if len(ready_queue) == 0:
+        shortest_ready = ready_queue.peek_best()
+        if shortest_ready == -1:
             return False
-        shortest_ready = min(ready_queue, key=lambda pid: processes[pid].remaining_time)
         return processes[shortest_ready].remaining_time < processes[running_pid].remaining_time
 
+    def ticks_until_preempt(self, running_pid: int, ready_queue, processes: list):
+        # The running process only gets shorter, so if it is not
+        # preempted now it cannot be until the ready queue changes.
+        if self.should_preempt(running_pid, ready_queue, processes):
+            return 0
+        return None
+
 
 # ── Priority Scheduling ─────────────────────────────────────────────────
 
@@ -77,10 +108,12 @@ class PriorityPolicy(SchedulerPolicy):
     def is_preemptive(self) -> bool:
         return False
 
+    @property
+    def ready_key(self):
+        return _priority
+
     def select_next(self, ready_queue, processes: list) -> int:
-        if len(ready_queue) == 0:
-            return -1
-        return min(ready_queue, key=lambda pid: processes[pid].priority)
+        return ready_queue.peek_best()
 
 
 # ── Round Robin ──────────────────────────────────────────────────────────
@@ -103,6 +136,10 @@ class RoundRobinPolicy(SchedulerPolicy):
             return -1
         return ready_queue.peek()
 
+    def ticks_until_preempt(self, running_pid: int, ready_queue, processes: list):
+        # Only quantum expiry preempts, which the engine tracks itself.
+        return None
+
 
 # ── LJF (Longest Job First) ─────────────────────────────────────────────
 
@@ -115,10 +152,12 @@ class LJFPolicy(SchedulerPolicy):
     def is_preemptive(self) -> bool:
         return False
 
+    @property
+    def ready_key(self):
+        return _neg_burst
+
     def select_next(self, ready_queue, processes: list) -> int:
-        if len(ready_queue) == 0:
-            return -1
-        return max(ready_queue, key=lambda pid: processes[pid].burst_time)
+        return ready_queue.peek_best()
 
 
 # ── LRTF (Longest Remaining Time First) ─────────────────────────────────
@@ -132,17 +171,28 @@ class LRTFPolicy(SchedulerPolicy):
     def is_preemptive(self) -> bool:
         return True
 
+    @property
+    def ready_key(self):
+        return _neg_remaining
+
     def select_next(self, ready_queue, processes: list) -> int:
-        if len(ready_queue) == 0:
-            return -1
-        return max(ready_queue, key=lambda pid: processes[pid].remaining_time)
+        return ready_queue.peek_best()
 
     def should_preempt(self, running_pid: int, ready_queue, processes: list) -> bool:
-        if len(ready_queue) == 0:
+        longest_ready = ready_queue.peek_best()
+        if longest_ready == -1:
             return False
-        longest_ready = max(ready_queue, key=lambda pid: processes[pid].remaining_time)
         return processes[longest_ready].remaining_time > processes[running_pid].remaining_time
 
+    def ticks_until_preempt(self, running_pid: int, ready_queue, processes: list):
+        # The running process shrinks by one per tick; it is preempted on
+        # the first tick its remaining time drops below the longest ready.
+        longest_ready = ready_queue.peek_best()
+        if longest_ready == -1:
+            return None
+        slack = processes[running_pid].remaining_time - processes[longest_ready].remaining_time
+        return max(slack + 1, 0)
+
 
 # ── Policy Registry ─────────────────────────────────────────────────────
 
@@ -4,10 +4,23 @@ Algorithm Comparator — run the same process set on all algorithms.
 Produces a side-by-side comparison of final metrics for every
 scheduling algorithm, useful for the comparison dashboard and
 for generating AI training data.
+
+Results are cached by workload content. The cache key is a hash of the
+(arrival, burst, priority) of every process in submission order, plus
+the quantum and whether details were asked for, so a re-submitted
+workload (the comparison page re-requests constantly) is answered from
+memory instead of re-running all eight algorithms. Submission order is
+part of the key because it assigns the PIDs, which break scheduling ties
+and label the per-process output. The cache is an LRU of `cache_size`
+entries, and workloads over CACHE_MAX_PROCESSES processes are never
+cached, which bounds its memory.
 """
 
+import hashlib
 import sys
 import os
+import threading
+from collections import OrderedDict
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
@@ -15,11 +28,30 @@ from kernel.engine import SimulationEngine
 from algorithms.policies import POLICY_BY_NAME
 
 
+CACHE_SIZE = 128                 # Comparisons remembered (LRU)
+CACHE_MAX_PROCESSES = 5_000      # Larger workloads are simulated every time
+
+
 class AlgorithmComparator:
     """Run a workload across all algorithms and collect results."""
 
     ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
 
+    # Ranking keys, most significant first: tail latency, then the average
+    RANK_BY = ["p99ResponseTime", "p95ResponseTime", "p99TurnaroundTime", "avgWaitTime"]
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        """
+        Args:
+            cache_size: Comparisons kept in the result cache (0 disables it).
+        """
+        self.cache_size: int = max(int(cache_size), 0)
+        self._cache: OrderedDict[bytes, dict] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
     def compare(
         self,
         process_configs: list[dict],
@@ -34,10 +66,19 @@ class AlgorithmComparator:
 
         Returns:
             Dict mapping algorithm name → final metrics dict.
+
+        Engines run headless (metrics only); see compare_detailed() for
+        gantt and per-process output. Results may come from the cache and
+        are shared with later calls: treat them as read-only.
         """
+        key = self._cache_key(process_configs, time_quantum, detailed=False)
+        results = self._cache_get(key)
+        if results is not None:
+            return results
+
         results = {}
         for algo_name in self.ALGORITHMS:
-            engine = SimulationEngine()
+            engine = SimulationEngine(headless=True)
             engine.set_policy(algo_name)
             engine.set_time_quantum(time_quantum)
 
@@ -51,6 +92,7 @@ class AlgorithmComparator:
             engine.run_to_completion()
             results[algo_name] = engine.get_final_metrics()
 
+        self._cache_put(key, results)
         return results
 
     def compare_detailed(
@@ -62,8 +104,14 @@ class AlgorithmComparator:
         Same as compare() but also returns per-process details.
 
         Returns:
-            Dict mapping algorithm name → {metrics, processes, gantt}.
+            Dict mapping algorithm name → {metrics, processes, gantt}
+            (read-only, as with compare()).
         """
+        key = self._cache_key(process_configs, time_quantum, detailed=True)
+        results = self._cache_get(key)
+        if results is not None:
+            return results
+
         results = {}
         for algo_name in self.ALGORITHMS:
             engine = SimulationEngine()
@@ -77,7 +125,7 @@ class AlgorithmComparator:
                     priority=p.get("priority", 0),
                 )
 
-            engine.run_to_completion()
+            engine.run_to_completion(snapshots=False)
             state = engine.get_state()
             results[algo_name] = {
                 "metrics": engine.get_final_metrics(),
@@ -85,4 +133,72 @@ class AlgorithmComparator:
                 "gantt": state["gantt"],
             }
 
+        self._cache_put(key, results)
         return results
+
+    def rank(self, results: dict) -> list[str]:
+        """
+        Algorithms from best to worst tail latency (lower is better).
+
+        Accepts the output of compare() or compare_detailed(); ties on
+        every RANK_BY key keep ALGORITHMS order.
+        """
+        def key(name):
+            metrics = results[name].get("metrics", results[name])
+            return [metrics.get(k, 0) for k in self.RANK_BY]
+        return sorted(results, key=key)
+
+    # ── Result cache ──
+
+    def _cache_key(self, process_configs: list[dict], time_quantum, detailed: bool) -> bytes | None:
+        """
+        Content hash of a comparison, or None if it is not to be cached.
+        Fields are resolved with the same aliases the engines are fed with,
+        so {"arrival": 0} and {"arrivalTime": 0} share an entry.
+        """
+        if not self.cache_size or len(process_configs) > CACHE_MAX_PROCESSES:
+            return None
+        workload = [
+            (p.get("arrival", p.get("arrivalTime", 0)),
+             p.get("burst", p.get("burstTime", 1)),
+             p.get("priority", 0))
+            for p in process_configs
+        ]
+        canonical = repr((time_quantum, bool(detailed), workload)).encode()
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+
+    def _cache_get(self, key: bytes | None) -> dict | None:
+        if key is None:
+            return None
+        with self._cache_lock:
+            results = self._cache.get(key)
+            if results is None:
+                self.misses += 1
+            else:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            return results
+
+    def _cache_put(self, key: bytes | None, results: dict):
+        if key is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = results
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    def cache_info(self) -> dict:
+        """Result cache counters."""
+        with self._cache_lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._cache),
+                "maxSize": self.cache_size,
+            }
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
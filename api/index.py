@@ -4,58 +4,151 @@ app.py - Flask REST API for the CPU Scheduling Visualizer
 Serves both the legacy v1 API (from scheduler.py) and the new v2 API
 powered by the kernel simulation engine.
 
+Each client gets its own engine and scheduler, keyed by the
+X-Session-ID header or the `sid` cookie (issued on first contact);
+see sessions.py for eviction and locking.
+
 Run:
     python3 api/app.py
 """
 
+import csv
+import functools
+import io
+import json
 import os
 import sys
+import uuid
+import zlib
 
 # So we can import from the same folder
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, make_response, request
 from flask_cors import CORS
+from werkzeug.local import LocalProxy
 
 # Legacy scheduler (v1)
 from scheduler import Scheduler
 
 # New kernel engine (v2)
-from kernel.engine import SimulationEngine
+from kernel.engine import SimulationEngine, KERNEL_LOG_CAPACITY
+from kernel.smp_engine import SMPSimulationEngine
 from comparison.comparator import AlgorithmComparator
 from ai.predictor import SchedulerPredictor
+from responses import FastJSONProvider, compress
+from sessions import SessionRegistry
+from streaming import tick_stream
 
 app = Flask(__name__)
-CORS(app)
+app.json = FastJSONProvider(app)
+CORS(app, expose_headers=["X-Metrics-Columns", "X-Session-ID"])
 
 # ── Instances ──
 
-scheduler = Scheduler()                  # Legacy v1
-engine = SimulationEngine()              # New v2
+sessions = SessionRegistry(
+    max_sessions=int(os.environ.get("SESSION_MAX", 256)),
+    ttl=float(os.environ.get("SESSION_TTL", 1800)),
+    memory_budget=int(os.environ.get("SESSION_MEMORY_MB", 1024)) << 20,
+)
+scheduler = LocalProxy(lambda: g.session.scheduler)   # Legacy v1, per session
+engine = LocalProxy(lambda: g.session.engine)         # New v2, per session
 comparator = AlgorithmComparator()
 
 # Try to load AI model (may not exist yet)
 predictor = SchedulerPredictor()
 
 
+# ── Sessions ──
+
+SESSION_HEADER = "X-Session-ID"
+SESSION_COOKIE = "sid"
+SESSION_PARAM = "sessionId"        # For EventSource, which cannot set headers
+
+
+def session_scoped(view):
+    """Run a view with g.session set to the caller's session, holding its lock."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        session_id = (
+            request.headers.get(SESSION_HEADER)
+            or request.args.get(SESSION_PARAM)
+            or request.cookies.get(SESSION_COOKIE)
+        )
+        if not session_id or len(session_id) > 128:
+            session_id = g.new_session_id = uuid.uuid4().hex
+        session = g.session = sessions.get(session_id)
+        with session.lock:
+            try:
+                return view(*args, **kwargs)
+            finally:
+                sessions.release(session)
+    return wrapper
+
+
+@app.after_request
+def _attach_session_id(response):
+    """Echo the session ID, and set the cookie for clients that had none."""
+    session = g.get("session")
+    if session is not None:
+        response.headers[SESSION_HEADER] = session.id
+        if g.get("new_session_id"):
+            response.set_cookie(SESSION_COOKIE, session.id, httponly=True, samesite="Lax")
+    return response
+
+
+# ── Caching & Compression ──
+
+_BOOT_ID = uuid.uuid4().hex[:8]    # Engine versions restart with the process
+
+
+def versioned(view):
+    """
+    ETag a view's response by the session engine's version, and answer
+    304 Not Modified without running the view when the client already
+    has it. Goes below @session_scoped.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        etag = f"{_BOOT_ID}-{g.session.engine.version}-{zlib.crc32(request.full_path.encode()):x}"
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "no-cache"   # Revalidate every time
+        response.vary.update((SESSION_HEADER, "Cookie"))
+        return response
+    return wrapper
+
+
+@app.after_request
+def _compress(response):
+    return compress(response, request.accept_encodings)
+
+
 # ══════════════════════════════════════════════════════════════════════
 #  LEGACY v1 API (preserved for backward compatibility)
 # ══════════════════════════════════════════════════════════════════════
 
 @app.route("/api/init", methods=["POST"])
+@session_scoped
 def init():
-    global scheduler
-    scheduler = Scheduler()
+    g.session.scheduler = Scheduler()
     return jsonify({"ok": True})
 
 
 @app.route("/api/reset", methods=["POST"])
+@session_scoped
 def reset():
     scheduler.reset()
     return jsonify({"ok": True})
 
 
 @app.route("/api/set-algorithm", methods=["POST"])
+@session_scoped
 def set_algorithm():
     data = request.get_json(force=True)
     scheduler.set_algorithm(int(data.get("algorithm", 0)))
@@ -63,6 +156,7 @@ def set_algorithm():
 
 
 @app.route("/api/set-time-quantum", methods=["POST"])
+@session_scoped
 def set_time_quantum():
     data = request.get_json(force=True)
     scheduler.set_time_quantum(int(data.get("quantum", 2)))
@@ -70,6 +164,7 @@ def set_time_quantum():
 
 
 @app.route("/api/add-process", methods=["POST"])
+@session_scoped
 def add_process():
     data = request.get_json(force=True)
     pid = scheduler.add_process(
@@ -81,24 +176,31 @@ def add_process():
 
 
 @app.route("/api/clear-processes", methods=["POST"])
+@session_scoped
 def clear_processes():
     scheduler.clear_processes()
     return jsonify({"ok": True})
 
 
 @app.route("/api/step", methods=["POST"])
+@session_scoped
 def step():
     running = scheduler.step()
     return jsonify({"ok": True, "running": running, **scheduler.get_state()})
 
 
 @app.route("/api/run-to-completion", methods=["POST"])
+@session_scoped
 def run_to_completion():
+    data = request.get_json(force=True, silent=True) or {}
+    if "horizon" in data:
+        scheduler.set_horizon(_parse_horizon(data["horizon"]))
     scheduler.run_to_completion()
     return jsonify({"ok": True, **scheduler.get_state()})
 
 
 @app.route("/api/state", methods=["GET"])
+@session_scoped
 def state():
     return jsonify(scheduler.get_state())
 
@@ -109,19 +211,57 @@ def state():
 
 # ── Init / Reset ──
 
+MAX_CORES = 64                     # /api/v2/init limits (one engine per client)
+MAX_LOG_CAPACITY = 1_000_000       # Kernel events kept in memory (23 bytes each)
+
+
 @app.route("/api/v2/init", methods=["POST"])
+@session_scoped
 def v2_init():
-    global engine
-    engine = SimulationEngine()
     data = request.get_json(force=True) if request.data else {}
-    if "algorithm" in data:
-        engine.set_policy_by_id(int(data["algorithm"]))
-    if "quantum" in data:
-        engine.set_time_quantum(int(data["quantum"]))
+    try:
+        cores = _clamp(int(data.get("cores", 1)), 1, MAX_CORES)
+        options = {
+            "columnar": bool(data.get("columnar", False)),   # NumPy process table for huge workloads
+            "log_capacity": _clamp(int(data.get("logCapacity", KERNEL_LOG_CAPACITY)), 1, MAX_LOG_CAPACITY),
+            "log_events": data.get("logEvents"),             # Event names to record (null = all)
+        }
+        if cores > 1:
+            engine = SMPSimulationEngine(
+                num_cores=cores,
+                balance_interval=int(data.get("balanceInterval", 10)),
+                **options,
+            )
+        else:
+            engine = SimulationEngine(**options)
+    except KeyError as e:
+        return jsonify({"ok": False, "error": f"unknown kernel event {e}"}), 400
+    except (TypeError, ValueError) as e:
+        return jsonify({"ok": False, "error": f"invalid engine options: {e}"}), 400
+    # Configure the new engine fully before it replaces the session's one,
+    # so a rejected request leaves the running simulation alone
+    try:
+        if "algorithm" in data:
+            engine.set_policy_by_id(int(data["algorithm"]))
+        if "quantum" in data:
+            engine.set_time_quantum(int(data["quantum"]))
+        if "horizon" in data:
+            engine.set_horizon(_parse_horizon(data["horizon"]))
+        if any(k in data for k in ("mlfqLevels", "mlfqQuanta", "mlfqBoostInterval")):
+            engine.set_mlfq_config(
+                levels=data.get("mlfqLevels"),
+                quanta=data.get("mlfqQuanta"),
+                boost_interval=data.get("mlfqBoostInterval"),
+            )
+    except (TypeError, ValueError) as e:
+        engine.kernel_log.close()
+        return jsonify({"ok": False, "error": str(e)}), 400
+    g.session.engine = engine
     return jsonify({"ok": True})
 
 
 @app.route("/api/v2/reset", methods=["POST"])
+@session_scoped
 def v2_reset():
     engine.reset()
     return jsonify({"ok": True})
@@ -130,6 +270,7 @@ def v2_reset():
 # ── Configuration ──
 
 @app.route("/api/v2/set-algorithm", methods=["POST"])
+@session_scoped
 def v2_set_algorithm():
     data = request.get_json(force=True)
     algo = data.get("algorithm", 0)
@@ -141,26 +282,159 @@ def v2_set_algorithm():
 
 
 @app.route("/api/v2/set-time-quantum", methods=["POST"])
+@session_scoped
 def v2_set_time_quantum():
     data = request.get_json(force=True)
     engine.set_time_quantum(int(data.get("quantum", 2)))
     return jsonify({"ok": True})
 
 
+@app.route("/api/v2/set-horizon", methods=["POST"])
+@session_scoped
+def v2_set_horizon():
+    """Set the simulated time at which runs stop (null = unbounded)."""
+    data = request.get_json(force=True)
+    engine.set_horizon(_parse_horizon(data.get("horizon")))
+    return jsonify({"ok": True})
+
+
+def _parse_horizon(value):
+    """Horizon from a request body: a positive int, or null/0 for unbounded."""
+    if value is None:
+        return None
+    value = int(value)
+    return value if value > 0 else None
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    return min(max(value, low), high)
+
+
 # ── Process Management ──
 
 @app.route("/api/v2/add-process", methods=["POST"])
+@session_scoped
 def v2_add_process():
     data = request.get_json(force=True)
-    pid = engine.add_process(
-        arrival=int(data.get("arrivalTime", data.get("arrival", 0))),
-        burst=int(data.get("burstTime", data.get("burst", 1))),
-        priority=int(data.get("priority", 0)),
-    )
+    try:
+        arrival = _optional_int(data, "arrivalTime", "arrival")
+        burst = _optional_int(data, "burstTime", "burst")
+        priority = _optional_int(data, "priority")
+        pid = engine.add_process(
+            arrival=0 if arrival is None else arrival,
+            burst=1 if burst is None else burst,
+            priority=0 if priority is None else priority,
+        )
+    except (TypeError, ValueError) as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
     return jsonify({"ok": True, "pid": pid})
 
 
+@app.route("/api/v2/add-processes", methods=["POST"])
+@session_scoped
+def v2_add_processes():
+    """
+    Add many processes in one call (see SimulationEngine.add_processes).
+
+    Body: a JSON array of process objects (keys as for /add-process) or
+    {"processes": [...]}; or, with Content-Type text/csv, rows of
+    arrival, burst[, priority], optionally under a header row naming
+    the columns (arrivalTime/arrival, burstTime/burst, priority).
+    """
+    try:
+        if request.mimetype == "text/csv":
+            columns = _parse_process_csv(request.get_data(as_text=True))
+        else:
+            columns = _parse_process_json(request.get_json(force=True))
+        pids = engine.add_processes(*columns)
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    return jsonify({"ok": True, "count": len(pids), "firstPid": pids.start})
+
+
+def _parse_process_json(data) -> tuple[list, list, list]:
+    """Arrival, burst and priority lists from a JSON process array."""
+    rows = data.get("processes") if isinstance(data, dict) else data
+    if not isinstance(rows, list):
+        raise ValueError("expected a JSON array of processes")
+    arrival, burst, priority = [], [], []
+    for i, p in enumerate(rows):
+        try:
+            values = (
+                _optional_int(p, "arrivalTime", "arrival"),
+                _optional_int(p, "burstTime", "burst"),
+                _optional_int(p, "priority"),
+            )
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError(f"process {i}: expected an object with integer arrival, burst and priority")
+        for column, value, default in zip((arrival, burst, priority), values, (0, 1, 0)):
+            column.append(default if value is None else value)
+    return arrival, burst, priority
+
+
+# CSV header name (lowercased, without "_" or spaces) → column
+_CSV_COLUMNS = {
+    "arrival": 0, "arrivaltime": 0,
+    "burst": 1, "bursttime": 1,
+    "priority": 2,
+}
+
+
+def _parse_process_csv(text: str) -> tuple[list, list, list]:
+    """Arrival, burst and priority lists from CSV rows (header optional)."""
+    rows = [row for row in csv.reader(io.StringIO(text)) if any(cell.strip() for cell in row)]
+    positions = [0, 1, 2]                 # CSV column of arrival, burst, priority
+    first = 0
+    if rows and not rows[0][0].strip().lstrip("-").isdigit():
+        names = [cell.strip().lower().replace("_", "").replace(" ", "") for cell in rows[0]]
+        positions = [None, None, None]
+        for i, name in enumerate(names):
+            if name in _CSV_COLUMNS:
+                positions[_CSV_COLUMNS[name]] = i
+        if positions[1] is None:
+            raise ValueError("CSV header has no burst column")
+        first = 1
+    columns = ([], [], [])
+    defaults = (0, 1, 0)
+    for line, row in enumerate(rows[first:], start=first + 1):
+        try:
+            for values, i, default in zip(columns, positions, defaults):
+                values.append(int(row[i]) if i is not None and i < len(row) and row[i].strip() else default)
+        except ValueError:
+            raise ValueError(f"CSV row {line}: expected integers, got {row}")
+    return columns
+
+
+@app.route("/api/v2/update-process", methods=["POST"])
+@session_scoped
+def v2_update_process():
+    """Edit a process; the engine re-simulates from the affected point only."""
+    data = request.get_json(force=True)
+    try:
+        engine.update_process(
+            int(data["pid"]),
+            arrival=_optional_int(data, "arrivalTime", "arrival"),
+            burst=_optional_int(data, "burstTime", "burst"),
+            priority=_optional_int(data, "priority"),
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    return jsonify({"ok": True, "pid": int(data["pid"])})
+
+
+def _optional_int(data: dict, *keys):
+    """First of `keys` present (and non-null) in a request body, as an int."""
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            if isinstance(value, bool) or isinstance(value, float) and not value.is_integer():
+                raise ValueError(f"{key} must be an integer")
+            return int(value)
+    return None
+
+
 @app.route("/api/v2/clear", methods=["POST"])
+@session_scoped
 def v2_clear():
     engine.clear()
     return jsonify({"ok": True})
@@ -169,50 +443,195 @@ def v2_clear():
 # ── Simulation ──
 
 @app.route("/api/v2/tick", methods=["POST"])
+@session_scoped
 def v2_tick():
-    """Execute one tick and return current state + latest metrics snapshot."""
-    running = engine.tick()
-    state = engine.get_state()
+    """
+    Execute one or more ticks and return current state + latest metrics snapshot.
+
+    Body (all optional):
+        n:         Ticks to run (default 1, or no limit with until/stopOn).
+        until:     Run until the clock reaches this value.
+        stopOn:    Kernel event name(s), e.g. ["complete", "preempt"]; stop
+                   after the tick in which one of them happens.
+        sinceSeq:  The "seq" of the last state the client applied; only
+                   the changes since then are returned (see
+                   kernel/state_delta.py), however many ticks ran.
+
+    The response adds "ticks" (how many ran) and "stoppedOn" (the
+    stopOn event that ended the step, or null).
+    """
+    data = request.get_json(force=True, silent=True) or {}
+    try:
+        since = _optional_int(data, "sinceSeq")
+        ticks = _optional_int(data, "n", "ticks")
+        until = _optional_int(data, "until", "targetTime")
+    except (TypeError, ValueError):
+        return jsonify({"ok": False, "error": "n, until and sinceSeq must be integers"}), 400
+    stop_on = data.get("stopOn") or None
+    if isinstance(stop_on, str):
+        stop_on = [stop_on]
+    if ticks is None and until is None and stop_on is None:
+        ticks = 1
+
+    started = engine.current_time
+    try:
+        stopped_on = engine.step(ticks, until, stop_on)
+    except (KeyError, TypeError) as e:
+        return jsonify({"ok": False, "error": f"unknown kernel event {e}"}), 400
+    state = g.session.deltas.since(g.session.engine, since, _max_points(data))
     # Include just the latest snapshot for efficiency
-    latest_snapshot = (
-        engine.metrics_collector.tick_snapshots[-1]
-        if engine.metrics_collector.tick_snapshots
-        else {}
-    )
+    latest_snapshot = engine.metrics_collector.latest_snapshot
     return jsonify({
         "ok": True,
-        "running": running,
+        "running": bool(len(engine.processes)) and not engine.is_completed and not engine.is_truncated,
+        "ticks": engine.current_time - started,
+        "stoppedOn": stopped_on.name.lower() if stopped_on is not None else None,
         "latestSnapshot": latest_snapshot,
         **state,
     })
 
 
 @app.route("/api/v2/run-all", methods=["POST"])
+@session_scoped
 def v2_run_all():
     """Run simulation to completion and return full state with all snapshots."""
-    engine.run_to_completion()
-    return jsonify({"ok": True, **engine.get_state()})
+    data = request.get_json(force=True, silent=True) or {}
+    engine.run_to_completion(
+        event_driven=bool(data.get("eventDriven", False)),
+        snapshots=bool(data.get("snapshots", True)),
+    )
+    return jsonify({"ok": True, **g.session.deltas.full(g.session.engine, _max_points(data))})
+
+
+@app.route("/api/v2/seek", methods=["POST"])
+@session_scoped
+def v2_seek():
+    """Move the simulation to a given tick (restoring the nearest checkpoint)."""
+    data = request.get_json(force=True)
+    try:
+        tick = int(data.get("tick", data.get("time", 0)))
+    except (TypeError, ValueError):
+        return jsonify({"ok": False, "error": "tick must be an integer"}), 400
+    running = engine.seek(tick)
+    return jsonify({
+        "ok": True,
+        "running": running,
+        "latestSnapshot": engine.metrics_collector.latest_snapshot,
+        **g.session.deltas.full(g.session.engine, _max_points(data)),
+    })
 
 
 @app.route("/api/v2/state", methods=["GET"])
+@session_scoped
+@versioned
 def v2_state():
-    return jsonify(engine.get_state())
+    return jsonify(g.session.deltas.full(g.session.engine, _max_points(request.args), record=False))
+
+
+def _max_points(source):
+    """Optional maxPoints (history downsampling) from a body or query string."""
+    value = source.get("maxPoints")
+    if value is None:
+        return None
+    try:
+        return max(int(value), 2)
+    except (TypeError, ValueError):
+        return None
 
 
 @app.route("/api/v2/metrics-history", methods=["GET"])
+@session_scoped
+@versioned
 def v2_metrics_history():
-    """Return the full array of per-tick metric snapshots."""
-    return jsonify({
-        "ok": True,
-        "history": engine.metrics_collector.tick_snapshots,
-    })
+    """
+    Return the recorded per-tick metric snapshots.
+
+    ?format=rows (default) returns a list of snapshot dicts,
+    ?format=columnar one list per metric, and ?format=binary the raw
+    little-endian column arrays (application/octet-stream) with their
+    layout in the X-Metrics-Columns header. ?maxPoints=N downsamples
+    to at most N snapshots, keeping each metric's min/max envelope.
+    """
+    history = engine.metrics_collector.history
+    max_points = _max_points(request.args)
+    if max_points is not None:
+        history = history.downsample(max_points)
+    fmt = request.args.get("format", "rows")
+    if fmt == "columnar":
+        return jsonify({"ok": True, "length": len(history), "columns": history.to_columns()})
+    if fmt == "binary":
+        header, body = history.to_bytes()
+        return Response(body, mimetype="application/octet-stream",
+                        headers={"X-Metrics-Columns": json.dumps(header)})
+    if fmt != "rows":
+        return jsonify({"ok": False, "error": f"unknown format {fmt!r}"}), 400
+    return jsonify({"ok": True, "history": history.to_dicts()})
+
+
+# ── Streaming Playback ──
+
+@app.route("/api/v2/stream", methods=["GET"])
+@session_scoped
+def v2_stream():
+    """
+    Server-Sent Events: tick the engine server-side and push each state.
+
+    ?interval= milliseconds per tick (default 500), ?maxPoints= as for
+    /state, ?sinceSeq= the last state the client applied (a reconnecting
+    EventSource sends it as Last-Event-ID instead). See streaming.py for
+    the event format.
+    """
+    try:
+        interval = _parse_interval(request.args.get("interval", 500))
+    except (TypeError, ValueError):
+        return jsonify({"ok": False, "error": "interval must be a number of milliseconds"}), 400
+    try:
+        since = _optional_int({"Last-Event-ID": request.headers.get("Last-Event-ID"),
+                               "sinceSeq": request.args.get("sinceSeq")}, "Last-Event-ID", "sinceSeq")
+    except (TypeError, ValueError):
+        return jsonify({"ok": False, "error": "sinceSeq must be an integer"}), 400
+    session = g.session
+    session.playback.control(interval=interval)
+    return Response(
+        tick_stream(session, sessions, _max_points(request.args), dumps=app.json.dumps, since=since),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/api/v2/stream/control", methods=["POST"])
+@session_scoped
+def v2_stream_control():
+    """Pause, resume or stop the session's stream, or change its interval (ms)."""
+    data = request.get_json(force=True, silent=True) or {}
+    action = data.get("action")
+    if action not in (None, "pause", "resume", "stop"):
+        return jsonify({"ok": False, "error": f"unknown action {action!r}"}), 400
+    try:
+        interval = None if data.get("interval") is None else _parse_interval(data["interval"])
+    except (TypeError, ValueError):
+        return jsonify({"ok": False, "error": "interval must be a number of milliseconds"}), 400
+    playback = g.session.playback
+    if action == "stop":
+        playback.stop()
+    else:
+        playback.control(paused=None if action is None else action == "pause", interval=interval)
+    return jsonify({"ok": True, "paused": playback.paused, "interval": playback.interval * 1000})
+
+
+def _parse_interval(value) -> float:
+    """Tick interval in milliseconds, clamped to 1 ms .. 1 min, in seconds."""
+    value = float(value)
+    if value != value:
+        raise ValueError("interval is NaN")
+    return min(max(value, 1), 60_000) / 1000
 
 
 # ── Algorithm Comparison ──
 
 @app.route("/api/v2/compare", methods=["POST"])
 def v2_compare():
-    """Run the same processes on all algorithms and return comparison."""
+    """Run the same processes on all algorithms; ranking orders them by tail latency."""
     data = request.get_json(force=True)
     processes = data.get("processes", [])
     quantum = int(data.get("quantum", 2))
@@ -226,7 +645,13 @@ def v2_compare():
     else:
         results = comparator.compare(processes, quantum)
 
-    return jsonify({"ok": True, "results": results})
+    return jsonify({"ok": True, "results": results, "ranking": comparator.rank(results)})
+
+
+@app.route("/api/v2/compare/cache", methods=["GET"])
+def v2_compare_cache():
+    """Hit/miss counters of the comparison result cache."""
+    return jsonify({"ok": True, **comparator.cache_info()})
 
 
 # ── AI Recommendation ──
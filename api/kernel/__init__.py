@@ -8,13 +8,28 @@ management, and per-tick metrics collection.
 
 from .process import PCB, ProcessState
 from .ready_queue import ReadyQueue
+from .process_table import ProcessTable, PCBView
 from .metrics_collector import MetricsCollector
+from .metrics_history import MetricsHistory
+from .kernel_log import KernelLog, KernelEvent
 from .engine import SimulationEngine
+from .smp_engine import SMPSimulationEngine
+from .batch_engine import BatchSimulator, metrics_dicts
+from .state_delta import StateDeltas
 
 __all__ = [
     "PCB",
     "ProcessState",
     "ReadyQueue",
+    "ProcessTable",
+    "PCBView",
     "MetricsCollector",
+    "MetricsHistory",
+    "KernelLog",
+    "KernelEvent",
     "SimulationEngine",
+    "SMPSimulationEngine",
+    "BatchSimulator",
+    "metrics_dicts",
+    "StateDeltas",
 ]
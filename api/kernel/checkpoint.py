@@ -0,0 +1,94 @@
+"""
+Engine checkpoints.
+
+A Checkpoint is a compact copy of everything SimulationEngine.tick()
+reads or writes, taken between ticks: the dynamic PCB fields, which
+processes are still NEW, the ready queue(s) and running process, policy state
+(e.g. MLFQ levels), MetricsCollector accumulators, and the lengths of
+the append-only gantt / kernel log.
+
+PCB fields are stored column-wise in one int64 array, and only for
+processes that had arrived at checkpoint time. Processes still NEW —
+and any added after the checkpoint — are restored to their initial
+values, and the arrival heap is rebuilt from their (possibly edited)
+arrival times.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .process import ProcessState
+from .process_table import ProcessTable
+from .kernel_log import EVENT_DTYPE
+
+
+# Dynamic PCB fields saved per admitted process
+CHECKPOINT_FIELDS = ("remaining_time",) + tuple(ProcessTable.DYNAMIC_DEFAULTS)
+
+
+@dataclass
+class Checkpoint:
+    """Engine state at the start of tick `time`."""
+
+    time: int
+    scalars: dict                    # Engine counters and flags
+    pids: np.ndarray                 # Processes with saved fields
+    fields: np.ndarray               # (len(CHECKPOINT_FIELDS), len(pids))
+    new_pids: np.ndarray             # Processes still NEW
+    n_processes: int                 # Processes that existed
+    cpus: object                     # Ready queue(s) and running process(es)
+    policy: object                   # Policy state, or None
+    collector: dict                  # MetricsCollector accumulators
+    gantt_len: int
+    gantt_open: list = field(default_factory=list)   # (index, endTime) of extendable bars
+    log_count: int = 0               # Kernel events logged before this point
+    log_tail: np.ndarray = field(default_factory=lambda: np.zeros(0, EVENT_DTYPE))  # Most recent kernel events
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this checkpoint."""
+        return (
+            self.pids.nbytes + self.fields.nbytes + self.new_pids.nbytes
+            + self.log_tail.nbytes + 200
+        )
+
+
+def capture_processes(processes) -> tuple[np.ndarray, np.ndarray]:
+    """Save the dynamic fields of every process that is no longer NEW."""
+    if isinstance(processes, ProcessTable):
+        pids = np.nonzero(processes.column("state") != ProcessState.NEW)[0]
+        values = np.stack([processes.column(name)[pids] for name in CHECKPOINT_FIELDS])
+        return pids, values.astype(np.int64)
+    admitted = [p for p in processes if p.state != ProcessState.NEW]
+    pids = np.array([p.pid for p in admitted], dtype=np.int64)
+    values = np.array(
+        [[int(getattr(p, name)) for p in admitted] for name in CHECKPOINT_FIELDS],
+        dtype=np.int64,
+    ).reshape(len(CHECKPOINT_FIELDS), len(admitted))
+    return pids, values
+
+
+def restore_processes(processes, pids: np.ndarray, values: np.ndarray, new_pids: list[int]):
+    """Write saved fields back and return `new_pids` to their initial NEW state."""
+    if isinstance(processes, ProcessTable):
+        for name, row in zip(CHECKPOINT_FIELDS, values):
+            processes.column(name)[pids] = row
+        if new_pids:
+            new = np.asarray(new_pids, dtype=np.int64)
+            processes.column("remaining_time")[new] = processes.column("burst_time")[new]
+            for name, value in ProcessTable.DYNAMIC_DEFAULTS.items():
+                processes.column(name)[new] = value
+        return
+    columns = values.tolist()
+    for i, pid in enumerate(pids.tolist()):
+        p = processes[pid]
+        for name, column in zip(CHECKPOINT_FIELDS, columns):
+            setattr(p, name, column[i])
+        p.state = ProcessState(p.state)
+    for pid in new_pids:
+        p = processes[pid]
+        p.remaining_time = p.burst_time
+        for name, value in ProcessTable.DYNAMIC_DEFAULTS.items():
+            setattr(p, name, value)
+        p.state = ProcessState.NEW
@@ -9,25 +9,62 @@ OS scheduler works:
     3. Dispatch next process if CPU is idle
     4. Execute one tick on the running process
     5. Handle process completion
-    6. Update waiting times for READY processes
-    7. Record per-tick metrics snapshot
-    8. Advance the clock
+    6. Record per-tick metrics snapshot
+    7. Advance the clock
+
+Waiting time is accounted lazily: a PCB records when it entered READY
+and the elapsed time is added when it is dispatched, so no per-tick
+work is done for processes sitting in the ready queue.
 
 Context switches are tracked whenever the CPU switches between
 different processes (not on idle → running transitions).
+
+run_to_completion(event_driven=True) skips the stretches between
+meaningful events (arrival, completion, quantum expiry, policy
+preemption point) in a single step, so run time scales with the number
+of events rather than with total simulated time.
+
+run_to_completion(snapshots=False) goes further for non-preemptive
+policies (FCFS, SJF, Priority, LJF): the schedule is computed directly
+from the arrival heap and the policy-keyed ready queue, jumping from
+one completion to the next in O(n log n) overall.
+
+While ticking, the engine takes a checkpoint every checkpoint_interval
+ticks; seek(t) restores the latest checkpoint at or before t and
+replays only the remaining ticks.
 """
 
 import sys
 import os
+import bisect
+import heapq
+import itertools
+import math
+
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from .process import PCB, ProcessState
 from .ready_queue import ReadyQueue
+from .process_table import ProcessTable
+from .checkpoint import Checkpoint, capture_processes, restore_processes
 from .metrics_collector import MetricsCollector
+from .kernel_log import KernelLog, KernelEvent, ALL_EVENTS, PREEMPT_QUANTUM, PREEMPT_POLICY, event_mask
 
 from algorithms.base import SchedulerPolicy
 from algorithms.policies import POLICY_MAP, POLICY_BY_NAME, FCFSPolicy
+from algorithms.mlfq_policy import MLFQPolicy
+
+
+KERNEL_LOG_CAPACITY = 10_000   # Most recent kernel events kept in memory
+KERNEL_LOG_TAIL = 50           # Events returned by get_state()
+CHECKPOINT_INTERVAL = 256      # Ticks between checkpoints (doubles when over budget)
+CHECKPOINT_BUDGET = 64 << 20   # Bytes of checkpoints kept per engine
+PCB_BYTES = 600                # Approximate size of a PCB object (for nbytes)
+GANTT_ENTRY_BYTES = 250        # ... and of a gantt entry dict
+
+_VERSIONS = itertools.count(1)   # Engine versions, unique across all engines
 
 
 class SimulationEngine:
@@ -41,44 +78,160 @@ class SimulationEngine:
         engine.add_process(arrival=2, burst=3, priority=2)
         while engine.tick():
             print(engine.get_state())
+
+    Pass columnar=True to keep processes in a NumPy-backed ProcessTable
+    instead of a list of PCB objects (for very large workloads).
+
+    The kernel log keeps the last `log_capacity` events; `log_events`
+    limits which event types are recorded (names or KernelEvent codes,
+    None = all) and `log_spill` names a file that receives the full
+    history (see KernelLog).
+
+    Pass headless=True when only get_final_metrics() is needed: no gantt,
+    kernel log, metric snapshots or checkpoints are recorded, and
+    run_to_completion() takes the snapshot-free fast paths.
     """
 
-    def __init__(self):
-        self.processes: list[PCB] = []
+    def __init__(self, columnar: bool = False, log_capacity: int = KERNEL_LOG_CAPACITY,
+                 log_events=None, log_spill: str | None = None, headless: bool = False):
+        self.processes: list[PCB] | ProcessTable = ProcessTable() if columnar else []
         self.ready_queue = ReadyQueue()
         self.policy: SchedulerPolicy = FCFSPolicy()
+        self.mlfq_config: dict = {}          # MLFQPolicy kwargs (levels, quanta, boost_interval)
         self.current_time: int = 0
         self.running_pid: int = -1
         self.time_quantum: int = 2
         self.context_switches: int = 0
+        self.headless: bool = headless
         self.gantt: list[dict] = []
-        self.metrics_collector = MetricsCollector()
+        self.metrics_collector = MetricsCollector(snapshots=not headless)
         self.is_completed: bool = False
-        self.kernel_log: list[dict] = []  # Kernel event log
+        self.rewinds: int = 0              # Times gantt/log/PCBs went back in time (reset, clear, restore)
+        self.version: int = next(_VERSIONS)   # Changes whenever the state may have (e.g. for ETags)
+        self.horizon: int | None = None   # Stop at this clock value (None = unbounded)
+        self.is_truncated: bool = False   # Run stopped at the horizon, not completion
+        self.kernel_log = KernelLog(
+            log_capacity,
+            mask=0 if headless else ALL_EVENTS if log_events is None else event_mask(log_events),
+            spill_path=log_spill,
+        )
 
         # Internal tracking
         self._last_running_pid: int = -1   # For context switch detection
+        self._arrivals: list[tuple[int, int]] = []  # Min-heap of (arrival, pid) for NEW processes
+        self._terminated: int = 0          # Count of TERMINATED processes
+        self._stop_mask: int = 0           # Kernel events that end step() (event_mask bits)
+        self._stop_event: KernelEvent | None = None
+        self._pcb_changed = np.zeros(0, dtype=np.int64)   # Per PID: epoch of its last change
+        self._change_epoch: int = 1        # Advanced by changes_mark()
+
+        # Checkpoints for seek(), sorted by time
+        self.checkpoint_interval: int = CHECKPOINT_INTERVAL
+        self._checkpoints: list[Checkpoint] = []
+        self._checkpoint_times: list[int] = []
+        self._next_checkpoint: int = 0
+        self._timeline: dict | None = None  # Furthest-reached gantt / log / history
+
+    def _bump_version(self):
+        """Mark the state as changed (a new, never reused version number)."""
+        self.version = next(_VERSIONS)
+
+    # ── Change Tracking ──
+
+    def changes_mark(self) -> int:
+        """A mark for changed_pids(): PCBs changed after this call are newer."""
+        self._change_epoch += 1
+        return self._change_epoch - 1
+
+    def changed_pids(self, mark: int) -> np.ndarray:
+        """PIDs whose PCB changed (or was added) since changes_mark() returned `mark`."""
+        return np.flatnonzero(self._pcb_changed[:len(self.processes)] > mark)
+
+    def _touch(self, pid: int):
+        self._pcb_changed[pid] = self._change_epoch
+
+    def _touch_all(self):
+        self._pcb_changed[:] = self._change_epoch
+
+    def _track_new_processes(self, start: int):
+        """Make room in the change record for PIDs `start` onwards and mark them changed."""
+        n = len(self.processes)
+        if n > len(self._pcb_changed):
+            grown = np.zeros(max(n, 2 * len(self._pcb_changed)), dtype=np.int64)
+            grown[:start] = self._pcb_changed[:start]
+            self._pcb_changed = grown
+        self._pcb_changed[start:n] = self._change_epoch
 
     # ── Configuration ──
 
     def set_policy_by_id(self, algo_id: int):
         """Set scheduling policy by numeric ID (0=FCFS, 1=SJF, ...)."""
         cls = POLICY_MAP.get(algo_id, FCFSPolicy)
-        self.policy = cls()
+        self._install_policy(cls)
+        self.drop_checkpoints()
 
     def set_policy(self, name: str):
         """Set scheduling policy by name ('FCFS', 'SRTF', 'RR', ...)."""
         cls = POLICY_BY_NAME.get(name, FCFSPolicy)
-        self.policy = cls()
+        self._install_policy(cls)
+        self.drop_checkpoints()
+
+    def set_mlfq_config(self, levels: int | None = None, quanta: list | None = None,
+                        boost_interval: int | None = None):
+        """
+        Configure MLFQ levels, per-level quanta and the priority-boost
+        interval. Applies now if MLFQ is the active policy, otherwise the
+        next time it is selected.
+
+        Raises:
+            ValueError: If the configuration is inconsistent.
+        """
+        config = {"levels": levels, "quanta": quanta, "boost_interval": boost_interval}
+        MLFQPolicy(**config)  # Validate before storing
+        self.mlfq_config = config
+        if isinstance(self.policy, MLFQPolicy):
+            self._install_policy(MLFQPolicy)
+            self.drop_checkpoints()
+
+    def _install_policy(self, cls):
+        """Instantiate a policy and index the ready queue for it."""
+        self._bump_version()
+        self.policy = cls(**self.mlfq_config) if cls is MLFQPolicy else cls()
+        self._bind_queue(self.ready_queue)
+
+    def _bind_queue(self, ready_queue: ReadyQueue):
+        """Key (or level-partition) a ready queue for the current policy."""
+        key = self.policy.ready_key
+        processes = self.processes
+        ready_queue.set_key(None if key is None else (lambda pid: key(processes[pid])))
+        if hasattr(self.policy, 'ready_level'):
+            ready_queue.set_levels(self.policy.ready_level, self.policy.levels)
+        else:
+            ready_queue.set_levels(None)
 
     def set_time_quantum(self, quantum: int):
         """Set time quantum for Round Robin."""
         self.time_quantum = max(quantum, 1)
+        self._bump_version()
+        self.drop_checkpoints()
+
+    def set_horizon(self, horizon: int | None):
+        """Set the clock value at which runs stop (None = unbounded)."""
+        self.horizon = horizon
+        self.is_truncated = False
+        self._bump_version()
 
     # ── Process Management ──
 
     def add_process(self, arrival: int, burst: int, priority: int = 0) -> int:
-        """Add a process and return its PID."""
+        """
+        Add a process and return its PID.
+
+        Raises:
+            ValueError: On a non-integer value, a negative arrival or a
+                        burst below 1 (the same checks as add_processes).
+        """
+        self._check_process_fields(arrival=arrival, burst=burst, priority=priority)
         pid = len(self.processes)
         self.processes.append(PCB(
             pid=pid,
@@ -86,13 +239,131 @@ class SimulationEngine:
             burst_time=burst,
             priority=priority,
         ))
-        if self.is_completed:
-            self.is_completed = False
+        heapq.heappush(self._arrivals, (arrival, pid))
+        self._track_new_processes(pid)
+        self._resimulate_from(arrival)
         return pid
 
+    def add_processes(self, arrival, burst, priority=None) -> range:
+        """
+        Add many processes at once and return their PIDs.
+
+        The process table grows once, the arrival heap is rebuilt once
+        and the run is re-simulated once, instead of once per process.
+
+        Args:
+            arrival:  Arrival times (any sequence or array).
+            burst:    Burst times, same length.
+            priority: Priorities, same length (None = all 0).
+
+        Raises:
+            ValueError: On length mismatch, a negative arrival or a burst below 1.
+        """
+        arrival = np.asarray(arrival, dtype=np.int64).ravel()
+        burst = np.asarray(burst, dtype=np.int64).ravel()
+        priority = np.zeros_like(arrival) if priority is None else np.asarray(priority, dtype=np.int64).ravel()
+        if not len(arrival) == len(burst) == len(priority):
+            raise ValueError("arrival, burst and priority must have the same length")
+        for name, values, low in (("arrival", arrival, 0), ("burst", burst, 1)):
+            bad = np.flatnonzero(values < low)
+            if len(bad):
+                raise ValueError(f"process {bad[0]}: {name} must be at least {low}")
+
+        start = len(self.processes)
+        if isinstance(self.processes, ProcessTable):
+            pids = self.processes.extend_arrays(arrival, burst, priority)
+        else:
+            pids = range(start, start + len(arrival))
+            self.processes.extend(
+                PCB(pid=pid, arrival_time=a, burst_time=b, priority=p)
+                for pid, a, b, p in zip(pids, arrival.tolist(), burst.tolist(), priority.tolist())
+            )
+        if len(pids):
+            self._track_new_processes(start)
+            self._arrivals.extend(zip(arrival.tolist(), pids))
+            heapq.heapify(self._arrivals)
+            self._resimulate_from(int(arrival.min()))
+        return pids
+
+    def update_process(self, pid: int, arrival: int | None = None, burst: int | None = None,
+                       priority: int | None = None):
+        """
+        Edit a process's arrival, burst or priority (None = unchanged).
+
+        Raises:
+            ValueError: If there is no process with this PID, or on a
+                        non-integer value, a negative arrival or a burst below 1
+                        (the same checks as add_processes; nothing is changed).
+        """
+        if not 0 <= pid < len(self.processes):
+            raise ValueError(f"no process with PID {pid}")
+        self._check_process_fields(arrival=arrival, burst=burst, priority=priority)
+        proc = self.processes[pid]
+        changed_from = proc.arrival_time if arrival is None else min(proc.arrival_time, arrival)
+        if proc.state == ProcessState.NEW:
+            self._arrivals.remove((proc.arrival_time, pid))
+        if arrival is not None:
+            proc.arrival_time = arrival
+        if burst is not None:
+            proc.burst_time = burst
+        if priority is not None:
+            proc.priority = priority
+        if proc.state == ProcessState.NEW:
+            proc.remaining_time = proc.burst_time
+            self._arrivals.append((proc.arrival_time, pid))
+            heapq.heapify(self._arrivals)
+        self._touch(pid)
+        self._resimulate_from(changed_from)
+
+    @staticmethod
+    def _check_process_fields(**fields):
+        """Validate single-process fields by name (None = not given)."""
+        for name, value in fields.items():
+            if value is None:
+                continue
+            if isinstance(value, bool) or int(value) != value:
+                raise ValueError(f"{name} must be an integer")
+            low = {"arrival": 0, "burst": 1}.get(name)
+            if low is not None and value < low:
+                raise ValueError(f"{name} must be at least {low}")
+
+    def _resimulate_from(self, changed_from: int):
+        """
+        The timeline from clock value `changed_from` on has changed.
+
+        Drops what was simulated after that point — rolling back to the
+        latest checkpoint before it — and replays to where the run was
+        (to completion, event-driven and within the horizon, if it had
+        completed). Everything earlier, including
+        gantt, snapshots and kernel log, is kept; earlier snapshots keep
+        the averages they were recorded with. Like any event-driven run,
+        the replay of a completed run records snapshots only for the
+        ticks it steps.
+        """
+        self._bump_version()
+        target, was_completed = self.current_time, self.is_completed
+        if was_completed:
+            changed_from = min(changed_from, self.current_time - 1)  # Undo the completion tick
+        if self.current_time > changed_from:
+            checkpoint = self._checkpoint_at_or_before(changed_from)
+            if checkpoint is not None:
+                self._restore_checkpoint(checkpoint)
+            else:
+                self.reset()
+        self._truncate_timeline(changed_from)
+        if was_completed:
+            self.run_to_completion(event_driven=True)
+        else:
+            while self.current_time < target and self.tick():
+                pass
+
     def clear(self):
         """Reset everything to initial state."""
+        self.rewinds += 1
+        self._bump_version()
         self.processes.clear()
+        self._arrivals.clear()
+        self._terminated = 0
         self.ready_queue.clear()
         self.gantt.clear()
         self.kernel_log.clear()
@@ -101,41 +372,60 @@ class SimulationEngine:
         self._last_running_pid = -1
         self.context_switches = 0
         self.is_completed = False
+        self.is_truncated = False
         self.metrics_collector.reset()
         if hasattr(self.policy, 'reset'):
             self.policy.reset()
+        self.drop_checkpoints()
 
     def reset(self):
-        """Keep processes but reset all simulation state."""
+        """Keep processes but reset all simulation state (checkpoints stay valid)."""
+        self.rewinds += 1
+        self._bump_version()
+        self._stash_timeline()
         self.ready_queue.clear()
         self.gantt.clear()
         self.kernel_log.clear()
+        self._next_checkpoint = 0
         self.current_time = 0
         self.running_pid = -1
         self._last_running_pid = -1
         self.context_switches = 0
         self.is_completed = False
+        self.is_truncated = False
         self.metrics_collector.reset()
         if hasattr(self.policy, 'reset'):
             self.policy.reset()
-        for p in self.processes:
-            p.remaining_time = p.burst_time
-            p.state = ProcessState.NEW
-            p.start_time = -1
-            p.finish_time = -1
-            p.wait_time = 0
-            p.response_time = -1
-            p.turnaround_time = 0
-            p.quantum_used = 0
-            p.mlfq_queue_level = 0
+        if isinstance(self.processes, ProcessTable):
+            self.processes.reset()
+            self._arrivals = list(zip(self.processes.column("arrival_time").tolist(),
+                                      range(len(self.processes))))
+        else:
+            for p in self.processes:
+                p.remaining_time = p.burst_time
+                p.state = ProcessState.NEW
+                p.start_time = -1
+                p.finish_time = -1
+                p.wait_time = 0
+                p.ready_since = -1
+                p.response_time = -1
+                p.turnaround_time = 0
+                p.quantum_used = 0
+                p.mlfq_queue_level = 0
+            self._arrivals = [(p.arrival_time, p.pid) for p in self.processes]
+        heapq.heapify(self._arrivals)
+        self._terminated = 0
+        self._touch_all()
 
     # ── Kernel Log ──
 
-    def _log_event(self, event: str, **kwargs):
-        """Record a kernel event for the live log view."""
-        entry = {"tick": self.current_time, "event": event}
-        entry.update(kwargs)
-        self.kernel_log.append(entry)
+    def _log_event(self, event: KernelEvent, pid: int = -1, arg: int = 0, arg2: int = 0,
+                   core: int = -1):
+        """Record a kernel event for the live log view (arguments per KernelLog)."""
+        if self._stop_mask >> event & 1:
+            self._stop_event = KernelEvent(event)
+            self._stop_mask = 0
+        self.kernel_log.append(self.current_time, event, pid, arg, arg2, core)
 
     # ── Core Tick Loop ──
 
@@ -146,14 +436,18 @@ class SimulationEngine:
         Returns:
             True if simulation should continue, False if completed.
         """
-        if self.is_completed:
-            return False
-        if not self.processes:
+        if not self._can_tick():
             return False
+        self._bump_version()
+        self._maybe_checkpoint()
 
         # STEP 1: Admit newly arrived processes (NEW → READY)
         self._admit_arrivals()
 
+        # Time-driven policy events (e.g. MLFQ priority boost)
+        if hasattr(self.policy, 'on_tick') and self.policy.on_tick(self.current_time, self.ready_queue):
+            self._log_event(KernelEvent.BOOST)
+
         # STEP 2: Handle preemption
         self._handle_preemption()
 
@@ -164,34 +458,125 @@ class SimulationEngine:
         # STEP 4: Execute one tick on the running process
         self._execute_tick()
 
-        # STEP 5: Update waiting times for all READY processes
-        self._update_waiting_times()
-
-        # STEP 6: Record per-tick metrics snapshot
+        # STEP 5: Record per-tick metrics snapshot
         self.metrics_collector.record_tick(self)
 
-        # STEP 7: Advance the clock
+        # STEP 6: Advance the clock
         self.current_time += 1
 
-        # STEP 8: Check completion
+        # STEP 7: Check completion
         self._check_completion()
 
         return not self.is_completed
 
-    def run_to_completion(self):
-        """Run the simulation until all processes terminate."""
-        while self.tick() and self.current_time < 10000:
-            pass
+    def step(self, ticks: int | None = None, until: int | None = None,
+             stop_on=None) -> KernelEvent | None:
+        """
+        Run several ticks in one call.
+
+        Stops after `ticks` ticks, when the clock reaches `until`, at the
+        end of the first tick in which one of the `stop_on` kernel events
+        happens, or at completion / the horizon, whichever comes first.
+        Every tick is stepped, so snapshots and the log are the same as
+        calling tick() repeatedly.
+
+        Args:
+            ticks:   Most ticks to run (None = no limit).
+            until:   Clock value to stop at (None = no limit).
+            stop_on: Event names or KernelEvent codes (see event_mask).
+                     They are caught even if the kernel log does not record them.
+
+        Returns:
+            The event that ended the step, or None.
+        """
+        remaining = math.inf if ticks is None else ticks
+        end = math.inf if until is None else until
+        self._stop_mask = event_mask(stop_on) if stop_on else 0
+        self._stop_event = None
+        try:
+            while remaining > 0 and self.current_time < end and self.tick():
+                remaining -= 1
+                if self._stop_event is not None:
+                    break
+        finally:
+            self._stop_mask = 0
+        return self._stop_event
+
+    def _can_tick(self) -> bool:
+        """Whether another tick may run; flags truncation at the horizon."""
+        if self.is_completed:
+            return False
+        if not self.processes:
+            return False
+        if self.horizon is not None and self.current_time >= self.horizon:
+            if not self.is_truncated:
+                self._bump_version()
+                self.is_truncated = True
+                self._log_event(KernelEvent.HORIZON_REACHED)
+            return False
+        return True
+
+    def run_to_completion(self, event_driven: bool = False, snapshots: bool = True) -> bool:
+        """
+        Run the simulation until all processes terminate or the horizon
+        is reached.
+
+        Args:
+            event_driven: Jump the clock straight to the next event instead
+                          of stepping every tick. Gantt, per-process and
+                          final metrics are identical to the tick loop;
+                          metricsHistory only holds snapshots for the ticks
+                          that were actually stepped.
+            snapshots:    False when metricsHistory is not needed. Implies
+                          event_driven, and non-preemptive policies are then
+                          solved analytically without recording snapshots.
+
+        Returns:
+            True if every process terminated, False if the run was cut
+            short by the horizon (is_truncated is then set).
+        """
+        if not snapshots or self.headless:
+            event_driven = True
+            if self._is_analytic():
+                self._run_analytic()
+        while self.tick():
+            if event_driven:
+                self._fast_forward(self._ticks_to_horizon())
+        return self.is_completed
+
+    def _ticks_to_horizon(self) -> float:
+        """Ticks left before the horizon (infinite when unbounded)."""
+        if self.horizon is None:
+            return float("inf")
+        return self.horizon - self.current_time
 
     # ── Internal Steps ──
 
     def _admit_arrivals(self):
         """Move newly arrived processes from NEW to READY."""
-        for p in self.processes:
-            if p.state == ProcessState.NEW and p.arrival_time <= self.current_time:
-                p.state = ProcessState.READY
-                self.ready_queue.enqueue(p.pid)
-                self._log_event("arrive", pid=p.pid)
+        arrivals = self._arrivals
+        if not arrivals or arrivals[0][0] > self.current_time:
+            return
+        admitted = []
+        while arrivals and arrivals[0][0] <= self.current_time:
+            admitted.append(heapq.heappop(arrivals)[1])
+        # Processes admitted on the same tick enter the queue in PID order
+        admitted.sort()
+        for pid in admitted:
+            self._enqueue_arrival(pid)
+
+    def _enqueue_arrival(self, pid: int):
+        """Admit one arrived process into the ready queue."""
+        self._make_ready(self.processes[pid])
+        self._log_event(KernelEvent.ARRIVE, pid)
+
+    def _make_ready(self, proc: PCB):
+        """Put a process in READY and start its wait-time clock."""
+        proc.state = ProcessState.READY
+        proc.ready_since = self.current_time
+        self._touch(proc.pid)
+        self.metrics_collector.process_ready(self.current_time)
+        self.ready_queue.enqueue(proc.pid)
 
     def _handle_preemption(self):
         """Check whether the running process should be preempted."""
@@ -202,22 +587,15 @@ class SimulationEngine:
 
         # Quantum-based preemption (Round Robin / MLFQ)
         if self.policy.uses_quantum:
-            # For MLFQ, get per-process quantum
-            if hasattr(self.policy, 'get_quantum_for_pid'):
-                quantum = self.policy.get_quantum_for_pid(self.running_pid)
-            else:
-                quantum = self.time_quantum
-
-            if proc.quantum_used >= quantum:
+            if proc.quantum_used >= self._current_quantum():
                 # If MLFQ, demote the process
                 if hasattr(self.policy, 'on_quantum_expire'):
                     self.policy.on_quantum_expire(self.running_pid)
-                    self._log_event("demote", pid=self.running_pid)
+                    self._log_event(KernelEvent.DEMOTE, self.running_pid)
 
-                proc.state = ProcessState.READY
                 proc.quantum_used = 0
-                self.ready_queue.enqueue(self.running_pid)
-                self._log_event("preempt", pid=self.running_pid, reason="quantum")
+                self._make_ready(proc)
+                self._log_event(KernelEvent.PREEMPT, self.running_pid, PREEMPT_QUANTUM)
                 self._last_running_pid = self.running_pid
                 self.running_pid = -1
                 return
@@ -226,12 +604,18 @@ class SimulationEngine:
         if self.policy.is_preemptive:
             if self.policy.should_preempt(self.running_pid, self.ready_queue, self.processes):
                 old_pid = self.running_pid
-                proc.state = ProcessState.READY
-                self.ready_queue.enqueue(self.running_pid)
-                self._log_event("preempt", pid=old_pid, reason="policy")
+                self._make_ready(proc)
+                self._log_event(KernelEvent.PREEMPT, old_pid, PREEMPT_POLICY)
                 self._last_running_pid = self.running_pid
                 self.running_pid = -1
 
+    def _current_quantum(self) -> int:
+        """Quantum that applies to the running process."""
+        # For MLFQ, get per-process quantum
+        if hasattr(self.policy, 'get_quantum_for_pid'):
+            return self.policy.get_quantum_for_pid(self.running_pid)
+        return self.time_quantum
+
     def _dispatch_next(self):
         """Select and dispatch the next process from the ready queue."""
         next_pid = self.policy.select_next(self.ready_queue, self.processes)
@@ -241,19 +625,25 @@ class SimulationEngine:
         # Track context switch: prev process ≠ new process
         if self._last_running_pid != -1 and self._last_running_pid != next_pid:
             self.context_switches += 1
-            self._log_event("context_switch", from_pid=self._last_running_pid, to_pid=next_pid)
+            self._log_event(KernelEvent.CONTEXT_SWITCH, self._last_running_pid, next_pid)
 
         self.ready_queue.remove(next_pid)
         self.running_pid = next_pid
 
         proc = self.processes[next_pid]
         proc.state = ProcessState.RUNNING
-        self._log_event("dispatch", pid=next_pid)
+        self._touch(next_pid)
+        ready_since = proc.ready_since
+        proc.wait_time += self.current_time - ready_since
+        proc.ready_since = -1
+        self._log_event(KernelEvent.DISPATCH, next_pid)
 
         # Record first dispatch (response time)
-        if proc.start_time == -1:
+        first = proc.start_time == -1
+        if first:
             proc.start_time = self.current_time
             proc.response_time = self.current_time - proc.arrival_time
+        self.metrics_collector.process_dispatched(ready_since, self.current_time, first, proc.response_time)
 
         # Reset quantum counter when dispatched
         if self.policy.uses_quantum:
@@ -264,36 +654,319 @@ class SimulationEngine:
         if self.running_pid != -1:
             proc = self.processes[self.running_pid]
             proc.execute_tick()
+            self._touch(self.running_pid)
             self._add_gantt(self.running_pid, self.current_time, self.current_time + 1)
 
             # Check if process completed
             if proc.is_complete:
-                proc.state = ProcessState.TERMINATED
-                proc.finish_time = self.current_time + 1
-                proc.turnaround_time = proc.finish_time - proc.arrival_time
-                self._log_event("complete", pid=self.running_pid)
-                self._last_running_pid = self.running_pid
-                self.running_pid = -1
+                self._complete(proc)
         else:
             # CPU idle
             self._add_gantt(-1, self.current_time, self.current_time + 1)
-            self._log_event("idle")
+            self._log_event(KernelEvent.IDLE)
 
-    def _update_waiting_times(self):
-        """Increment wait_time for every process currently in READY state."""
-        for pid in self.ready_queue:
-            self.processes[pid].wait_time += 1
+    def _complete(self, proc: PCB):
+        """Terminate the running process at the end of the current tick."""
+        proc.state = ProcessState.TERMINATED
+        proc.finish_time = self.current_time + 1
+        self._touch(proc.pid)
+        proc.turnaround_time = proc.finish_time - proc.arrival_time
+        self.metrics_collector.process_completed(proc.turnaround_time, proc.wait_time)
+        self._terminated += 1
+        self._log_event(KernelEvent.COMPLETE, self.running_pid)
+        self._last_running_pid = self.running_pid
+        self.running_pid = -1
 
     def _check_completion(self):
         """Check if all processes have terminated."""
-        if self.processes and all(p.state == ProcessState.TERMINATED for p in self.processes):
+        if self.processes and self._terminated == len(self.processes):
             self.is_completed = True
-            self._log_event("simulation_complete")
+            self._log_event(KernelEvent.SIMULATION_COMPLETE)
+
+    # ── Event-driven Fast-forward ──
+
+    def _next_arrival_time(self):
+        """Earliest arrival time among NEW processes, or None."""
+        return self._arrivals[0][0] if self._arrivals else None
+
+    def _fast_forward(self, limit: float) -> int:
+        """
+        Apply the upcoming run of uneventful ticks in one step.
+
+        A tick is uneventful when nothing arrives, no policy timer (such
+        as an MLFQ boost) fires, the running process neither completes nor
+        exhausts its quantum, and the policy cannot preempt it — or when
+        the CPU is idle with an empty ready queue.
+        Such ticks only extend the current Gantt bar and accumulate
+        waiting time, so they can be applied in bulk.
+
+        Returns:
+            Number of ticks skipped (0 if the next tick is an event).
+        """
+        span = min(limit, self._ticks_to_next_event(), self._cpu_span())
+        if span <= 0 or span == math.inf:
+            return 0
+        self._advance_cpu(span)
+        self.metrics_collector.record_span(self, span)
+        self.current_time += span
+        return span
+
+    def _ticks_to_next_event(self) -> float:
+        """Ticks until the next arrival or policy timer (inf if none)."""
+        span = math.inf
+        next_arrival = self._next_arrival_time()
+        if next_arrival is not None:
+            span = next_arrival - self.current_time
+        if hasattr(self.policy, 'next_event_time'):
+            next_event = self.policy.next_event_time(self.current_time)
+            if next_event is not None:
+                span = min(span, next_event - self.current_time)
+        return span
+
+    def _cpu_span(self) -> float:
+        """Upcoming ticks in which the CPU's running process stays put."""
+        if self.running_pid == -1:
+            return 0 if len(self.ready_queue) else math.inf
+        proc = self.processes[self.running_pid]
+        span = proc.remaining_time - 1
+        if self.policy.uses_quantum:
+            span = min(span, self._current_quantum() - proc.quantum_used)
+        if self.policy.is_preemptive:
+            horizon = self.policy.ticks_until_preempt(
+                self.running_pid, self.ready_queue, self.processes
+            )
+            if horizon is not None:
+                span = min(span, horizon)
+        return span
+
+    def _advance_cpu(self, span: int):
+        """Apply `span` uneventful ticks to the CPU."""
+        if self.running_pid != -1:
+            proc = self.processes[self.running_pid]
+            proc.remaining_time -= span
+            proc.quantum_used += span
+            self._touch(self.running_pid)
+        else:
+            self._log_event(KernelEvent.IDLE, arg=span)
+        self._add_gantt(self.running_pid, self.current_time, self.current_time + span)
+
+    # ── Analytic Fast Path ──
+
+    def _is_analytic(self) -> bool:
+        """Whether the policy's schedule can be computed without ticking."""
+        return not self.policy.is_preemptive and not self.policy.uses_quantum
+
+    def _run_analytic(self):
+        """
+        Run a non-preemptive schedule from completion to completion.
+
+        Once dispatched, a process holds the CPU until it finishes, so the
+        only decision points are completions and arrivals into an idle
+        CPU. Arrivals come off the (arrival, pid) heap and the policy's
+        pick off the keyed ready queue, so the whole run is O(n log n).
+        Processes, gantt, context switches and final metrics match the
+        tick loop; no per-tick snapshots are recorded.
+
+        Stops early — leaving the rest to the tick loop — when the next
+        jump would cross the horizon.
+        """
+        while self.processes and not self.is_completed:
+            budget = self._ticks_to_horizon()
+            if budget <= 0:
+                return
+            if self.running_pid != -1:
+                proc = self.processes[self.running_pid]
+                if proc.remaining_time > budget:
+                    return
+                end = self.current_time + proc.remaining_time
+                # Arrivals during the burst join the ready queue on time
+                next_arrival = self._next_arrival_time()
+                while next_arrival is not None and next_arrival < end:
+                    self._run_for(next_arrival - self.current_time)
+                    self._admit_arrivals()
+                    next_arrival = self._next_arrival_time()
+                self._run_for(end - self.current_time)
+                self.current_time -= 1     # Complete within the burst's last tick
+                self._complete(proc)
+                self.current_time += 1
+                self._check_completion()
+                continue
+
+            self._admit_arrivals()
+            if len(self.ready_queue):
+                self._dispatch_next()
+                continue
+
+            # CPU idle until the next arrival
+            next_arrival = self._next_arrival_time()
+            if next_arrival is None or next_arrival - self.current_time > budget:
+                return
+            self._run_for(next_arrival - self.current_time)
+
+    def _run_for(self, span: int):
+        """Advance the CPU and clock by `span` ticks with no decisions."""
+        if span <= 0:
+            return
+        self._advance_cpu(span)
+        self.metrics_collector.record_span(self, span)
+        self.current_time += span
+
+    # ── Checkpoints & Seek ──
+
+    def seek(self, tick: int) -> bool:
+        """
+        Move the simulation to the start of clock value `tick`.
+
+        Restores the latest checkpoint at or before `tick` (unless the
+        engine is already closer) and replays the remaining ticks, so
+        scrubbing costs at most checkpoint_interval ticks. Stops early
+        at completion or the horizon.
+
+        Returns:
+            True if the simulation can continue from here.
+        """
+        target = max(int(tick), 0)
+        checkpoint = self._checkpoint_at_or_before(target)
+        if checkpoint is not None and (target < self.current_time or checkpoint.time > self.current_time):
+            self._restore_checkpoint(checkpoint)
+        elif target < self.current_time:
+            self.reset()
+        while self.current_time < target and self.tick():
+            pass
+        return not self.is_completed
+
+    def _checkpoint_at_or_before(self, time: int) -> Checkpoint | None:
+        i = bisect.bisect_right(self._checkpoint_times, time) - 1
+        return self._checkpoints[i] if i >= 0 else None
+
+    def _truncate_timeline(self, time: int):
+        """Forget checkpoints and stashed output from after clock value `time`."""
+        i = bisect.bisect_right(self._checkpoint_times, time)
+        del self._checkpoints[i:]
+        del self._checkpoint_times[i:]
+        if self._timeline is not None and self._timeline["time"] > time:
+            self._timeline["time"] = time   # Still a valid prefix up to `time`
+
+    def drop_checkpoints(self):
+        """Forget all checkpoints (the timeline they describe has changed)."""
+        self._checkpoints.clear()
+        self._checkpoint_times.clear()
+        self._timeline = None
+        self.checkpoint_interval = CHECKPOINT_INTERVAL
+        self._next_checkpoint = self.current_time
+
+    def _maybe_checkpoint(self):
+        """Take a checkpoint at the start of this tick if one is due."""
+        if self.headless or self.current_time < self._next_checkpoint:
+            return
+        self._next_checkpoint = (self.current_time // self.checkpoint_interval + 1) * self.checkpoint_interval
+        i = bisect.bisect_left(self._checkpoint_times, self.current_time)
+        if i < len(self._checkpoint_times) and self._checkpoint_times[i] == self.current_time:
+            return
+        self._checkpoints.insert(i, self._capture_checkpoint())
+        self._checkpoint_times.insert(i, self.current_time)
+        # Over budget: keep every other checkpoint and space new ones wider
+        if sum(c.nbytes for c in self._checkpoints) > CHECKPOINT_BUDGET and len(self._checkpoints) > 2:
+            del self._checkpoints[1::2]
+            del self._checkpoint_times[1::2]
+            self.checkpoint_interval *= 2
+
+    def _capture_checkpoint(self) -> Checkpoint:
+        pids, fields = capture_processes(self.processes)
+        return Checkpoint(
+            time=self.current_time,
+            scalars={
+                "context_switches": self.context_switches,
+                "is_completed": self.is_completed,
+                "is_truncated": self.is_truncated,
+                "terminated": self._terminated,
+            },
+            pids=pids,
+            fields=fields,
+            new_pids=np.array([pid for _, pid in self._arrivals], dtype=np.int64),
+            n_processes=len(self.processes),
+            cpus=self._capture_cpus(),
+            policy=self.policy.checkpoint_state() if hasattr(self.policy, 'checkpoint_state') else None,
+            collector=self.metrics_collector.checkpoint(),
+            gantt_len=len(self.gantt),
+            gantt_open=[(i, self.gantt[i]["endTime"]) for i in self._open_gantt_entries()],
+            log_count=self.kernel_log.total,
+            log_tail=self.kernel_log.rows(self.kernel_log.total - KERNEL_LOG_TAIL),
+        )
+
+    def _restore_checkpoint(self, checkpoint: Checkpoint):
+        self.rewinds += 1
+        self._bump_version()
+        self._stash_timeline()
+        timeline = self._timeline
+        self.current_time = checkpoint.time
+        self.context_switches = checkpoint.scalars["context_switches"]
+        self.is_completed = checkpoint.scalars["is_completed"]
+        self.is_truncated = checkpoint.scalars["is_truncated"]
+        self._terminated = checkpoint.scalars["terminated"]
+
+        # Processes and policy first: ready-queue keys and levels read them.
+        # Processes added since the checkpoint start out NEW as well.
+        new_pids = checkpoint.new_pids.tolist() + list(range(checkpoint.n_processes, len(self.processes)))
+        restore_processes(self.processes, checkpoint.pids, checkpoint.fields, new_pids)
+        self._touch_all()
+        if isinstance(self.processes, ProcessTable):
+            arrivals = self.processes.column("arrival_time")[new_pids].tolist()
+        else:
+            arrivals = [self.processes[pid].arrival_time for pid in new_pids]
+        self._arrivals = list(zip(arrivals, new_pids))
+        heapq.heapify(self._arrivals)
+        if hasattr(self.policy, 'restore_state'):
+            self.policy.restore_state(checkpoint.policy)
+        self._restore_cpus(checkpoint.cpus)
+        self.metrics_collector.restore(checkpoint.collector, timeline["snapshots"], timeline["stride"])
+
+        # Append-only output is a prefix of the furthest timeline; bars
+        # that were still open at checkpoint time are copied and trimmed
+        self.gantt = timeline["gantt"][:checkpoint.gantt_len]
+        for i, end in checkpoint.gantt_open:
+            self.gantt[i] = dict(self.gantt[i], endTime=end)
+
+        # Events up to the checkpoint; the saved tail if they rotated out
+        self.kernel_log.restore(timeline["log"], checkpoint.log_count, checkpoint.log_tail)
+        self._next_checkpoint = checkpoint.time
+
+    def _stash_timeline(self):
+        """Remember the gantt, kernel log and history if they reach furthest so far."""
+        if self._timeline is not None and self.current_time < self._timeline["time"]:
+            return
+        self._timeline = {
+            "time": self.current_time,
+            "gantt": list(self.gantt),
+            "log": self.kernel_log.save(),
+            "snapshots": self.metrics_collector.history,   # Replaced, not mutated, by reset/restore
+            "stride": self.metrics_collector.snapshot_stride,
+        }
+
+    def _capture_cpus(self):
+        """Ready queue contents (FIFO order) and CPU state."""
+        return self.ready_queue.as_list(), self.running_pid, self._last_running_pid
+
+    def _restore_cpus(self, saved):
+        queue, self.running_pid, self._last_running_pid = saved
+        self.ready_queue.clear()
+        for pid in queue:
+            self.ready_queue.enqueue(pid)
+
+    def _open_gantt_entries(self) -> list[int]:
+        """Indices of gantt bars that later ticks may still extend."""
+        return [len(self.gantt) - 1] if self.gantt else []
+
+    def _log_tail(self) -> list[dict]:
+        """The most recent kernel events, oldest first."""
+        return self.kernel_log.tail(KERNEL_LOG_TAIL)
 
     # ── Gantt Chart ──
 
     def _add_gantt(self, pid: int, start: int, end: int):
         """Add or extend a Gantt chart entry."""
+        if self.headless:
+            return
         if self.gantt:
             last = self.gantt[-1]
             if last["pid"] == pid and last["endTime"] == start:
@@ -303,20 +976,33 @@ class SimulationEngine:
 
     # ── State Serialization ──
 
-    def get_state(self) -> dict:
-        """Return full simulation state for API responses."""
+    def get_state(self, max_points: int | None = None) -> dict:
+        """
+        Return full simulation state for API responses.
+
+        Args:
+            max_points: Downsample metricsHistory to at most this many
+                        snapshots (see MetricsHistory.downsample).
+        """
+        state = self._summary_state()
+        state["processes"] = self._process_dicts()
+        state["gantt"] = list(self.gantt)
+        state["metricsHistory"] = self.metrics_collector.snapshots(max_points)
+        state["kernelLog"] = self._log_tail()
+        return state
+
+    def _summary_state(self) -> dict:
+        """get_state() minus the keys that grow with the run (see StateDeltas)."""
         state = {
             "currentTime": self.current_time,
             "runningPid": self.running_pid,
             "isCompleted": self.is_completed,
+            "isTruncated": self.is_truncated,
+            "horizon": self.horizon,
             "algorithm": self.policy.name,
             "timeQuantum": self.time_quantum,
             "contextSwitches": self.context_switches,
-            "processes": [p.to_dict() for p in self.processes],
-            "gantt": list(self.gantt),
             "readyQueue": self.ready_queue.as_list(),
-            "metricsHistory": self.metrics_collector.tick_snapshots,
-            "kernelLog": self.kernel_log[-50:],  # Last 50 events
             "metrics": (
                 self.metrics_collector.get_final_metrics(self)
                 if self.is_completed
@@ -330,6 +1016,30 @@ class SimulationEngine:
 
         return state
 
+    def _process_dicts(self, pids: list[int] | None = None) -> list[dict]:
+        """Serialize every PCB, or those in `pids` (column-wise when using a ProcessTable)."""
+        if isinstance(self.processes, ProcessTable):
+            return self.processes.to_dicts(self.current_time, pids)
+        if pids is None:
+            return [p.to_dict(self.current_time) for p in self.processes]
+        return [self.processes[pid].to_dict(self.current_time) for pid in pids]
+
     def get_final_metrics(self) -> dict:
         """Convenience: get final summary metrics."""
         return self.metrics_collector.get_final_metrics(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the simulation (processes, output, checkpoints)."""
+        if isinstance(self.processes, ProcessTable):
+            processes = self.processes.nbytes
+        else:
+            processes = len(self.processes) * PCB_BYTES
+        return (
+            processes
+            + len(self.gantt) * GANTT_ENTRY_BYTES
+            + self.kernel_log.nbytes
+            + self.metrics_collector.history.nbytes
+            + sum(c.nbytes for c in self._checkpoints)
+            + self._pcb_changed.nbytes
+        )
@@ -0,0 +1,240 @@
+"""
+Kernel event log — a fixed-capacity ring buffer of integer-coded events.
+
+Every event is one 23-byte row (tick, code, pid, two arguments, core)
+in a NumPy structured array, instead of a dict per event. Only the
+most recent `capacity` events are kept in memory; get_state() renders
+the tail back into the familiar dicts:
+
+    {"tick": 12, "event": "preempt", "pid": 3, "reason": "quantum"}
+
+Event types can be switched off individually with an enable mask.
+Events are staged as tuples and packed into the ring FLUSH_EVERY at a
+time, which keeps append() about as cheap as the old deque of dicts.
+
+With a spill path, each packed chunk is also written to an append log
+on disk (raw rows, addressed by absolute event number), so history()
+can return the full run without keeping it in RAM.
+"""
+
+from enum import IntEnum
+
+import numpy as np
+
+
+class KernelEvent(IntEnum):
+    """Kernel event codes (names match the rendered "event" strings)."""
+    ARRIVE = 0
+    DISPATCH = 1
+    PREEMPT = 2
+    DEMOTE = 3
+    CONTEXT_SWITCH = 4
+    IDLE = 5
+    COMPLETE = 6
+    SIMULATION_COMPLETE = 7
+    BOOST = 8
+    HORIZON_REACHED = 9
+    MIGRATE = 10
+
+
+PREEMPT_REASONS = ("quantum", "policy")   # PREEMPT arg → "reason"
+PREEMPT_QUANTUM, PREEMPT_POLICY = 0, 1
+
+ALL_EVENTS = (1 << len(KernelEvent)) - 1
+
+EVENT_DTYPE = np.dtype([
+    ("tick", np.int64),
+    ("code", np.int8),
+    ("pid", np.int32),
+    ("arg", np.int32),
+    ("arg2", np.int32),
+    ("core", np.int16),
+])
+
+# Code → (rendered key, row column) pairs, in output order
+_FIELDS = {
+    KernelEvent.ARRIVE: (("pid", "pid"),),
+    KernelEvent.DISPATCH: (("pid", "pid"),),
+    KernelEvent.PREEMPT: (("pid", "pid"), ("reason", "arg")),
+    KernelEvent.DEMOTE: (("pid", "pid"),),
+    KernelEvent.CONTEXT_SWITCH: (("from_pid", "pid"), ("to_pid", "arg")),
+    KernelEvent.IDLE: (("ticks", "arg"),),          # Omitted for single ticks (arg 0)
+    KernelEvent.COMPLETE: (("pid", "pid"),),
+    KernelEvent.SIMULATION_COMPLETE: (),
+    KernelEvent.BOOST: (),
+    KernelEvent.HORIZON_REACHED: (),
+    KernelEvent.MIGRATE: (("pid", "pid"), ("from_core", "arg"), ("to_core", "arg2")),
+}
+_NAMES = [event.name.lower() for event in KernelEvent]
+
+
+def event_mask(events) -> int:
+    """Enable mask for an iterable of KernelEvent codes or event names."""
+    mask = 0
+    for event in events:
+        if isinstance(event, str):
+            event = KernelEvent[event.upper()]
+        mask |= 1 << int(event)
+    return mask
+
+
+class KernelLog:
+    """Ring buffer of the most recent kernel events."""
+
+    FLUSH_EVERY = 256   # Events staged as tuples before being packed into the ring
+
+    def __init__(self, capacity: int, mask: int = ALL_EVENTS, spill_path: str | None = None,
+                 with_core: bool = False):
+        """
+        Args:
+            capacity:   Events kept in memory.
+            mask:       Bit i set = KernelEvent i is recorded (see event_mask).
+            spill_path: File that receives every event (the full history).
+            with_core:  Render the "core" field (multi-core engines).
+        """
+        self.capacity: int = max(int(capacity), 1)
+        self.mask: int = mask
+        self.with_core: bool = with_core
+        self._rows = np.zeros(self.capacity, dtype=EVENT_DTYPE)
+        self._pending: list[tuple] = []   # Recorded but not yet packed
+        self._flushed: int = 0            # Events packed since clear() (absolute count)
+        self._start: int = 0              # Absolute number of the oldest event in the ring
+        self._chunk: int = min(self.FLUSH_EVERY, self.capacity)
+        self._spill = open(spill_path, "w+b") if spill_path else None
+
+    # ── Recording ──
+
+    def append(self, tick: int, code: int, pid: int = -1, arg: int = 0, arg2: int = 0,
+               core: int = -1):
+        """Record one event (ignored if its type is masked off)."""
+        if not self.mask >> code & 1:
+            return
+        self._pending.append((tick, code, pid, arg, arg2, core))
+        if len(self._pending) >= self._chunk:
+            self._flush()
+
+    def _flush(self):
+        """Pack staged events into the ring (and append them to the spill file)."""
+        if not self._pending:
+            return
+        rows = np.array(self._pending, dtype=EVENT_DTYPE)
+        self._pending.clear()
+        first, end = self._flushed, self._flushed + len(rows)
+        if self._spill is not None:
+            self._spill.seek(first * EVENT_DTYPE.itemsize)
+            self._spill.write(rows.tobytes())
+        rows = rows[-self.capacity:]
+        self._rows[np.arange(end - len(rows), end) % self.capacity] = rows
+        self._flushed = end
+        self._start = max(self._start, end - self.capacity)
+
+    @property
+    def total(self) -> int:
+        """Events recorded since clear(); the absolute number of the next one."""
+        return self._flushed + len(self._pending)
+
+    def clear(self):
+        """
+        Drop every event. The spill file is not truncated: rows past
+        `total` are never read, and a replayed run overwrites them in place
+        (a save() from before the clear stays valid for restore()).
+        """
+        self._pending.clear()
+        self._flushed = self._start = 0
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def __len__(self) -> int:
+        return self.total - self._start
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the ring and the staged events (approximate)."""
+        return self._rows.nbytes + len(self._pending) * 100
+
+    # ── Reading ──
+
+    def rows(self, start: int = 0) -> np.ndarray:
+        """In-memory events numbered `start` onwards, oldest first, as raw rows."""
+        self._flush()
+        start = max(start, self._start)
+        if start >= self._flushed:
+            return self._rows[:0].copy()
+        lo, hi = start % self.capacity, self._flushed % self.capacity
+        if lo < hi:
+            return self._rows[lo:hi].copy()
+        return np.concatenate((self._rows[lo:], self._rows[:hi]))
+
+    def tail(self, n: int) -> list[dict]:
+        """The `n` most recent events, oldest first, as dicts."""
+        return self.render(self.rows(self.total - n))
+
+    def history(self) -> list[dict]:
+        """Every recorded event if spilling, else those still in memory."""
+        return self.render(self.history_rows())
+
+    def history_rows(self) -> np.ndarray:
+        rows = self.rows()
+        if self._spill is None or not self._start:
+            return rows
+        return np.concatenate((self._read_spill(0, self._start), rows))
+
+    def _read_spill(self, start: int, end: int) -> np.ndarray:
+        self._spill.flush()
+        self._spill.seek(start * EVENT_DTYPE.itemsize)
+        return np.fromfile(self._spill, dtype=EVENT_DTYPE, count=end - start)
+
+    def render(self, rows: np.ndarray) -> list[dict]:
+        """Convert raw rows to event dicts."""
+        entries = []
+        for tick, code, pid, arg, arg2, core in rows.tolist():
+            entry = {"tick": tick, "event": _NAMES[code]}
+            row = {"pid": pid, "arg": arg, "arg2": arg2}
+            for key, column in _FIELDS[code]:
+                value = row[column]
+                if code == KernelEvent.PREEMPT and key == "reason":
+                    value = PREEMPT_REASONS[value]
+                elif code == KernelEvent.IDLE and not value:
+                    continue
+                entry[key] = value
+            if self.with_core:
+                entry["core"] = core
+            entries.append(entry)
+        return entries
+
+    def __iter__(self):
+        return iter(self.render(self.rows()))
+
+    # ── Rollback (engine checkpoints) ──
+
+    def save(self) -> tuple:
+        """Copy of the in-memory state, for restore()."""
+        self._flush()
+        return self._rows.copy(), self._flushed, self._start
+
+    def restore(self, saved: tuple, count: int, tail: np.ndarray):
+        """
+        Return to the point where `count` events had been recorded.
+
+        Args:
+            saved: A save() taken at or after that point in the same run.
+            tail:  The rows most recently recorded before that point, used
+                   if fewer of the events themselves are still in memory.
+        """
+        rows, flushed, start = saved
+        self._pending.clear()
+        self._rows[:] = rows
+        self._flushed, self._start = flushed, start
+        if start + len(tail) <= count <= flushed:
+            self._flushed = count
+            return
+        # Rebuild the ring from the spill file, or at least from the saved tail
+        if self._spill is not None:
+            tail = self._read_spill(max(count - self.capacity, 0), count)
+        tail = tail[-self.capacity:]
+        self._flushed = count
+        self._start = count - len(tail)
+        self._rows[np.arange(self._start, count) % self.capacity] = tail
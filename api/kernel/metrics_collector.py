@@ -4,31 +4,176 @@ Per-tick metrics collector.
 Records a snapshot of system metrics at every clock tick for
 real-time time-series visualization on the frontend.
 All metrics are computed incrementally — no post-hoc recomputation.
+
+A collector built with snapshots=False (headless engines) keeps only
+the busy-tick accumulators; final metrics are computed from the
+processes themselves, so they are unaffected.
+
+History is stored column-wise in a MetricsHistory (one NumPy array per
+metric); `tick_snapshots` renders it as the familiar list of dicts.
+It is bounded: once max_snapshots entries are stored, every other
+snapshot is dropped and the recording stride doubles, so arbitrarily
+long runs keep an evenly spaced history in constant memory.
+
+For multi-core engines (anything exposing `cores`), utilization is
+busy core-ticks over total core-ticks, and snapshots additionally carry
+per-core running PIDs and utilization.
+
+Per-tick snapshots read running counts and sums that the engine keeps
+up to date on process state transitions (process_ready,
+process_dispatched, process_completed), so record_tick() is O(1).
+Final metrics go through _summarize(), which uses vectorized
+reductions when the engine stores processes in a ProcessTable.
+
+Tail latencies (p95/p99 of wait, turnaround and response time) in
+per-tick snapshots come from streaming P² estimators fed on the same
+transitions — wait and turnaround when a process completes, response
+on its first dispatch — plus a power-of-two histogram of response
+times (see quantiles.py). P² assumes a roughly stationary stream; when
+latencies trend, as under starvation, its estimate can be off by tens
+of percent, so final metrics use exact nearest-rank percentiles taken
+in the same pass as the other sums.
 """
 
+import numpy as np
+
 from .process import ProcessState
+from .metrics_history import MetricsHistory
+from .quantiles import P2Quantile, LogHistogram
+
+
+MAX_SNAPSHOTS = 100_000
+TAIL_QUANTILES = (95, 99)                        # Percentiles tracked per latency
+LATENCIES = ("Wait", "Turnaround", "Response")   # As in "p95WaitTime"
+
+
+def _summarize(processes, now: int) -> dict:
+    """
+    Counts, sums and completed latencies over all processes, with waits
+    measured at `now`.
+
+    A ProcessTable computes these with vectorized reductions; a plain
+    list of PCBs falls back to Python sums.
+    """
+    if hasattr(processes, "summary"):
+        return processes.summary(now)
+    completed = [p for p in processes if p.state == ProcessState.TERMINATED]
+    started = [p for p in processes if p.start_time != -1]
+    return {
+        "n": len(processes),
+        "completed": len(completed),
+        "started": len(started),
+        "total_wait": sum(p.wait_time_at(now) for p in processes),
+        "total_tat": sum(p.turnaround_time for p in completed),
+        "total_response": sum(p.response_time for p in started),
+        "total_burst": sum(p.burst_time for p in processes),
+        "max_finish": max((p.finish_time for p in completed), default=0),
+        "min_arrival": min((p.arrival_time for p in processes), default=0),
+        "latencies": {
+            "Wait": [p.wait_time for p in completed],
+            "Turnaround": [p.turnaround_time for p in completed],
+            "Response": [p.response_time for p in started],
+        },
+    }
+
+
+def _exact_tails(latencies: dict) -> dict:
+    """Nearest-rank percentiles of each latency, keyed like tail_metrics()."""
+    tails = {}
+    for name in LATENCIES:
+        values = np.asarray(latencies[name], dtype=np.int64)
+        for pct in TAIL_QUANTILES:
+            rank = -(-pct * len(values) // 100) - 1
+            tails[f"p{pct}{name}Time"] = int(np.partition(values, rank)[rank]) if len(values) else 0
+    return tails
 
 
 class MetricsCollector:
     """Captures and stores per-tick metric snapshots."""
 
-    def __init__(self):
-        self.tick_snapshots: list[dict] = []
-        self.busy_ticks: int = 0
+    def __init__(self, max_snapshots: int = MAX_SNAPSHOTS, snapshots: bool = True):
+        self.record_snapshots: bool = snapshots
+        self.history = MetricsHistory()
+        self.latest_snapshot: dict = {}
+        self.busy_ticks: int = 0         # Busy core-ticks (== busy ticks on one core)
+        self.core_busy_ticks: list[int] = []
         self.total_completed: int = 0
+        self.max_snapshots = max(max_snapshots, 2)
+        self.snapshot_stride: int = 1   # Keep every Nth recorded snapshot
+        self._recorded: int = 0
+        self._reset_sums()
+
+    def _reset_sums(self):
+        # Running sums over the engine's processes (total_completed counts TERMINATED)
+        self.total_started: int = 0
+        self.total_wait: int = 0          # Settled wait time (READY stints already ended)
+        self.total_tat: int = 0
+        self.total_response: int = 0
+        self.ready_count: int = 0         # Processes currently READY ...
+        self.ready_since_sum: int = 0     # ... and the sum of their ready_since
+        self.tails = {
+            name: [P2Quantile(pct / 100) for pct in TAIL_QUANTILES] for name in LATENCIES
+        }
+        self.response_histogram = LogHistogram()
+
+    # ── Process Transitions (called by the engine) ──
+
+    def process_ready(self, now: int):
+        """A process entered READY at clock value `now`."""
+        self.ready_count += 1
+        self.ready_since_sum += now
+
+    def process_dispatched(self, ready_since: int, now: int, first: bool, response: int):
+        """A READY process was dispatched; `first` marks its first run."""
+        self.ready_count -= 1
+        self.ready_since_sum -= ready_since
+        self.total_wait += now - ready_since
+        if first:
+            self.total_started += 1
+            self.total_response += response
+            for estimator in self.tails["Response"]:
+                estimator.add(response)
+            self.response_histogram.add(response)
+
+    def process_completed(self, turnaround: int, wait: int):
+        """A process terminated after `wait` ticks in READY in total."""
+        self.total_completed += 1
+        self.total_tat += turnaround
+        for estimator in self.tails["Turnaround"]:
+            estimator.add(turnaround)
+        for estimator in self.tails["Wait"]:
+            estimator.add(wait)
+
+    def core_completed(self, core: int, n_cores: int):
+        """A process finished on `core`; its last tick kept that core busy."""
+        self._size_cores(n_cores)
+        self.core_busy_ticks[core] += 1
+
+    def tail_metrics(self) -> dict:
+        """Current p95/p99 estimates, e.g. {"p95WaitTime": 4.0, ...}."""
+        return {
+            f"p{pct}{name}Time": round(estimator.value, 2)
+            for name in LATENCIES
+            for pct, estimator in zip(TAIL_QUANTILES, self.tails[name])
+        }
 
     def reset(self):
         """Clear all recorded data."""
-        self.tick_snapshots.clear()
+        self.history = MetricsHistory()    # Fresh object: engines may still hold the old one
+        self.latest_snapshot = {}
         self.busy_ticks = 0
+        self.core_busy_ticks = []
         self.total_completed = 0
+        self.snapshot_stride = 1
+        self._recorded = 0
+        self._reset_sums()
 
     def record_tick(self, engine):
         """
         Record one tick snapshot from the simulation engine.
 
         Called at the end of each tick() in the engine. Computes all
-        metrics incrementally:
+        metrics in O(1) from the running sums:
 
         • CPU Utilization  = busy_ticks / total_ticks × 100
         • Throughput       = completed_count / total_ticks
@@ -38,79 +183,189 @@ class MetricsCollector:
         • Context Switches  = running count from engine
         • Ready Queue Len   = len(ready_queue)
         """
-        is_busy = engine.running_pid != -1
-        if is_busy:
-            self.busy_ticks += 1
+        if not self.record_snapshots:
+            self.record_span(engine, 1)
+            return
+        cores = getattr(engine, "cores", None)
+        if cores is None:
+            if engine.running_pid != -1:
+                self.busy_ticks += 1
+            ready_len = len(engine.ready_queue)
+        else:
+            self._record_cores(cores, 1)
+            ready_len = sum(len(core.ready_queue) for core in cores)
+        n_cores = len(cores) if cores else 1
 
         total_ticks = engine.current_time + 1  # current_time is 0-indexed
-        processes = engine.processes
-
-        # Count completed processes
-        completed = [p for p in processes if p.state == ProcessState.TERMINATED]
-        self.total_completed = len(completed)
 
-        # Count started processes (have been dispatched at least once)
-        started = [p for p in processes if p.start_time != -1]
-
-        n = len(processes) if processes else 1
+        # Waits are settled lazily; count this tick for processes still READY
+        n = len(engine.processes)
+        total_wait = self.total_wait + self.ready_count * total_ticks - self.ready_since_sum
 
         # Incremental averages
-        avg_wait = round(sum(p.wait_time for p in processes) / n, 2) if processes else 0
+        avg_wait = round(total_wait / n, 2) if n else 0
         avg_tat = (
-            round(sum(p.turnaround_time for p in completed) / len(completed), 2)
-            if completed
+            round(self.total_tat / self.total_completed, 2)
+            if self.total_completed
             else 0
         )
         avg_resp = (
-            round(sum(p.response_time for p in started) / len(started), 2)
-            if started
+            round(self.total_response / self.total_started, 2)
+            if self.total_started
             else 0
         )
 
         snapshot = {
             "tick": engine.current_time,
             "runningPid": engine.running_pid,
-            "readyQueueLength": len(engine.ready_queue),
-            "cpuUtilization": round(self.busy_ticks / max(total_ticks, 1) * 100, 2),
+            "readyQueueLength": ready_len,
+            "cpuUtilization": round(self.busy_ticks / max(total_ticks * n_cores, 1) * 100, 2),
             "throughput": round(self.total_completed / max(total_ticks, 1), 4),
             "contextSwitches": engine.context_switches,
             "avgWaitTime": avg_wait,
             "avgTurnaroundTime": avg_tat,
             "avgResponseTime": avg_resp,
+            **self.tail_metrics(),
         }
-        self.tick_snapshots.append(snapshot)
+        if cores is not None:
+            snapshot["runningPids"] = [core.running_pid for core in cores]
+            snapshot["coreUtilization"] = [
+                round(busy / max(total_ticks, 1) * 100, 2) for busy in self.core_busy_ticks
+            ]
+            snapshot["migrations"] = engine.migrations
+        self._store(snapshot)
+
+    def _record_cores(self, cores, ticks: int):
+        """Add `ticks` busy ticks to every core that is running a process."""
+        self._size_cores(len(cores))
+        for i, core in enumerate(cores):
+            if core.running_pid != -1:
+                self.core_busy_ticks[i] += ticks
+                self.busy_ticks += ticks
+
+    def _size_cores(self, n_cores: int):
+        if len(self.core_busy_ticks) != n_cores:
+            self.core_busy_ticks = [0] * n_cores
+
+    def _store(self, snapshot: dict):
+        """Append a snapshot to the history, decimating when full."""
+        self.latest_snapshot = snapshot
+        recorded = self._recorded
+        self._recorded += 1
+        if recorded % self.snapshot_stride:
+            return
+        if len(self.history) >= self.max_snapshots:
+            self.history.decimate()
+            self.snapshot_stride *= 2
+            if recorded % self.snapshot_stride:
+                return
+        self.history.append(snapshot)
+
+    @property
+    def tick_snapshots(self) -> list[dict]:
+        """The recorded history as a list of snapshot dicts (built on each access)."""
+        return self.history.to_dicts()
+
+    def snapshots(self, max_points: int | None = None) -> list[dict]:
+        """tick_snapshots, downsampled to at most `max_points` (None = all)."""
+        if max_points is None:
+            return self.history.to_dicts()
+        return self.history.downsample(max_points).to_dicts()
+
+    def record_span(self, engine, ticks: int):
+        """
+        Account for ticks the engine fast-forwarded over.
+
+        No snapshots are recorded for skipped ticks; only the
+        accumulators that feed later snapshots are advanced.
+        """
+        cores = getattr(engine, "cores", None)
+        if cores is not None:
+            self._record_cores(cores, ticks)
+        elif engine.running_pid != -1:
+            self.busy_ticks += ticks
+
+    def checkpoint(self) -> dict:
+        """Accumulators and history length, for engine checkpoints."""
+        return {
+            "busy_ticks": self.busy_ticks,
+            "core_busy_ticks": list(self.core_busy_ticks),
+            "total_completed": self.total_completed,
+            "sums": (self.total_started, self.total_wait, self.total_tat, self.total_response,
+                     self.ready_count, self.ready_since_sum),
+            "tails": {name: [e.copy() for e in estimators] for name, estimators in self.tails.items()},
+            "response_histogram": self.response_histogram.copy(),
+            "latest_snapshot": self.latest_snapshot,
+            "n_snapshots": len(self.history),
+            "snapshot_stride": self.snapshot_stride,
+            "recorded": self._recorded,
+        }
+
+    def restore(self, saved: dict, history: MetricsHistory, stride: int):
+        """
+        Return to a checkpoint() of the same run.
+
+        Args:
+            saved:   The checkpoint() dict.
+            history: Snapshot history of a point at or after the checkpoint.
+            stride:  That history's snapshot_stride. If it was decimated
+                     after the checkpoint, the coarser stride is kept.
+        """
+        self.busy_ticks = saved["busy_ticks"]
+        self.core_busy_ticks = list(saved["core_busy_ticks"])
+        self.total_completed = saved["total_completed"]
+        (self.total_started, self.total_wait, self.total_tat, self.total_response,
+         self.ready_count, self.ready_since_sum) = saved["sums"]
+        self.tails = {name: [e.copy() for e in estimators] for name, estimators in saved["tails"].items()}
+        self.response_histogram = saved["response_histogram"].copy()
+        self.latest_snapshot = saved["latest_snapshot"]
+        self._recorded = saved["recorded"]
+        if stride == saved["snapshot_stride"]:
+            self.history = history.head(saved["n_snapshots"])
+        else:
+            self.history = history.head_until(saved["latest_snapshot"].get("tick", -1))
+        self.snapshot_stride = stride
 
     def get_final_metrics(self, engine) -> dict:
         """Compute final summary metrics after simulation completes."""
-        processes = engine.processes
-        if not processes:
+        if not engine.processes:
             return self._empty_metrics()
 
-        n = len(processes)
-        completed = [p for p in processes if p.state == ProcessState.TERMINATED]
-        started = [p for p in processes if p.start_time != -1]
+        summary = _summarize(engine.processes, engine.current_time)
+        n = summary["n"]
+        completed = summary["completed"]
+        started = summary["started"]
 
-        total_burst = sum(p.burst_time for p in processes)
-        max_finish = max((p.finish_time for p in completed), default=0)
-        min_arrival = min(p.arrival_time for p in processes)
+        total_burst = summary["total_burst"]
+        max_finish = summary["max_finish"]
+        min_arrival = summary["min_arrival"]
         total_time = max_finish - min_arrival if max_finish > min_arrival else 1
+        n_cores = getattr(engine, "num_cores", 1)
 
-        return {
-            "avgWaitTime": round(sum(p.wait_time for p in processes) / n, 2),
+        metrics = {
+            "avgWaitTime": round(summary["total_wait"] / n, 2),
             "avgTurnaroundTime": (
-                round(sum(p.turnaround_time for p in completed) / len(completed), 2)
+                round(summary["total_tat"] / completed, 2)
                 if completed else 0
             ),
             "avgResponseTime": (
-                round(sum(p.response_time for p in started) / len(started), 2)
+                round(summary["total_response"] / started, 2)
                 if started else 0
             ),
-            "cpuUtilization": round(total_burst / total_time * 100, 2),
-            "throughput": round(len(completed) / total_time, 4),
+            **_exact_tails(summary["latencies"]),
+            "cpuUtilization": round(total_burst / (total_time * n_cores) * 100, 2),
+            "throughput": round(completed / total_time, 4),
             "contextSwitches": engine.context_switches,
-            "totalIdleTime": total_time - total_burst,
+            "totalIdleTime": total_time * n_cores - total_burst,
             "totalExecutionTime": total_time,
+            "responseTimeHistogram": self.response_histogram.to_dict(),
         }
+        if hasattr(engine, "cores"):
+            metrics["migrations"] = engine.migrations
+            metrics["coreUtilization"] = [
+                round(busy / total_time * 100, 2) for busy in self.core_busy_ticks
+            ]
+        return metrics
 
     @staticmethod
     def _empty_metrics() -> dict:
@@ -118,9 +373,11 @@ class MetricsCollector:
             "avgWaitTime": 0,
             "avgTurnaroundTime": 0,
             "avgResponseTime": 0,
+            **{f"p{pct}{name}Time": 0 for name in LATENCIES for pct in TAIL_QUANTILES},
             "cpuUtilization": 0,
             "throughput": 0,
             "contextSwitches": 0,
             "totalIdleTime": 0,
             "totalExecutionTime": 0,
+            "responseTimeHistogram": {"bounds": [], "counts": []},
         }
@@ -38,7 +38,8 @@ class PCB:
     state: ProcessState = field(default=ProcessState.NEW)
     start_time: int = -1          # First time CPU was allocated
     finish_time: int = -1
-    wait_time: int = 0            # Cumulative time spent in READY state
+    wait_time: int = 0            # Time spent in READY, settled on dispatch
+    ready_since: int = -1         # Clock value when the process last entered READY
     response_time: int = -1       # start_time - arrival_time
     turnaround_time: int = 0      # finish_time - arrival_time
 
@@ -46,6 +47,10 @@ class PCB:
     quantum_used: int = 0         # Ticks consumed in current quantum slice
     mlfq_queue_level: int = 0     # Which MLFQ sub-queue this process is in
 
+    # ── SMP extras ──
+    core_id: int = -1             # Core whose run queue / CPU holds this process
+    migrations: int = 0           # Times moved between core run queues
+
     def __post_init__(self):
         if self.remaining_time == -1:
             self.remaining_time = self.burst_time
@@ -61,8 +66,19 @@ class PCB:
         self.remaining_time -= 1
         self.quantum_used += 1
 
-    def to_dict(self) -> dict:
-        """Serialize for JSON API responses."""
+    def wait_time_at(self, now: int) -> int:
+        """Cumulative wait time as of clock value `now`, including the open READY stint."""
+        if self.ready_since == -1:
+            return self.wait_time
+        return self.wait_time + now - self.ready_since
+
+    def to_dict(self, now: int | None = None) -> dict:
+        """
+        Serialize for JSON API responses.
+
+        Pass the engine clock as `now` so a process that is still READY
+        reports the wait time accrued so far.
+        """
         return {
             "pid": self.pid,
             "arrivalTime": self.arrival_time,
@@ -73,7 +89,7 @@ class PCB:
             "stateName": self.state.name,
             "startTime": self.start_time,
             "finishTime": self.finish_time,
-            "waitTime": self.wait_time,
+            "waitTime": self.wait_time if now is None else self.wait_time_at(now),
             "responseTime": self.response_time,
             "turnaroundTime": self.turnaround_time,
             "quantumUsed": self.quantum_used,
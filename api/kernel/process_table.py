@@ -0,0 +1,255 @@
+"""
+Struct-of-arrays process table backed by NumPy columns.
+
+An alternative to a list of PCB dataclasses for very large workloads:
+every PCB field is one typed NumPy column indexed by PID, so a process
+costs ~70 bytes instead of a full Python object, and aggregates
+(sums, counts, min/max) are single vectorized reductions.
+
+The table quacks like the engine's list of PCBs — len(), indexing,
+iteration and append(PCB) all work — but indexing returns a PCBView,
+a two-slot proxy created on demand that reads and writes the columns.
+JSON output goes through to_dicts(), which converts whole columns at
+once instead of materializing a view per process.
+"""
+
+import numpy as np
+
+from .process import PCB, ProcessState
+
+
+class ProcessTable:
+    """Columnar (NumPy) storage for PCBs, indexed by PID."""
+
+    # Column name → dtype. Times are int64 so long horizons cannot overflow.
+    COLUMNS = {
+        "arrival_time": np.int64,
+        "burst_time": np.int64,
+        "priority": np.int32,
+        "remaining_time": np.int64,
+        "state": np.int8,
+        "start_time": np.int64,
+        "finish_time": np.int64,
+        "wait_time": np.int64,
+        "ready_since": np.int64,
+        "response_time": np.int64,
+        "turnaround_time": np.int64,
+        "quantum_used": np.int64,
+        "mlfq_queue_level": np.int16,
+        "core_id": np.int32,
+        "migrations": np.int32,
+    }
+
+    # Initial values for the dynamic columns (see PCB and SimulationEngine.reset)
+    DYNAMIC_DEFAULTS = {
+        "state": int(ProcessState.NEW),
+        "start_time": -1,
+        "finish_time": -1,
+        "wait_time": 0,
+        "ready_since": -1,
+        "response_time": -1,
+        "turnaround_time": 0,
+        "quantum_used": 0,
+        "mlfq_queue_level": 0,
+        "core_id": -1,
+        "migrations": 0,
+    }
+
+    def __init__(self, capacity: int = 1024):
+        self._n: int = 0
+        self._capacity: int = max(int(capacity), 1)
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(self._capacity, dtype=dtype))
+
+    # ── Sizing ──
+
+    def _reserve(self, capacity: int):
+        """Grow every column (by doubling) to hold at least `capacity` rows."""
+        if capacity <= self._capacity:
+            return
+        new_capacity = max(capacity, self._capacity * 2)
+        for name, dtype in self.COLUMNS.items():
+            column = np.zeros(new_capacity, dtype=dtype)
+            column[:self._n] = getattr(self, name)[:self._n]
+            setattr(self, name, column)
+        self._capacity = new_capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the columns."""
+        return sum(getattr(self, name).nbytes for name in self.COLUMNS)
+
+    # ── List-like interface ──
+
+    def append(self, pcb: PCB):
+        """Copy a PCB into the next row (its pid must equal len(self))."""
+        self._reserve(self._n + 1)
+        i = self._n
+        for name in self.COLUMNS:
+            getattr(self, name)[i] = int(getattr(pcb, name))
+        self._n += 1
+
+    def extend_arrays(self, arrival, burst, priority) -> range:
+        """Append many NEW processes from equal-length arrays; returns their PIDs."""
+        arrival = np.asarray(arrival, dtype=np.int64)
+        count = len(arrival)
+        start = self._n
+        self._reserve(start + count)
+        rows = slice(start, start + count)
+        self.arrival_time[rows] = arrival
+        self.burst_time[rows] = burst
+        self.priority[rows] = priority
+        self.remaining_time[rows] = burst
+        for name, value in self.DYNAMIC_DEFAULTS.items():
+            getattr(self, name)[rows] = value
+        self._n += count
+        return range(start, start + count)
+
+    def clear(self):
+        """Drop every process (capacity is kept)."""
+        self._n = 0
+
+    def reset(self):
+        """Return every process to its freshly added state."""
+        n = self._n
+        self.remaining_time[:n] = self.burst_time[:n]
+        for name, value in self.DYNAMIC_DEFAULTS.items():
+            getattr(self, name)[:n] = value
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __bool__(self) -> bool:
+        return self._n > 0
+
+    def __getitem__(self, pid: int) -> "PCBView":
+        if not 0 <= pid < self._n:
+            raise IndexError(pid)
+        return PCBView(self, pid)
+
+    def __iter__(self):
+        return (PCBView(self, pid) for pid in range(self._n))
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only-by-convention view of one column for the live rows."""
+        return getattr(self, name)[:self._n]
+
+    # ── Vectorized aggregates ──
+
+    def wait_times_at(self, now: int) -> np.ndarray:
+        """Per-process wait time as of `now`, including open READY stints."""
+        wait = self.column("wait_time")
+        since = self.column("ready_since")
+        return wait + np.where(since != -1, now - since, 0)
+
+    def summary(self, now: int) -> dict:
+        """Counts, sums and latency columns feeding MetricsCollector."""
+        state = self.column("state")
+        completed = state == int(ProcessState.TERMINATED)
+        started = self.column("start_time") != -1
+        return {
+            "n": self._n,
+            "completed": int(completed.sum()),
+            "started": int(started.sum()),
+            "total_wait": int(self.wait_times_at(now).sum()),
+            "total_tat": int(self.column("turnaround_time")[completed].sum()),
+            "total_response": int(self.column("response_time")[started].sum()),
+            "total_burst": int(self.column("burst_time").sum()),
+            "max_finish": int(self.column("finish_time")[completed].max()) if completed.any() else 0,
+            "min_arrival": int(self.column("arrival_time").min()) if self._n else 0,
+            "latencies": {
+                "Wait": self.column("wait_time")[completed],
+                "Turnaround": self.column("turnaround_time")[completed],
+                "Response": self.column("response_time")[started],
+            },
+        }
+
+    # ── Serialization ──
+
+    def to_dicts(self, now: int | None = None, pids=None) -> list[dict]:
+        """PCB.to_dict() for every process (or those in `pids`), built column-wise."""
+        names = [s.name for s in ProcessState]
+        rows = slice(0, self._n) if pids is None else np.asarray(pids, dtype=np.int64)
+        column = lambda name: getattr(self, name)[rows]
+        wait = column("wait_time")
+        if now is not None:
+            since = column("ready_since")
+            wait = wait + np.where(since != -1, now - since, 0)
+        return [
+            {
+                "pid": pid,
+                "arrivalTime": arrival,
+                "burstTime": burst,
+                "priority": priority,
+                "remainingTime": remaining,
+                "state": state,
+                "stateName": names[state],
+                "startTime": start,
+                "finishTime": finish,
+                "waitTime": w,
+                "responseTime": response,
+                "turnaroundTime": tat,
+                "quantumUsed": used,
+                "mlfqQueue": level,
+            }
+            for pid, arrival, burst, priority, remaining, state, start, finish,
+                w, response, tat, used, level in zip(
+                range(self._n) if pids is None else list(pids),
+                column("arrival_time").tolist(),
+                column("burst_time").tolist(),
+                column("priority").tolist(),
+                column("remaining_time").tolist(),
+                column("state").tolist(),
+                column("start_time").tolist(),
+                column("finish_time").tolist(),
+                wait.tolist(),
+                column("response_time").tolist(),
+                column("turnaround_time").tolist(),
+                column("quantum_used").tolist(),
+                column("mlfq_queue_level").tolist(),
+            )
+        ]
+
+
+def _column_property(name: str):
+    def fget(self):
+        return int(getattr(self._table, name)[self.pid])
+
+    def fset(self, value):
+        getattr(self._table, name)[self.pid] = value
+
+    return property(fget, fset)
+
+
+class PCBView:
+    """
+    PCB-compatible proxy for one row of a ProcessTable.
+
+    Created on demand by ProcessTable indexing; holds no data itself.
+    """
+
+    __slots__ = ("_table", "pid")
+
+    def __init__(self, table: ProcessTable, pid: int):
+        self._table = table
+        self.pid = pid
+
+    @property
+    def state(self) -> ProcessState:
+        return ProcessState(int(self._table.state[self.pid]))
+
+    @state.setter
+    def state(self, value: ProcessState):
+        self._table.state[self.pid] = int(value)
+
+    # Behaviour is shared with the dataclass PCB
+    is_complete = PCB.is_complete
+    execute_tick = PCB.execute_tick
+    wait_time_at = PCB.wait_time_at
+    to_dict = PCB.to_dict
+
+
+for _name in ProcessTable.COLUMNS:
+    if _name != "state":
+        setattr(PCBView, _name, _column_property(_name))
+del _name
@@ -0,0 +1,111 @@
+"""
+Streaming quantiles and histograms for per-process latencies.
+
+P2Quantile is the P² estimator of Jain & Chlamtac (1985): five markers
+whose heights track the minimum, p/2, p, (1+p)/2 quantiles and the
+maximum, adjusted with a piecewise-parabolic fit as samples arrive.
+It uses O(1) memory and O(1) time per sample and never stores or
+sorts the samples. Until five samples have been seen the quantile is
+exact (nearest rank).
+
+LogHistogram counts integer samples in power-of-two buckets:
+{0}, {1}, [2, 4), [4, 8), ...
+"""
+
+import math
+
+
+class P2Quantile:
+    """Running estimate of the p-quantile of a stream."""
+
+    __slots__ = ("p", "count", "_q", "_n", "_desired", "_step")
+
+    def __init__(self, p: float):
+        self.p = p
+        self.count = 0
+        self._q: list[float] = []                   # Marker heights (the first samples, sorted, until 5)
+        self._n = [0, 1, 2, 3, 4]                   # Marker positions
+        self._desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self._step = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: float):
+        self.count += 1
+        q = self._q
+        if self.count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        # Cell the sample falls into; stretch the extremes if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        n = self._n
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired = self._desired
+        for i in range(5):
+            desired[i] += self._step[i]
+
+        # Move the middle markers toward their desired positions
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    @property
+    def value(self) -> float:
+        """Current estimate (0 before any sample)."""
+        if not self.count:
+            return 0
+        if self.count <= 5:
+            return self._q[max(math.ceil(self.p * self.count) - 1, 0)]
+        return self._q[2]
+
+    def copy(self) -> "P2Quantile":
+        clone = P2Quantile.__new__(P2Quantile)
+        clone.p, clone.count = self.p, self.count
+        clone._q, clone._n = list(self._q), list(self._n)
+        clone._desired, clone._step = list(self._desired), self._step
+        return clone
+
+
+class LogHistogram:
+    """Counts of non-negative integer samples in power-of-two buckets."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self):
+        self.counts: list[int] = []
+
+    def add(self, x: int):
+        bucket = int(x).bit_length() if x > 0 else 0
+        counts = self.counts
+        if bucket >= len(counts):
+            counts.extend([0] * (bucket + 1 - len(counts)))
+        counts[bucket] += 1
+
+    def to_dict(self) -> dict:
+        """{"bounds": lower bound per bucket, "counts": samples per bucket}."""
+        bounds = [0] + [1 << i for i in range(len(self.counts) - 1)]
+        return {"bounds": bounds, "counts": list(self.counts)}
+
+    def copy(self) -> "LogHistogram":
+        clone = LogHistogram()
+        clone.counts = list(self.counts)
+        return clone
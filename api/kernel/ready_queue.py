@@ -1,51 +1,194 @@
 """
 Ready Queue abstraction.
 
-Wraps a Python list to provide a clean queue interface.
-The ordering is maintained as FIFO — algorithm-specific selection
-is handled by the SchedulerPolicy, not the queue itself.
+Keeps PIDs in FIFO (arrival-to-queue) order and, when a scheduling
+policy supplies a key, also in a min-heap on (key, enqueue order) so
+the policy's pick is available in O(log n) instead of a full scan.
+Ties on the key resolve to the earliest-enqueued PID, exactly like
+min()/max() over the FIFO order would.
+
+Multi-level policies (MLFQ) can instead partition the queue into one
+FIFO deque per level, making "front of the highest non-empty level"
+an O(levels) lookup.
+
+Removal is lazy: a PID maps to the sequence number of its live entry,
+and entries whose sequence no longer matches are skipped (and
+periodically compacted away). That gives O(1) membership and removal.
 """
 
+import heapq
+from collections import deque
+
 
 class ReadyQueue:
-    """FIFO-ordered queue of process IDs."""
+    """FIFO-ordered queue of process IDs with an optional policy-keyed index."""
+
+    def __init__(self, key=None):
+        self._fifo: deque[tuple[int, int]] = deque()  # (seq, pid), may hold stale entries
+        self._live: dict[int, int] = {}               # pid -> seq of its live entry
+        self._heap: list[tuple] = []                  # (key, seq, pid), may hold stale entries
+        self._key = key                               # pid -> sortable key, or None
+        self._next_seq: int = 0
+        self._stale: int = 0                          # Removals since the last compaction
+
+        # Optional per-level partition (see set_levels)
+        self._level = None                            # pid -> level index, or None
+        self._levels: list[deque[tuple[int, int]]] = []
+        self._level_count: list[int] = []
+        self._level_of: dict[int, int] = {}           # pid -> level it was queued on
+
+    def set_key(self, key):
+        """
+        Order policy selection by key(pid), lowest first (None = FIFO only).
+
+        Keys are computed on enqueue and must not change while the PID
+        is queued; call set_key() again to re-index after such a change.
+        """
+        self._key = key
+        self._heap = []
+        if key is not None:
+            self._heap = [(key(pid), seq, pid) for seq, pid in self._fifo
+                          if self._live.get(pid) == seq]
+            heapq.heapify(self._heap)
+
+    def set_levels(self, level, n_levels: int = 0):
+        """
+        Partition the queue into n_levels FIFO deques by level(pid)
+        (None = no partition). Like keys, a PID's level must not change
+        while it is queued; call relevel() after changing levels in bulk.
+        """
+        self._level = level
+        self._levels = [deque() for _ in range(n_levels)] if level is not None else []
+        self.relevel()
+
+    def relevel(self):
+        """Re-bucket every queued PID by its current level, keeping FIFO order."""
+        if self._level is None:
+            return
+        for q in self._levels:
+            q.clear()
+        self._level_count = [0] * len(self._levels)
+        self._level_of.clear()
+        for seq, pid in self._fifo:
+            if self._live.get(pid) == seq:
+                self._push_level(seq, pid)
 
-    def __init__(self):
-        self._queue: list[int] = []
+    def _push_level(self, seq: int, pid: int):
+        level = self._level(pid)
+        self._level_of[pid] = level
+        self._levels[level].append((seq, pid))
+        self._level_count[level] += 1
 
     def enqueue(self, pid: int):
         """Add a PID to the back of the queue."""
-        if pid not in self._queue:
-            self._queue.append(pid)
+        if pid in self._live:
+            return
+        seq = self._next_seq
+        self._next_seq += 1
+        self._live[pid] = seq
+        self._fifo.append((seq, pid))
+        if self._key is not None:
+            heapq.heappush(self._heap, (self._key(pid), seq, pid))
+        if self._level is not None:
+            self._push_level(seq, pid)
 
     def dequeue(self) -> int:
         """Remove and return the front PID. Returns -1 if empty."""
-        if self._queue:
-            return self._queue.pop(0)
-        return -1
+        pid = self.peek()
+        if pid != -1:
+            self.remove(pid)
+        return pid
 
     def remove(self, pid: int):
         """Remove a specific PID from anywhere in the queue."""
-        if pid in self._queue:
-            self._queue.remove(pid)
+        if self._live.pop(pid, None) is None:
+            return
+        if self._level is not None:
+            self._level_count[self._level_of.pop(pid)] -= 1
+        self._stale += 1
+        if self._stale > len(self._live) + 64:
+            self._compact()
 
     def peek(self) -> int:
         """Return the front PID without removing. Returns -1 if empty."""
-        return self._queue[0] if self._queue else -1
+        fifo, live = self._fifo, self._live
+        while fifo and live.get(fifo[0][1]) != fifo[0][0]:
+            fifo.popleft()
+        return fifo[0][1] if fifo else -1
+
+    def peek_last(self) -> int:
+        """Return the back PID without removing. Returns -1 if empty."""
+        fifo, live = self._fifo, self._live
+        while fifo and live.get(fifo[-1][1]) != fifo[-1][0]:
+            fifo.pop()
+        return fifo[-1][1] if fifo else -1
+
+    def peek_best(self) -> int:
+        """
+        Return the PID with the lowest key (earliest-enqueued on ties)
+        without removing it. Falls back to the front PID when unkeyed.
+        Returns -1 if empty.
+        """
+        if self._key is None:
+            return self.peek()
+        heap, live = self._heap, self._live
+        while heap and live.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else -1
+
+    def highest_level(self) -> int:
+        """Lowest-index level with a queued PID, or -1 if none."""
+        for level, count in enumerate(self._level_count):
+            if count:
+                return level
+        return -1
+
+    def peek_level(self, level: int) -> int:
+        """Return the front PID of one level without removing. Returns -1 if empty."""
+        if not self._level_count[level]:
+            return -1
+        q, live = self._levels[level], self._live
+        while live.get(q[0][1]) != q[0][0]:
+            q.popleft()
+        return q[0][1]
+
+    def level_list(self, level: int) -> list[int]:
+        """Return the PIDs queued on one level in FIFO order."""
+        live = self._live
+        return [pid for seq, pid in self._levels[level] if live.get(pid) == seq]
 
     def clear(self):
         """Remove all PIDs."""
-        self._queue.clear()
+        self._fifo.clear()
+        self._live.clear()
+        self._heap.clear()
+        self._stale = 0
+        for q in self._levels:
+            q.clear()
+        self._level_count = [0] * len(self._levels)
+        self._level_of.clear()
+
+    def _compact(self):
+        """Drop stale entries left behind by lazy removal."""
+        live = self._live
+        self._stale = 0
+        self._fifo = deque(e for e in self._fifo if live.get(e[1]) == e[0])
+        if self._key is not None:
+            self._heap = [e for e in self._heap if live.get(e[2]) == e[1]]
+            heapq.heapify(self._heap)
+        for i, q in enumerate(self._levels):
+            self._levels[i] = deque(e for e in q if live.get(e[1]) == e[0])
 
     def __len__(self) -> int:
-        return len(self._queue)
+        return len(self._live)
 
     def __contains__(self, pid: int) -> bool:
-        return pid in self._queue
+        return pid in self._live
 
     def __iter__(self):
-        return iter(self._queue)
+        live = self._live
+        return (pid for seq, pid in self._fifo if live.get(pid) == seq)
 
     def as_list(self) -> list[int]:
-        """Return a copy of the internal list."""
-        return list(self._queue)
+        """Return the queued PIDs in FIFO order."""
+        return list(self)
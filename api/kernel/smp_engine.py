@@ -0,0 +1,337 @@
+"""
+Multi-core (SMP) Simulation Engine.
+
+Extends the single-CPU engine to N cores, each with its own run queue
+and running process, the way Linux gives every CPU its own runqueue:
+
+    • Arrivals are placed on the least-loaded core
+    • Every balance_interval ticks, queued processes are migrated from
+      the busiest cores to the idlest until loads differ by at most one
+    • A core that goes idle with an empty run queue pulls one process
+      from the busiest run queue (new-idle balancing)
+
+Each core runs the same scheduling policy over its own run queue; the
+per-core tick steps reuse SimulationEngine's by switching the engine's
+CPU context (ready_queue / running_pid) to the core being stepped.
+Migrations are counted globally and per process, and per-core
+utilization is reported by the MetricsCollector.
+"""
+
+import math
+
+from .process import PCB
+from .ready_queue import ReadyQueue
+from .process_table import ProcessTable
+from .engine import SimulationEngine
+from .kernel_log import KernelEvent
+
+
+class Core:
+    """Per-CPU scheduler state: a run queue and the process on the CPU."""
+
+    __slots__ = ("core_id", "ready_queue", "running_pid", "last_running_pid")
+
+    def __init__(self, core_id: int):
+        self.core_id = core_id
+        self.ready_queue = ReadyQueue()
+        self.running_pid: int = -1
+        self.last_running_pid: int = -1   # For context switch detection
+
+    @property
+    def load(self) -> int:
+        """Runnable processes on this core (queued + running)."""
+        return len(self.ready_queue) + (self.running_pid != -1)
+
+
+class SMPSimulationEngine(SimulationEngine):
+    """
+    Tick-based multi-core scheduler simulation engine.
+
+    Usage:
+        engine = SMPSimulationEngine(num_cores=4)
+        engine.set_policy("RR")
+        engine.add_process(arrival=0, burst=5)
+        engine.run_to_completion(event_driven=True)
+    """
+
+    def __init__(self, num_cores: int = 2, balance_interval: int = 10, **kwargs):
+        super().__init__(**kwargs)
+        self.num_cores: int = max(int(num_cores), 1)
+        self.balance_interval: int = max(int(balance_interval), 1)
+        self.migrations: int = 0
+        self.kernel_log.with_core = True
+        self.cores: list[Core] = [Core(i) for i in range(self.num_cores)]
+        self._gantt_tail: list[int] = [-1] * self.num_cores  # Last gantt index per core
+        self._cpu: Core = self.cores[0]
+        self.ready_queue = self._cpu.ready_queue
+
+    # ── CPU Context ──
+
+    def _sync_cpu(self):
+        """Write the engine's CPU state back to the current core."""
+        cpu = self._cpu
+        cpu.running_pid = self.running_pid
+        cpu.last_running_pid = self._last_running_pid
+
+    def _switch_to(self, core: Core):
+        """Point the engine's CPU state (ready_queue, running_pid) at `core`."""
+        self._sync_cpu()
+        if self._cpu is core:
+            return
+        self._cpu = core
+        self.ready_queue = core.ready_queue
+        self.running_pid = core.running_pid
+        self._last_running_pid = core.last_running_pid
+
+    # ── Configuration ──
+
+    def _install_policy(self, cls):
+        super()._install_policy(cls)
+        for core in self.cores:
+            self._bind_queue(core.ready_queue)
+
+    # ── Process Management ──
+
+    def clear(self):
+        """Reset everything to initial state."""
+        self._reset_cores()
+        super().clear()
+
+    def reset(self):
+        """Keep processes but reset all simulation state."""
+        self._reset_cores()
+        super().reset()
+        if not isinstance(self.processes, ProcessTable):   # The table resets these itself
+            for p in self.processes:
+                p.core_id = -1
+                p.migrations = 0
+
+    def _reset_cores(self):
+        self._switch_to(self.cores[0])
+        for core in self.cores:
+            core.ready_queue.clear()
+            core.running_pid = -1
+            core.last_running_pid = -1
+        self._gantt_tail = [-1] * self.num_cores
+        self.migrations = 0
+
+    # ── Kernel Log ──
+
+    def _log_event(self, event: KernelEvent, pid: int = -1, arg: int = 0, arg2: int = 0,
+                   core: int | None = None):
+        if core is None:
+            core = self._cpu.core_id
+        super()._log_event(event, pid, arg, arg2, core)
+
+    # ── Core Tick Loop ──
+
+    def tick(self) -> bool:
+        """
+        Execute one clock tick on every core.
+
+        Returns:
+            True if simulation should continue, False if completed.
+        """
+        if not self._can_tick():
+            return False
+        self._bump_version()
+        self._maybe_checkpoint()
+
+        # STEP 1: Admit newly arrived processes onto the least-loaded cores
+        self._admit_arrivals()
+
+        # Time-driven policy events (e.g. MLFQ priority boost)
+        if hasattr(self.policy, 'on_tick'):
+            boosted = False
+            for core in self.cores:
+                boosted |= self.policy.on_tick(self.current_time, core.ready_queue)
+            if boosted:
+                self._log_event(KernelEvent.BOOST, core=-1)
+
+        # Periodic load balancing
+        if self.current_time and self.current_time % self.balance_interval == 0:
+            self._balance()
+
+        # STEPS 2–4 on every core: preempt, dispatch, execute
+        for core in self.cores:
+            self._switch_to(core)
+            self._handle_preemption()
+            if self.running_pid == -1:
+                if not len(self.ready_queue):
+                    self._pull_one(core)
+                self._dispatch_next()
+            self._execute_tick()
+        self._switch_to(self.cores[0])
+
+        # STEP 5: Record per-tick metrics snapshot
+        self.metrics_collector.record_tick(self)
+
+        # STEP 6: Advance the clock
+        self.current_time += 1
+
+        # STEP 7: Check completion
+        self._check_completion()
+
+        return not self.is_completed
+
+    def _make_ready(self, proc: PCB):
+        proc.core_id = self._cpu.core_id
+        super()._make_ready(proc)
+
+    def _enqueue_arrival(self, pid: int):
+        """Place an arriving process on the least-loaded core."""
+        self._sync_cpu()
+        self._switch_to(min(self.cores, key=lambda c: c.load))
+        super()._enqueue_arrival(pid)
+
+    # ── Load Balancing ──
+
+    def _migrate(self, pid: int, src: Core, dst: Core):
+        """Move a queued process between run queues, keeping its wait clock."""
+        src.ready_queue.remove(pid)
+        dst.ready_queue.enqueue(pid)
+        proc = self.processes[pid]
+        proc.core_id = dst.core_id
+        proc.migrations += 1
+        self._touch(pid)
+        self.migrations += 1
+        self._log_event(KernelEvent.MIGRATE, pid, src.core_id, dst.core_id, core=dst.core_id)
+
+    def _balance(self):
+        """Migrate queued processes from the busiest to the idlest cores."""
+        self._sync_cpu()
+        while True:
+            busiest = max(self.cores, key=lambda c: c.load)
+            idlest = min(self.cores, key=lambda c: c.load)
+            if busiest.load - idlest.load <= 1 or not len(busiest.ready_queue):
+                return
+            self._migrate(busiest.ready_queue.peek_last(), busiest, idlest)
+
+    def _pull_one(self, core: Core):
+        """New-idle balancing: an idle core steals from the longest run queue."""
+        busiest = max(self.cores, key=lambda c: len(c.ready_queue))
+        if busiest is not core and len(busiest.ready_queue):
+            self._migrate(busiest.ready_queue.peek_last(), busiest, core)
+
+    # ── Event-driven Fast-forward ──
+
+    def _fast_forward(self, limit: float) -> int:
+        """Apply the upcoming run of ticks that are uneventful on every core."""
+        span = min(limit, self._ticks_to_next_event())
+        interval = self.balance_interval
+        next_balance = max(-(-self.current_time // interval) * interval, interval)
+        span = min(span, next_balance - self.current_time)
+        queued = any(len(core.ready_queue) for core in self.cores)
+        for core in self.cores:
+            self._switch_to(core)
+            if queued and self.running_pid == -1:
+                span = 0   # An idle core would pull work on the next tick
+            span = min(span, self._cpu_span())
+            if span <= 0:
+                break
+        if span <= 0 or span == math.inf:
+            self._switch_to(self.cores[0])
+            return 0
+        for core in self.cores:
+            self._switch_to(core)
+            self._advance_cpu(span)
+        self._switch_to(self.cores[0])
+        self.metrics_collector.record_span(self, span)
+        self.current_time += span
+        return span
+
+    # ── Checkpoints ──
+
+    def _capture_cpus(self):
+        self._switch_to(self.cores[0])
+        return {
+            "cores": [
+                (core.ready_queue.as_list(), core.running_pid, core.last_running_pid)
+                for core in self.cores
+            ],
+            "gantt_tail": list(self._gantt_tail),
+            "migrations": self.migrations,
+        }
+
+    def _restore_cpus(self, saved):
+        for core, (queue, running, last) in zip(self.cores, saved["cores"]):
+            core.ready_queue.clear()
+            for pid in queue:
+                core.ready_queue.enqueue(pid)
+            core.running_pid = running
+            core.last_running_pid = last
+        self._gantt_tail = list(saved["gantt_tail"])
+        self.migrations = saved["migrations"]
+        core = self._cpu = self.cores[0]
+        self.ready_queue = core.ready_queue
+        self.running_pid = core.running_pid
+        self._last_running_pid = core.last_running_pid
+
+    def _open_gantt_entries(self) -> list[int]:
+        return [tail for tail in self._gantt_tail if tail != -1]
+
+    def _complete(self, proc: PCB):
+        super()._complete(proc)
+        self.metrics_collector.core_completed(self._cpu.core_id, self.num_cores)
+
+    def _is_analytic(self) -> bool:
+        """Load balancing couples the cores; always simulate event by event."""
+        return False
+
+    # ── Gantt Chart ──
+
+    def _add_gantt(self, pid: int, start: int, end: int):
+        """Add or extend the Gantt entry of the current core."""
+        if self.headless:
+            return
+        core_id = self._cpu.core_id
+        tail = self._gantt_tail[core_id]
+        if tail != -1:
+            last = self.gantt[tail]
+            if last["pid"] == pid and last["endTime"] == start:
+                last["endTime"] = end
+                return
+        self._gantt_tail[core_id] = len(self.gantt)
+        self.gantt.append({"pid": pid, "startTime": start, "endTime": end, "coreId": core_id})
+
+    # ── State Serialization ──
+
+    def get_state(self, max_points: int | None = None) -> dict:
+        """Return full simulation state, including per-core run queues."""
+        self._switch_to(self.cores[0])
+        return super().get_state(max_points)
+
+    def _process_dicts(self, pids: list[int] | None = None) -> list[dict]:
+        dicts = super()._process_dicts(pids)
+        if isinstance(self.processes, ProcessTable):
+            rows = slice(None) if pids is None else pids
+            core_ids = self.processes.column("core_id")[rows].tolist()
+            migrations = self.processes.column("migrations")[rows].tolist()
+        else:
+            procs = self.processes if pids is None else [self.processes[pid] for pid in pids]
+            core_ids = [p.core_id for p in procs]
+            migrations = [p.migrations for p in procs]
+        for d, core_id, moved in zip(dicts, core_ids, migrations):
+            d["coreId"] = core_id
+            d["migrations"] = moved
+        return dicts
+
+    def _summary_state(self) -> dict:
+        self._switch_to(self.cores[0])
+        state = super()._summary_state()
+        state["readyQueue"] = [pid for core in self.cores for pid in core.ready_queue]
+        state["numCores"] = self.num_cores
+        state["migrations"] = self.migrations
+        state["cores"] = [
+            {
+                "coreId": core.core_id,
+                "runningPid": core.running_pid,
+                "readyQueue": core.ready_queue.as_list(),
+                **(
+                    {"mlfqState": self.policy.get_queue_state(core.ready_queue)}
+                    if hasattr(self.policy, 'get_queue_state') else {}
+                ),
+            }
+            for core in self.cores
+        ]
+        return state
@@ -0,0 +1,159 @@
+"""
+Sequence-numbered state deltas for polling clients.
+
+get_state() resends every PCB, the whole gantt chart and metrics
+history, and the kernel-log tail, so a client ticking through a run
+receives O(T²) bytes in total. StateDeltas numbers every state it hands
+out and remembers, for the last `window` of them, what the client held
+after applying it. Given the number the client last applied, it sends
+only what changed since then:
+
+    {"seq": 12, "delta": True, "baseSeq": 11,
+     ...get_state() keys that do not grow (clock, running PID, queues, metrics),
+     "processes": [...],                        # Changed PCB dicts; merge by pid
+     "gantt": {"from": i, "entries": [...]},    # Replace gantt[i:]
+     "metricsHistory": {"from": i, "rows": [...]},   # Replace metricsHistory[i:]
+     "kernelLog": [...]}                        # Append, keep the last KERNEL_LOG_TAIL
+
+It sends a full state ({"seq": 12, "delta": False, ...get_state()})
+instead if the client's sequence number is missing or has left the
+window, or if the engine was replaced or rewound (reset, clear, seek
+backwards, edits that resimulate).
+
+A remembered state is a handful of counters, not a copy of what was
+sent: the engine marks every PCB it changes (changes_mark() /
+changed_pids()), so a delta serializes only the changed processes plus
+the READY ones, whose waitTime grows with the clock. Plain reads
+(full(record=False), for polling /state) are numbered but not
+remembered, so they neither cost memory nor push the states that
+/tick and the stream build on out of the window.
+
+With max_points, the client's metricsHistory stays within that limit.
+New snapshots are appended until they would overflow it. Then the whole
+history is resent, downsampled to half the limit, so resends happen at
+most once every max_points / 2 snapshots.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from .engine import KERNEL_LOG_TAIL
+
+
+DELTA_WINDOW = 8   # States remembered per client (how far behind a delta can start)
+BASELINE_BYTES = 512   # Approximate size of one remembered state (for nbytes)
+
+
+@dataclass
+class _Baseline:
+    """What the client held after applying one state."""
+
+    engine: object
+    rewinds: int                     # engine.rewinds at the time
+    time: int                        # engine.current_time
+    changes: int                     # engine.changes_mark() taken when it was sent
+    gantt_len: int
+    gantt_open: list                 # (index, endTime) of bars that may still grow
+    history: object                  # The MetricsHistory the snapshots came from
+    stride: int                      # Its snapshot_stride (changes when decimated)
+    history_rows: int                # Snapshots of `history` covered
+    history_sent: int                # Rows in the client's metricsHistory
+    log_total: int                   # Kernel events recorded
+
+
+class StateDeltas:
+    """Hands out full states and deltas for one client, numbered by `seq`."""
+
+    def __init__(self, window: int = DELTA_WINDOW):
+        self.window = max(int(window), 1)
+        self.seq: int = 0
+        self._baselines: OrderedDict[int, _Baseline] = OrderedDict()
+
+    def full(self, engine, max_points: int | None = None, record: bool = True) -> dict:
+        """
+        The full state, numbered so later deltas can build on it (unless
+        `record` is False: deltas asked for since its number are full).
+        """
+        state = engine.get_state(max_points)
+        if not record:
+            self.seq += 1
+            return {"seq": self.seq, "delta": False, **state}
+        baseline = self._baseline(engine, len(state["metricsHistory"]))
+        return self._record(baseline, {"delta": False, **state})
+
+    def since(self, engine, seq: int | None, max_points: int | None = None) -> dict:
+        """
+        The changes since state `seq` was sent, or the full state if
+        they cannot be expressed as a delta.
+
+        Args:
+            engine:     The client's engine.
+            seq:        Last sequence number the client applied (None = none).
+            max_points: Keep the client's metricsHistory within this many rows.
+        """
+        base = self._baselines.get(seq) if seq is not None else None
+        if base is None or base.engine is not engine or base.rewinds != engine.rewinds:
+            return self.full(engine, max_points)
+
+        delta = engine._summary_state()
+        pids = engine.changed_pids(base.changes)
+        if engine.current_time != base.time:
+            pids = np.union1d(pids, delta["readyQueue"]).astype(np.int64)
+        delta["processes"] = engine._process_dicts(pids.tolist())
+
+        gantt = engine.gantt
+        start = base.gantt_len
+        for i, end in base.gantt_open:
+            if gantt[i]["endTime"] != end:
+                start = min(start, i)
+        delta["gantt"] = {"from": start, "entries": gantt[start:]}
+
+        collector = engine.metrics_collector
+        history = collector.history
+        new_rows = len(history) - base.history_rows
+        if (history is not base.history or collector.snapshot_stride != base.stride
+                or (max_points is not None and base.history_sent + new_rows > max_points)):
+            rows = collector.snapshots(None if max_points is None else max_points // 2)
+            delta["metricsHistory"] = {"from": 0, "rows": rows}
+            sent = len(rows)
+        else:
+            delta["metricsHistory"] = {"from": base.history_sent, "rows": history.to_dicts(base.history_rows)}
+            sent = base.history_sent + new_rows
+
+        new_events = engine.kernel_log.total - base.log_total
+        delta["kernelLog"] = engine.kernel_log.tail(min(new_events, KERNEL_LOG_TAIL)) if new_events > 0 else []
+
+        return self._record(
+            self._baseline(engine, sent),
+            {"delta": True, "baseSeq": seq, **delta},
+        )
+
+    def _baseline(self, engine, history_sent: int) -> _Baseline:
+        collector = engine.metrics_collector
+        return _Baseline(
+            engine=engine,
+            rewinds=engine.rewinds,
+            time=engine.current_time,
+            changes=engine.changes_mark(),
+            gantt_len=len(engine.gantt),
+            gantt_open=[(i, engine.gantt[i]["endTime"]) for i in engine._open_gantt_entries()],
+            history=collector.history,
+            stride=collector.snapshot_stride,
+            history_rows=len(collector.history),
+            history_sent=history_sent,
+            log_total=engine.kernel_log.total,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the remembered states (approximate)."""
+        return len(self._baselines) * BASELINE_BYTES
+
+    def _record(self, baseline: _Baseline, payload: dict) -> dict:
+        self.seq += 1
+        self._baselines[self.seq] = baseline
+        while len(self._baselines) > self.window:
+            self._baselines.popitem(last=False)
+        return {"seq": self.seq, **payload}
@@ -0,0 +1,92 @@
+"""
+Response encoding: fast JSON and compression.
+
+FastJSONProvider replaces Flask's JSON provider, so jsonify() and
+request.get_json() use orjson when it is installed (several times
+faster than the stdlib json module on get_state()-sized payloads, and
+NumPy values are encoded natively). Without orjson, or for anything
+orjson rejects, it falls back to Flask's stdlib encoder, taught to
+encode NumPy arrays and scalars as lists and numbers.
+
+compress() gzip- or Brotli-encodes a finished response above
+COMPRESS_MIN_BYTES when the client accepts it. Brotli is used only if
+the `brotli` package is installed.
+"""
+
+import gzip
+
+import numpy as np
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+COMPRESS_MIN_BYTES = 1024      # Smaller bodies are sent as they are
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4             # Fast settings: responses are built per request
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, with the stdlib as fallback."""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, (np.ndarray, np.generic)):
+            return o.tolist()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode()
+
+    def dumps_bytes(self, obj) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+            except TypeError:      # e.g. integers beyond 64 bits
+                pass
+        return super().dumps(obj).encode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
+
+def compress(response, accept_encodings):
+    """
+    Compress `response` in place if it is large enough and the client
+    accepts br or gzip (`accept_encodings` is request.accept_encodings).
+    Streams, non-200 responses and already-encoded bodies are left alone.
+    """
+    if (response.status_code != 200 or response.is_streamed or response.direct_passthrough
+            or "Content-Encoding" in response.headers):
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return response
+    response.vary.add("Accept-Encoding")
+    if brotli is not None and accept_encodings["br"]:
+        data, encoding = brotli.compress(data, quality=BROTLI_QUALITY), "br"
+    elif accept_encodings["gzip"]:
+        data, encoding = gzip.compress(data, compresslevel=GZIP_LEVEL), "gzip"
+    else:
+        return response
+    response.set_data(data)
+    response.headers["Content-Encoding"] = encoding
+    return response
@@ -113,6 +113,8 @@ class Scheduler:
         self.time_quantum = 2
         self.quantum_remaining = 0
         self.metrics = {}
+        self.horizon = None         # stop run_to_completion here (None = unbounded)
+        self.is_truncated = False
 
         # MLFQ-specific state: 3 sub-queues
         self.mlfq_queues = [[], [], []]
@@ -122,6 +124,7 @@ class Scheduler:
         self.running_pid = -1
         self.quantum_remaining = 0
         self.is_completed = False
+        self.is_truncated = False
         self.ready_queue = []
         self.gantt = []
         self.metrics = {}
@@ -143,6 +146,10 @@ class Scheduler:
     def set_time_quantum(self, quantum):
         self.time_quantum = max(quantum, 1)
 
+    def set_horizon(self, horizon):
+        self.horizon = horizon
+        self.is_truncated = False
+
     def add_process(self, arrival, burst, priority=0):
         # Snap past arrival times to current time for dynamic additions
         if arrival < self.current_time:
@@ -292,8 +299,15 @@ class Scheduler:
         return not self.is_completed
 
     def run_to_completion(self):
-        while not self.is_completed and self.current_time < 10000:
+        """Step until done or the horizon is hit; returns True if all processes finished."""
+        if not self.processes:      # Nothing to run (step() never completes an empty set)
+            return False
+        while not self.is_completed:
+            if self.horizon is not None and self.current_time >= self.horizon:
+                self.is_truncated = True
+                break
             self.step()
+        return self.is_completed
 
     # ── Gantt chart helper ──
 
@@ -335,6 +349,7 @@ class Scheduler:
             "currentTime": self.current_time,
             "runningPid": self.running_pid,
             "isCompleted": self.is_completed,
+            "isTruncated": self.is_truncated,
             "algorithm": self.algorithm,
             "timeQuantum": self.time_quantum,
             "processes": [
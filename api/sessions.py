@@ -0,0 +1,129 @@
+"""
+Session registry — one simulation per client.
+
+Each session holds its own v2 engine and legacy v1 scheduler, so
+concurrent users no longer share (and overwrite) a single global
+simulation. Sessions are kept in LRU order and evicted when:
+
+    • they have been idle longer than `ttl` seconds,
+    • there are more than `max_sessions`, or
+    • the engines' combined approximate size exceeds `memory_budget`
+      (least recently used first).
+
+Sessions in use — between get() and release(), or playing an SSE stream
+(hold()) — are never evicted; they are reconsidered once released.
+
+Every session has a re-entrant lock. The API holds it for the whole
+request, so concurrent ticks on one session (threaded gunicorn
+workers, a double-clicked button) run one at a time, while different
+sessions proceed in parallel.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from scheduler import Scheduler
+from kernel.engine import SimulationEngine
+from kernel.state_delta import StateDeltas
+from streaming import Playback
+
+
+class Session:
+    """One client's simulation state."""
+
+    def __init__(self, session_id: str):
+        self.id = session_id
+        self.engine = SimulationEngine()
+        self._scheduler: Scheduler | None = None
+        self.deltas = StateDeltas()           # Sequence-numbered states sent to this client
+        self.playback = Playback()            # Controls for its /stream
+        self.lock = threading.RLock()
+        self.last_used: float = time.monotonic()
+        self.nbytes: int = 0               # Size estimate as of the last update()
+        self.users: int = 0                # Requests and streams using it (guarded by the registry)
+
+    @property
+    def scheduler(self) -> Scheduler:
+        """Legacy v1 scheduler, created on first use."""
+        if self._scheduler is None:
+            self._scheduler = Scheduler()
+        return self._scheduler
+
+    @scheduler.setter
+    def scheduler(self, value: Scheduler):
+        self._scheduler = value
+
+
+class SessionRegistry:
+    """Sessions by ID with LRU, idle-TTL and memory-budget eviction."""
+
+    def __init__(self, max_sessions: int = 256, ttl: float = 1800,
+                 memory_budget: int = 1 << 30):
+        self.max_sessions = max(int(max_sessions), 1)
+        self.ttl = ttl
+        self.memory_budget = memory_budget
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self._lock = threading.Lock()      # Guards the dict, never held while simulating
+        self.evictions: int = 0
+
+    def get(self, session_id: str) -> Session:
+        """
+        The session for `session_id`, created if missing; marks it most
+        recent and in use until release().
+        """
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = Session(session_id)
+            else:
+                self._sessions.move_to_end(session_id)
+            session.last_used = now
+            session.users += 1
+            self._evict(now, keep=session)
+        return session
+
+    def hold(self, session: Session):
+        """Mark a session already obtained from get() in use once more (e.g. by a stream)."""
+        with self._lock:
+            session.users += 1
+
+    def release(self, session: Session):
+        """End one use of a session (get() or hold()), then update() it."""
+        with self._lock:
+            session.users -= 1
+        self.update(session)
+
+    def update(self, session: Session):
+        """Refresh a session's size estimate and enforce the budget."""
+        session.nbytes = session.engine.nbytes + session.deltas.nbytes
+        with self._lock:
+            self._evict(time.monotonic(), keep=session)
+
+    def _evict(self, now: float, keep: Session):
+        sessions = self._sessions
+        # Idle sessions sit at the LRU end
+        for session in list(sessions.values()):
+            if now - session.last_used <= self.ttl:
+                break
+            if session is not keep and not session.users:
+                self._drop(session)
+        total = sum(s.nbytes for s in sessions.values())
+        for session in list(sessions.values()):
+            if len(sessions) <= self.max_sessions and total <= self.memory_budget:
+                break
+            if session is not keep and not session.users:
+                total -= session.nbytes
+                self._drop(session)
+
+    def _drop(self, session: Session):
+        del self._sessions[session.id]
+        session.engine.kernel_log.close()
+        self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
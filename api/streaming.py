@@ -0,0 +1,115 @@
+"""
+Server-side playback for GET /api/v2/stream.
+
+Instead of the client POSTing /tick once per tick, it opens one
+Server-Sent Events stream and the server ticks the session's engine at
+the requested rate. Each tick is pushed as a /tick-style state delta
+(see kernel/state_delta.py), with its sequence number as the event id:
+
+    event: tick
+    id: 42
+    data: {"seq": 42, "delta": true, "baseSeq": 41, "running": true, ...}
+
+Each delta builds on the previous event of the same stream, never on
+states the session was sent by other requests (/state, /tick, another
+tab), so a client that applies every event always holds the base. The
+first event builds on `since` (the client's last applied seq, from
+?sinceSeq= or the Last-Event-ID header of a reconnecting EventSource),
+or is a full state if that is unknown or no longer remembered.
+
+When the engine finishes, the stream sends `event: end` and closes.
+
+Above FRAME_RATE ticks per second, several ticks are run per event, so
+fast playback costs at most FRAME_RATE events per second per client.
+The rate can be changed and playback paused or resumed while the stream
+is open (POST /api/v2/stream/control), through the session's Playback.
+Opening a new stream stops any older one for the same session.
+"""
+
+import json
+import math
+import threading
+import time
+
+
+FRAME_RATE = 50        # Events per second, at most
+KEEPALIVE = 15         # Seconds between comment lines while paused
+
+
+class Playback:
+    """Stream controls for one session."""
+
+    def __init__(self):
+        self.paused: bool = False
+        self.interval: float = 0.5       # Seconds per tick
+        self.generation: int = 0         # Bumped to stop the running stream
+        self._wake = threading.Event()
+
+    def control(self, paused: bool | None = None, interval: float | None = None):
+        """Change the controls; the stream picks them up immediately."""
+        if paused is not None:
+            self.paused = paused
+        if interval is not None:
+            self.interval = interval
+        self._wake.set()
+
+    def stop(self):
+        self.generation += 1
+        self._wake.set()
+
+    def wait(self, timeout: float):
+        """Sleep up to `timeout` seconds, or until the controls change."""
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+
+def tick_stream(session, registry, max_points: int | None = None, dumps=json.dumps,
+                since: int | None = None):
+    """
+    Generate SSE messages while ticking `session`'s engine.
+
+    Args:
+        session:    The sessions.Session to play.
+        registry:   Its SessionRegistry (the session is held in use while
+                    the stream is open, and its size kept up to date).
+        max_points: Passed on to the state deltas (metricsHistory limit).
+        dumps:      JSON encoder for the event data.
+        since:      Sequence number of the last state the client applied.
+    """
+    def event(name: str, payload: dict) -> str:
+        return f"event: {name}\nid: {payload['seq']}\ndata: {dumps(payload)}\n\n"
+
+    playback = session.playback
+    playback.stop()                      # Supersede any stream already running
+    generation = playback.generation
+    playback.control(paused=False)
+    registry.hold(session)
+    try:
+        while playback.generation == generation:
+            if playback.paused:
+                yield ": paused\n\n"
+                playback.wait(KEEPALIVE)
+                continue
+
+            started = time.monotonic()
+            ticks = max(math.ceil(1 / (FRAME_RATE * playback.interval)), 1)
+            with session.lock:
+                engine = session.engine
+                for _ in range(ticks):
+                    running = engine.tick()
+                    if not running:
+                        break
+                payload = session.deltas.since(engine, since, max_points)
+                since = payload["seq"]
+                payload["running"] = running
+                payload["latestSnapshot"] = engine.metrics_collector.latest_snapshot
+                session.last_used = time.monotonic()
+                registry.update(session)
+
+            yield event("tick", payload)
+            if not running:
+                yield event("end", {"seq": payload["seq"]})
+                return
+            playback.wait(max(ticks * playback.interval - (time.monotonic() - started), 0))
+    finally:
+        registry.release(session)
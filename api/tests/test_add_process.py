@@ -0,0 +1,71 @@
+"""SimulationEngine.add_process validation and re-simulation of a completed run."""
+
+import pytest
+
+from kernel.engine import SimulationEngine
+
+
+def _completed(horizon=None):
+    engine = SimulationEngine()
+    engine.set_policy("RR")
+    engine.set_time_quantum(2)
+    if horizon is not None:
+        engine.set_horizon(horizon)
+    engine.add_process(arrival=0, burst=4)
+    engine.add_process(arrival=1, burst=3)
+    engine.run_to_completion()
+    return engine
+
+
+@pytest.mark.parametrize("fields", [
+    {"arrival": -3, "burst": 2},
+    {"arrival": 0, "burst": 0},
+    {"arrival": 0, "burst": 2.5},
+    {"arrival": 0, "burst": 2, "priority": True},
+])
+def test_invalid_process_is_rejected_unchanged(fields):
+    engine = _completed()
+    before = engine.get_state()
+    with pytest.raises(ValueError):
+        engine.add_process(**fields)
+    assert engine.get_state() == before
+
+
+def test_completed_run_replays_like_a_fresh_one():
+    engine = _completed()
+    engine.add_process(arrival=2, burst=5)
+    fresh = SimulationEngine()
+    fresh.set_policy("RR")
+    fresh.set_time_quantum(2)
+    for arrival, burst in ((0, 4), (1, 3), (2, 5)):
+        fresh.add_process(arrival=arrival, burst=burst)
+    fresh.run_to_completion()
+    assert engine.is_completed
+    assert engine.get_final_metrics() == fresh.get_final_metrics()
+    assert engine.get_state()["gantt"] == fresh.get_state()["gantt"]
+
+
+def test_completed_run_replays_within_the_horizon():
+    engine = _completed(horizon=10)
+    engine.add_process(arrival=3, burst=1000)
+    assert engine.current_time == 10
+    assert engine.is_truncated and not engine.is_completed
+
+
+@pytest.fixture
+def client():
+    from index import app
+    return app.test_client()
+
+
+@pytest.mark.parametrize("body", [
+    {"arrival": -3, "burst": 2},
+    {"arrival": 0, "burst": 0},
+    {"arrivalTime": 0, "burstTime": 1.7},
+    {"arrival": "soon", "burst": 2},
+])
+def test_add_process_endpoint_rejects_invalid_values(client, body):
+    headers = {"X-Session-ID": "add-process"}
+    response = client.post("/api/v2/add-process", json=body, headers=headers)
+    assert response.status_code == 400
+    assert client.get("/api/v2/state", headers=headers).get_json()["processes"] == []
@@ -0,0 +1,55 @@
+"""SimulationEngine.add_processes and /api/v2/add-processes."""
+
+import random
+
+import pytest
+
+from kernel.engine import SimulationEngine
+
+
+def test_bulk_add_matches_one_at_a_time():
+    rng = random.Random(23)
+    rows = [(rng.randrange(40), rng.randrange(1, 12), rng.randrange(5)) for _ in range(60)]
+    bulk, single = SimulationEngine(), SimulationEngine()
+    for engine in (bulk, single):
+        engine.set_policy("RR")
+        engine.set_time_quantum(3)
+    arrival, burst, priority = zip(*rows)
+    bulk.add_processes(arrival, burst, priority)
+    for a, b, p in rows:
+        single.add_process(arrival=a, burst=b, priority=p)
+    bulk.run_to_completion()
+    single.run_to_completion()
+    assert bulk.get_state() == single.get_state()
+
+
+@pytest.fixture
+def client():
+    from index import app
+    return app.test_client()
+
+
+HEADERS = {"X-Session-ID": "add-processes"}
+
+
+def test_json_and_csv_bodies_agree(client):
+    client.post("/api/v2/init", json={"algorithm": 0}, headers=HEADERS)
+    client.post("/api/v2/add-processes", json=[{"arrival": 0, "burst": 3}, {"arrivalTime": 2, "burstTime": 4.0}],
+                headers=HEADERS)
+    from_json = client.get("/api/v2/state", headers=HEADERS).get_json()["processes"]
+    client.post("/api/v2/init", json={"algorithm": 0}, headers=HEADERS)
+    client.post("/api/v2/add-processes", data="arrival,burst\n0,3\n2,4\n", content_type="text/csv",
+                headers=HEADERS)
+    assert client.get("/api/v2/state", headers=HEADERS).get_json()["processes"] == from_json
+
+
+@pytest.mark.parametrize("row", [
+    {"arrival": 0, "burst": 1.7},
+    {"arrival": 0.5, "burst": 2},
+    {"arrival": 0, "burst": True},
+    {"arrival": 0, "burst": "lots"},
+])
+def test_json_rows_must_be_integers(client, row):
+    response = client.post("/api/v2/add-processes", json=[{"arrival": 0, "burst": 2}, row], headers=HEADERS)
+    assert response.status_code == 400
+    assert response.get_json()["error"].startswith("process 1:")
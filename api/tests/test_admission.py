@@ -0,0 +1,37 @@
+"""Arrival-ordered admission of NEW processes."""
+
+from kernel.engine import SimulationEngine
+
+
+def fcfs(*processes) -> SimulationEngine:
+    engine = SimulationEngine()
+    engine.set_policy("FCFS")
+    for arrival, burst in processes:
+        engine.add_process(arrival, burst)
+    return engine
+
+
+def slices(engine: SimulationEngine) -> list:
+    return [(g["pid"], g["startTime"], g["endTime"]) for g in engine.get_state()["gantt"]]
+
+
+def test_processes_added_out_of_order_are_admitted_by_arrival():
+    engine = fcfs((5, 2), (0, 3), (0, 1))
+    engine.run_to_completion()
+    assert slices(engine) == [(1, 0, 3), (2, 3, 4), (-1, 4, 5), (0, 5, 7)]
+
+
+def test_same_tick_arrivals_enter_the_queue_in_pid_order():
+    engine = fcfs((2, 1), (2, 1), (0, 2), (2, 1))
+    engine.tick()
+    engine.tick()
+    engine.tick()
+    assert [e["pid"] for e in engine.get_state()["kernelLog"] if e["event"] == "arrive"] == [2, 0, 1, 3]
+
+
+def test_moving_an_arrival_reorders_admission():
+    engine = fcfs((0, 2), (1, 2))
+    engine.update_process(0, arrival=4)
+    engine.run_to_completion()
+    assert slices(engine) == [(-1, 0, 1), (1, 1, 3), (-1, 3, 4), (0, 4, 6)]
+    assert engine.is_completed
@@ -0,0 +1,48 @@
+"""Closed-form non-preemptive schedules against the tick loop."""
+
+import random
+
+import pytest
+
+from kernel import SimulationEngine
+
+
+NON_PREEMPTIVE = ["FCFS", "SJF", "Priority", "LJF"]
+
+
+def run(algorithm, workload, analytic, ticks_first=0, horizon=None, columnar=False):
+    engine = SimulationEngine(columnar=columnar)
+    engine.set_policy(algorithm)
+    engine.set_horizon(horizon)
+    for process in workload:
+        engine.add_process(*process)
+    for _ in range(ticks_first):
+        engine.tick()
+    finished = engine.run_to_completion(snapshots=not analytic)
+    state = engine.get_state()
+    return (finished, state["currentTime"], state["processes"], state["gantt"], state["contextSwitches"],
+            state["isTruncated"], state["runningPid"], state["readyQueue"], engine.get_final_metrics())
+
+
+@pytest.mark.parametrize("algorithm", NON_PREEMPTIVE)
+def test_analytic_run_matches_tick_loop(algorithm):
+    rng = random.Random(NON_PREEMPTIVE.index(algorithm))
+    for _ in range(150):
+        workload = [(rng.choice([0, rng.randint(0, 60)]), rng.randint(1, rng.choice([3, 25])), rng.randint(0, 3))
+                    for _ in range(rng.randint(1, 14))]
+        options = {
+            "ticks_first": rng.choice([0, 0, rng.randint(0, 40)]),
+            "horizon": rng.choice([None, None, rng.randint(1, 120)]),
+            "columnar": rng.random() < 0.3,
+        }
+        assert run(algorithm, workload, True, **options) == run(algorithm, workload, False, **options), \
+            (workload, options)
+
+
+def test_analytic_run_records_no_snapshots():
+    engine = SimulationEngine()
+    engine.set_policy("SJF")
+    engine.add_processes(range(0, 20_000, 2), [3] * 10_000)
+    engine.run_to_completion(snapshots=False)
+    assert engine.is_completed
+    assert engine.get_state()["metricsHistory"] == []
@@ -0,0 +1,42 @@
+"""BatchSimulator against one SimulationEngine per workload."""
+
+import random
+
+import pytest
+
+from kernel import SimulationEngine
+from kernel.batch_engine import BatchSimulator, metrics_dicts
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+def engine_metrics(algorithm: str, quantum: int, workload: list[dict]) -> dict:
+    engine = SimulationEngine(headless=True)
+    engine.set_policy(algorithm)
+    engine.set_time_quantum(quantum)
+    for p in workload:
+        engine.add_process(p["arrival"], p["burst"], p["priority"])
+    engine.run_to_completion()
+    return engine.get_final_metrics()
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_batch_matches_engine(algorithm):
+    rng = random.Random(ALGORITHMS.index(algorithm))
+    workloads = [
+        [{"arrival": rng.choice([0, rng.randint(0, 50)]), "burst": rng.randint(1, rng.choice([4, 30])),
+          "priority": rng.randint(0, 10)} for _ in range(rng.randint(1, 20))]
+        for _ in range(60)
+    ]
+    quanta = [rng.choice([1, 2, 4, 8]) for _ in workloads]
+    batch = metrics_dicts(BatchSimulator.from_workloads(workloads).run(algorithm, quanta))
+    for workload, quantum, metrics in zip(workloads, quanta, batch):
+        expected = engine_metrics(algorithm, quantum, workload)
+        assert metrics == {key: expected[key] for key in metrics}, (quantum, workload)
+
+
+def test_empty_workload_row():
+    batch = metrics_dicts(BatchSimulator.from_workloads([[], [{"arrival": 0, "burst": 3, "priority": 0}]]).run("FCFS"))
+    assert batch[0]["totalExecutionTime"] == 0
+    assert batch[1]["avgTurnaroundTime"] == 3.0
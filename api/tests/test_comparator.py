@@ -0,0 +1,39 @@
+"""AlgorithmComparator result cache."""
+
+from comparison.comparator import AlgorithmComparator
+
+
+WORKLOAD = [{"arrival": 0, "burst": 5, "priority": 2}, {"arrival": 1, "burst": 3, "priority": 1},
+            {"arrival": 2, "burst": 8, "priority": 0}]
+
+
+def test_cached_results_equal_a_fresh_comparison():
+    cached = AlgorithmComparator()
+    first = cached.compare(WORKLOAD, 2)
+    aliased = [{"arrivalTime": p["arrival"], "burstTime": p["burst"], "priority": p["priority"]} for p in WORKLOAD]
+    assert cached.compare(aliased, 2) is first
+    assert first == AlgorithmComparator(cache_size=0).compare(WORKLOAD, 2)
+    assert cached.compare_detailed(WORKLOAD, 2) == AlgorithmComparator(cache_size=0).compare_detailed(WORKLOAD, 2)
+    info = cached.cache_info()
+    assert (info["hits"], info["misses"], info["size"]) == (1, 2, 2)
+
+
+def test_key_covers_quantum_and_order():
+    comparator = AlgorithmComparator()
+    comparator.compare(WORKLOAD, 2)
+    comparator.compare(WORKLOAD, 3)
+    comparator.compare(WORKLOAD[::-1], 2)
+    assert comparator.cache_info()["hits"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    comparator = AlgorithmComparator(cache_size=2)
+    workloads = [[{"arrival": 0, "burst": burst}] for burst in (1, 2, 3)]
+    comparator.compare(workloads[0])
+    comparator.compare(workloads[1])
+    comparator.compare(workloads[0])    # Now most recent
+    comparator.compare(workloads[2])    # Evicts workloads[1]
+    comparator.compare(workloads[0])
+    assert comparator.cache_info() == {"hits": 2, "misses": 3, "evictions": 1, "size": 2, "maxSize": 2}
+    comparator.compare(workloads[1])
+    assert comparator.cache_info()["misses"] == 4
@@ -0,0 +1,49 @@
+"""Event-driven run_to_completion against the tick loop."""
+
+import random
+
+import pytest
+
+from kernel.engine import SimulationEngine
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+KEYS = ("currentTime", "isCompleted", "processes", "gantt", "metrics", "contextSwitches", "mlfqState")
+
+
+def workloads(seed: int, count: int = 25):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield rng.randint(1, 4), [
+            (rng.choice([0, rng.randint(0, 60)]), rng.randint(1, rng.choice([4, 40])), rng.randint(0, 5))
+            for _ in range(rng.randint(1, 12))
+        ]
+
+
+def build(algorithm: str, quantum: int, workload: list) -> SimulationEngine:
+    engine = SimulationEngine()
+    engine.set_policy(algorithm)
+    engine.set_time_quantum(quantum)
+    for arrival, burst, priority in workload:
+        engine.add_process(arrival, burst, priority)
+    return engine
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_event_driven_matches_tick_loop(algorithm):
+    for quantum, workload in workloads(seed=ALGORITHMS.index(algorithm)):
+        ticked = build(algorithm, quantum, workload)
+        ticked.run_to_completion()
+        jumped = build(algorithm, quantum, workload)
+        jumped.run_to_completion(event_driven=True)
+        expected, actual = ticked.get_state(), jumped.get_state()
+        for key in KEYS:
+            assert actual.get(key) == expected.get(key), (algorithm, quantum, workload, key)
+        assert jumped.get_final_metrics() == ticked.get_final_metrics()
+
+
+def test_event_driven_skips_idle_gaps():
+    engine = build("FCFS", 1, [(0, 2, 0), (1_000_000, 3, 0)])
+    engine.run_to_completion(event_driven=True)
+    assert engine.current_time == 1_000_003
+    assert len(engine.get_state()["metricsHistory"]) < 100
@@ -0,0 +1,37 @@
+"""Headless engines: same final metrics, no recorded output."""
+
+import random
+
+import pytest
+
+from kernel import SimulationEngine, SMPSimulationEngine
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("cores", [1, 3])
+def test_headless_final_metrics_match(algorithm, cores):
+    rng = random.Random(ALGORITHMS.index(algorithm) * 10 + cores)
+    for _ in range(12):
+        workload = [(rng.randint(0, 40), rng.randint(1, 15), rng.randint(0, 4)) for _ in range(rng.randint(1, 15))]
+        horizon = rng.choice([None, None, rng.randint(1, 60)])
+        results = []
+        for headless in (False, True):
+            if cores > 1:
+                engine = SMPSimulationEngine(num_cores=cores, balance_interval=4, headless=headless)
+            else:
+                engine = SimulationEngine(headless=headless)
+            engine.set_policy(algorithm)
+            engine.set_time_quantum(2)
+            engine.set_horizon(horizon)
+            for process in workload:
+                engine.add_process(*process)
+            engine.run_to_completion()
+            state = engine.get_state()
+            results.append((engine.get_final_metrics(), state["processes"], state["currentTime"],
+                            state["isCompleted"]))
+            if headless:
+                assert not (state["gantt"] or state["kernelLog"] or state["metricsHistory"])
+        assert results[1] == results[0], (workload, horizon)
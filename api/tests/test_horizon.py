@@ -0,0 +1,52 @@
+"""Run horizon (replaces the old 10,000-tick ceiling)."""
+
+import pytest
+
+from kernel.engine import SimulationEngine
+
+
+def engine_with(*bursts, policy="FCFS") -> SimulationEngine:
+    engine = SimulationEngine()
+    engine.set_policy(policy)
+    for burst in bursts:
+        engine.add_process(0, burst)
+    return engine
+
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_runs_past_ten_thousand_ticks(event_driven):
+    engine = engine_with(12_000, 3_000)
+    assert engine.run_to_completion(event_driven=event_driven) is True
+    assert engine.current_time == 15_000
+    assert not engine.is_truncated
+
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_horizon_truncates_the_run(event_driven):
+    engine = engine_with(50, 50, policy="RR")
+    engine.set_horizon(30)
+    assert engine.run_to_completion(event_driven=event_driven) is False
+    state = engine.get_state()
+    assert state["currentTime"] == 30
+    assert state["isTruncated"] and not state["isCompleted"]
+    assert sum(50 - p["remainingTime"] for p in state["processes"]) == 30
+
+
+def test_raising_the_horizon_resumes_the_run():
+    engine = engine_with(50)
+    engine.set_horizon(20)
+    engine.run_to_completion()
+    engine.set_horizon(None)
+    assert engine.run_to_completion() is True
+    assert engine.current_time == 50
+
+
+def test_horizon_endpoint():
+    from index import app
+    client = app.test_client()
+    headers = {"X-Session-ID": "horizon"}
+    client.post("/api/v2/init", json={"algorithm": 0, "horizon": 5}, headers=headers)
+    client.post("/api/v2/add-processes", json=[{"arrival": 0, "burst": 9}], headers=headers)
+    client.post("/api/v2/run-all", headers=headers)
+    state = client.get("/api/v2/state", headers=headers).get_json()
+    assert (state["currentTime"], state["horizon"], state["isTruncated"]) == (5, 5, True)
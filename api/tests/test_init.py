@@ -0,0 +1,56 @@
+"""/api/v2/init."""
+
+import pytest
+
+
+HEADERS = {"X-Session-ID": "init"}
+
+
+@pytest.fixture
+def client():
+    from index import app
+    client = app.test_client()
+    client.post("/api/v2/init", json={"algorithm": 0}, headers=HEADERS)
+    client.post("/api/v2/add-processes", json=[{"arrival": 0, "burst": 5}], headers=HEADERS)
+    return client
+
+
+@pytest.mark.parametrize("body", [
+    {"algorithm": 6, "mlfqLevels": 0},
+    {"algorithm": 6, "mlfqQuanta": "fast"},
+    {"algorithm": "RR"},
+    {"quantum": "two"},
+])
+def test_rejected_init_keeps_the_session_engine(client, body):
+    response = client.post("/api/v2/init", json=body, headers=HEADERS)
+    assert response.status_code == 400
+    state = client.get("/api/v2/state", headers=HEADERS).get_json()
+    assert state["algorithm"] == "FCFS"
+    assert len(state["processes"]) == 1
+
+
+def test_init_replaces_the_engine(client):
+    assert client.post("/api/v2/init", json={"algorithm": 4, "quantum": 3}, headers=HEADERS).status_code == 200
+    state = client.get("/api/v2/state", headers=HEADERS).get_json()
+    assert state["processes"] == []
+
+
+@pytest.mark.parametrize("body", [
+    {"cores": "x"},
+    {"logCapacity": "big"},
+    {"logEvents": [None]},
+    {"logEvents": ["NOT_AN_EVENT"]},
+])
+def test_invalid_engine_options_are_rejected(client, body):
+    response = client.post("/api/v2/init", json=body, headers=HEADERS)
+    assert response.status_code == 400
+    assert len(client.get("/api/v2/state", headers=HEADERS).get_json()["processes"]) == 1
+
+
+def test_engine_sizes_are_clamped(client):
+    from index import MAX_CORES, MAX_LOG_CAPACITY, sessions
+    body = {"cores": 10**9, "logCapacity": 10**12}
+    assert client.post("/api/v2/init", json=body, headers=HEADERS).status_code == 200
+    engine = sessions.get("init").engine
+    assert engine.num_cores == MAX_CORES
+    assert engine.kernel_log.capacity == MAX_LOG_CAPACITY
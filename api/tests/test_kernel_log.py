@@ -0,0 +1,58 @@
+"""KernelLog ring buffer, event mask and spill file."""
+
+import random
+
+import pytest
+
+from kernel import SimulationEngine
+from kernel.kernel_log import ALL_EVENTS, KernelEvent, KernelLog, event_mask
+
+
+def random_events(seed: int, count: int) -> list[tuple]:
+    rng = random.Random(seed)
+    return [(tick, rng.choice([KernelEvent.ARRIVE, KernelEvent.DISPATCH, KernelEvent.COMPLETE]), rng.randrange(50))
+            for tick in range(count)]
+
+
+@pytest.mark.parametrize("capacity", [1, 7, 256, 1000])
+def test_ring_keeps_the_most_recent_events(capacity):
+    events = random_events(capacity, 700)
+    log = KernelLog(capacity)
+    for tick, code, pid in events:
+        log.append(tick, code, pid)
+    expected = [{"tick": t, "event": code.name.lower(), "pid": pid} for t, code, pid in events][-capacity:]
+    assert list(log) == expected
+    assert len(log) == len(expected)
+    assert log.total == len(events)
+    assert log.tail(3) == expected[-3:]
+
+
+def test_spill_file_keeps_the_full_history(tmp_path):
+    events = random_events(1, 1000)
+    log = KernelLog(10, spill_path=str(tmp_path / "events.bin"))
+    for tick, code, pid in events:
+        log.append(tick, code, pid)
+    assert [(e["tick"], e["pid"]) for e in log.history()] == [(t, pid) for t, _, pid in events]
+    log.close()
+
+
+def test_masked_events_are_not_recorded():
+    log = KernelLog(100, mask=event_mask(["dispatch"]))
+    for tick, code, pid in random_events(2, 50):
+        log.append(tick, code, pid)
+    assert {e["event"] for e in log} == {"dispatch"}
+    assert event_mask(KernelEvent) == ALL_EVENTS
+
+
+def test_engine_log_matches_an_unbounded_one():
+    def run(capacity):
+        engine = SimulationEngine(log_capacity=capacity)
+        engine.set_policy("RR")
+        for arrival, burst in ((0, 30), (3, 20), (40, 25)):
+            engine.add_process(arrival, burst)
+        engine.run_to_completion()
+        return engine.kernel_log
+
+    bounded, unbounded = run(16), run(10**6)
+    assert list(bounded) == list(unbounded)[-16:]
+    assert bounded.nbytes < 16 * 23 + 256 * 100
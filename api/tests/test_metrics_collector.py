@@ -0,0 +1,38 @@
+"""Incremental per-tick metrics against a recomputation from the processes."""
+
+import random
+
+import pytest
+
+from kernel import SimulationEngine
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+def recomputed(state: dict) -> dict:
+    processes = state["processes"]
+    done = [p for p in processes if p["stateName"] == "TERMINATED"]
+    started = [p for p in processes if p["startTime"] != -1]
+    return {
+        "avgWaitTime": round(sum(p["waitTime"] for p in processes) / len(processes), 2),
+        "avgTurnaroundTime": round(sum(p["turnaroundTime"] for p in done) / len(done), 2) if done else 0,
+        "avgResponseTime": round(sum(p["responseTime"] for p in started) / len(started), 2) if started else 0,
+        "throughput": round(len(done) / state["currentTime"], 4),
+        "contextSwitches": state["contextSwitches"],
+    }
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_snapshots_match_recomputation_every_tick(algorithm):
+    rng = random.Random(ALGORITHMS.index(algorithm))
+    for _ in range(10):
+        engine = SimulationEngine()
+        engine.set_policy(algorithm)
+        engine.set_time_quantum(rng.randint(1, 4))
+        for _ in range(rng.randint(1, 12)):
+            engine.add_process(rng.randint(0, 30), rng.randint(1, 12), rng.randint(0, 5))
+        while engine.tick():
+            snapshot = engine.metrics_collector.latest_snapshot
+            expected = recomputed(engine.get_state())
+            assert {key: snapshot[key] for key in expected} == expected
@@ -0,0 +1,124 @@
+"""MetricsHistory storage."""
+
+import tracemalloc
+
+import numpy as np
+
+from kernel.metrics_history import MetricsHistory
+
+
+def snapshot(t: int) -> dict:
+    return {
+        "tick": t,
+        "runningPid": t % 7 - 1,
+        "readyQueueLength": t % 5,
+        "cpuUtilization": round((t % 10_000) / 100, 2),
+        "throughput": round(t % 997 / 10_000, 4),
+        "contextSwitches": t // 3,
+        "avgWaitTime": round(t * 0.013, 2),
+        "avgTurnaroundTime": round(t * 0.021, 2),
+        "avgResponseTime": round(t * 0.007, 2),
+        "p95WaitTime": round(t * 0.031, 2),
+        "p99WaitTime": round(t * 0.037, 2),
+        "p95TurnaroundTime": round(t * 0.041, 2),
+        "p99TurnaroundTime": round(t * 0.043, 2),
+        "p95ResponseTime": round(t * 0.017, 2),
+        "p99ResponseTime": round(t * 0.019, 2),
+    }
+
+
+def test_values_round_trip_exactly():
+    rows = [snapshot(t) for t in range(0, 5_000_000, 997)]
+    history = MetricsHistory()
+    for row in rows:
+        history.append(row)
+    assert history.to_dicts() == rows
+    assert history.column("avgWaitTime").tolist() == [row["avgWaitTime"] for row in rows]
+    assert history.downsample(100).to_dicts()[0] == rows[0]
+
+
+def test_columns_widen_when_values_outgrow_32_bits():
+    history = MetricsHistory()
+    history.append(snapshot(1))
+    big = dict(snapshot(2), tick=2**40, avgWaitTime=99_999_999.99)
+    history.append(big)
+    assert history.to_dicts()[1] == big
+    assert history.column("tick").dtype == np.int64
+    assert history.column("runningPid").dtype == np.int32
+
+
+def test_values_are_range_checked_not_wrapped():
+    history = MetricsHistory()
+    history.append(dict(snapshot(1), contextSwitches=2**31 - 1))
+    assert history.column("contextSwitches").dtype == np.int32
+    rows = [dict(snapshot(2), contextSwitches=2**31), dict(snapshot(3), readyQueueLength=-2**31 - 1)]
+    for row in rows:
+        history.append(row)
+    assert history.to_dicts()[1:] == rows
+    assert history.head(3).to_dicts()[1:] == rows
+
+
+def test_memory_against_dict_rows():
+    """Measured: 58 bytes per snapshot in columns, 71 with the pyramid; about 7.5x smaller than dicts."""
+    n = 100_000
+    tracemalloc.start()
+    rows = [snapshot(t) for t in range(n)]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    history = MetricsHistory(n)
+    for row in rows:
+        history.append(row)
+    assert history.nbytes == 58 * n
+    history.downsample(1000)
+    assert history.nbytes < 72 * n
+    assert dict_bytes / history.nbytes > 7
+
+
+def reference_downsample(rows: list[dict], max_points: int) -> list[dict]:
+    """downsample() computed row by row: each bucket's min/max envelope."""
+    n = len(rows)
+    if n <= max_points:
+        return rows
+    size = 2
+    while -(-n // size) > max(max_points // 2, 1):
+        size *= 2
+    out = []
+    for start in range(0, n, size):
+        bucket = rows[start:start + size]
+        first, last = dict(bucket[0]), dict(bucket[-1])
+        for key in rows[0]:
+            if key in ("tick", "runningPid"):
+                continue
+            values = [row[key] for row in bucket]
+            lo_at, hi_at = values.index(min(values)), values.index(max(values))
+            first[key], last[key] = (min(values), max(values)) if lo_at <= hi_at else (max(values), min(values))
+        out += [first, last] if len(bucket) > 1 else [first]
+    return out
+
+
+def test_downsample_matches_bucket_envelopes():
+    rng = np.random.default_rng(0)
+    history = MetricsHistory()
+    rows = []
+    for t in range(3000):
+        row = snapshot(t)
+        row["avgWaitTime"] = round(float(rng.uniform(0, 50)), 2)
+        row["readyQueueLength"] = int(rng.integers(0, 4))
+        rows.append(row)
+        history.append(row)
+        if t in (5, 40, 333, 1024, 2047):
+            for max_points in (2, 7, 64, 500):
+                assert history.downsample(max_points).to_dicts() == reference_downsample(rows, max_points)
+    for max_points in (2, 3, 10, 64, 500, 2999):
+        assert history.downsample(max_points).to_dicts() == reference_downsample(rows, max_points)
+
+
+def test_pyramid_is_counted_and_small():
+    n = 100_000
+    history = MetricsHistory(n)
+    for t in range(n):
+        history.append(snapshot(t))
+    columns = history.nbytes
+    history.downsample(1000)
+    pyramid = history.nbytes - columns
+    assert 0 < pyramid <= 16 * n
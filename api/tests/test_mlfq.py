@@ -0,0 +1,63 @@
+"""Configurable MLFQ: levels, per-level quanta and priority boost."""
+
+import random
+
+import pytest
+
+from kernel.engine import SimulationEngine
+
+
+def mlfq(workload, **config) -> SimulationEngine:
+    engine = SimulationEngine()
+    engine.set_policy("MLFQ")
+    engine.set_mlfq_config(**config)
+    for arrival, burst in workload:
+        engine.add_process(arrival, burst)
+    return engine
+
+
+def test_quanta_and_boost_follow_the_config():
+    engine = mlfq([(0, 20), (0, 20)], quanta=[2, 3, None], boost_interval=10)
+    while engine.current_time <= 10:
+        engine.tick()
+    events = [(e["tick"], e["event"], e.get("pid")) for e in engine.get_state()["kernelLog"]
+              if e["event"] in ("demote", "boost")]
+    assert events[:4] == [(2, "demote", 0), (4, "demote", 1), (7, "demote", 0), (10, "boost", None)]
+    assert [q["quantum"] for q in engine.get_state()["mlfqState"]["queues"]] == [2, 3, None]
+
+
+def test_single_fcfs_level_schedules_like_fcfs():
+    workload = [(0, 5), (1, 3), (2, 8)]
+    single = mlfq(workload, levels=1)
+    fcfs = SimulationEngine()
+    fcfs.set_policy("FCFS")
+    for arrival, burst in workload:
+        fcfs.add_process(arrival, burst)
+    single.run_to_completion()
+    fcfs.run_to_completion()
+    assert single.get_state()["gantt"] == fcfs.get_state()["gantt"]
+
+
+def test_levels_default_to_doubling_quanta():
+    engine = mlfq([], levels=4)
+    assert [q["quantum"] for q in engine.get_state()["mlfqState"]["queues"]] == [4, 8, 16, None]
+
+
+@pytest.mark.parametrize("config", [{"levels": 0}, {"quanta": [2, 0]}, {"levels": 2, "quanta": [1]},
+                                    {"boost_interval": -1}])
+def test_inconsistent_config_is_rejected(config):
+    with pytest.raises(ValueError):
+        SimulationEngine().set_mlfq_config(**config)
+
+
+def test_custom_config_event_driven_matches_tick_loop():
+    rng = random.Random(6)
+    for _ in range(30):
+        workload = [(rng.randint(0, 40), rng.randint(1, 30)) for _ in range(rng.randint(1, 10))]
+        config = {"quanta": [rng.randint(1, 4) for _ in range(rng.randint(1, 3))] + [None],
+                  "boost_interval": rng.choice([None, rng.randint(5, 30)])}
+        ticked, jumped = mlfq(workload, **config), mlfq(workload, **config)
+        ticked.run_to_completion()
+        jumped.run_to_completion(event_driven=True)
+        assert jumped.get_state()["gantt"] == ticked.get_state()["gantt"]
+        assert jumped.get_final_metrics() == ticked.get_final_metrics()
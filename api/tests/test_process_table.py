@@ -0,0 +1,47 @@
+"""Columnar (NumPy) process table against the list of PCBs."""
+
+import random
+
+import numpy as np
+import pytest
+
+from kernel import SimulationEngine, SMPSimulationEngine
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("cores", [1, 3])
+def test_columnar_engine_matches_pcb_list(algorithm, cores):
+    rng = random.Random(ALGORITHMS.index(algorithm) * 10 + cores)
+    for _ in range(8):
+        workload = [(rng.randint(0, 30), rng.randint(1, 20), rng.randint(0, 5)) for _ in range(rng.randint(1, 15))]
+        quantum = rng.randint(1, 5)
+        results = []
+        for columnar in (False, True):
+            if cores == 1:
+                engine = SimulationEngine(columnar=columnar)
+            else:
+                engine = SMPSimulationEngine(num_cores=cores, balance_interval=4, columnar=columnar)
+            engine.set_policy(algorithm)
+            engine.set_time_quantum(quantum)
+            for process in workload:
+                engine.add_process(*process)
+            for _ in range(7):
+                engine.tick()
+            engine.run_to_completion(event_driven=True)
+            first = (engine.get_state(), engine.get_final_metrics())
+            engine.reset()
+            engine.run_to_completion()
+            results.append((first, engine.get_state()))
+        assert results[1] == results[0], (algorithm, workload)
+
+
+def test_bulk_load_fills_the_columns():
+    engine = SimulationEngine(columnar=True)
+    arrival = np.arange(10_000) % 97
+    engine.add_processes(arrival, np.full(10_000, 3))
+    assert np.array_equal(engine.processes.column("arrival_time"), arrival)
+    assert engine.processes[9_999].burst_time == 3
+    assert engine.processes.nbytes < 10_000 * 100
@@ -0,0 +1,56 @@
+"""P² quantile estimates against exact percentiles."""
+
+import numpy as np
+import pytest
+
+from kernel import SimulationEngine
+from kernel.quantiles import LogHistogram, P2Quantile
+
+
+def samples():
+    rng = np.random.default_rng(18)
+    yield "exponential", rng.exponential(20, 20_000)
+    yield "uniform", rng.uniform(0, 100, 20_000)
+    yield "bimodal", rng.permutation(np.concatenate([rng.normal(10, 2, 15_000), rng.normal(200, 20, 5_000)]))
+    yield "integers", rng.integers(0, 50, 20_000).astype(float)
+
+
+@pytest.mark.parametrize("p", [0.95, 0.99])
+def test_estimate_is_within_one_percent(p):
+    for name, values in samples():
+        estimator = P2Quantile(p)
+        for x in values.tolist():
+            estimator.add(x)
+        assert estimator.value == pytest.approx(np.percentile(values, p * 100), rel=0.01), name
+
+
+def test_small_streams_are_exact():
+    estimator = P2Quantile(0.5)
+    assert estimator.value == 0
+    for x, expected in zip([9, 1, 5, 3], [9, 1, 5, 3]):
+        estimator.add(x)
+    assert estimator.value == 3   # Nearest rank of [1, 3, 5, 9]
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "SJF", "RR", "MLFQ"])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_final_tail_latencies_are_exact(algorithm, columnar):
+    # Trending latencies (starvation under SJF/MLFQ) are where P² drifts most
+    rng = np.random.default_rng(5)
+    engine = SimulationEngine(headless=True, columnar=columnar)
+    engine.set_policy(algorithm)
+    engine.add_processes(np.sort(rng.integers(0, 20_000, 3_000)), rng.exponential(6, 3_000).astype(int) + 1)
+    engine.run_to_completion()
+    metrics = engine.get_final_metrics()
+    processes = engine.get_state()["processes"]
+    for name, key in (("Wait", "waitTime"), ("Turnaround", "turnaroundTime"), ("Response", "responseTime")):
+        values = [p[key] for p in processes]
+        for pct in (95, 99):
+            assert metrics[f"p{pct}{name}Time"] == np.percentile(values, pct, method="inverted_cdf")
+
+
+def test_histogram_buckets_are_powers_of_two():
+    histogram = LogHistogram()
+    for x in (0, 1, 2, 3, 4, 7, 8, 100):
+        histogram.add(x)
+    assert histogram.to_dict() == {"bounds": [0, 1, 2, 4, 8, 16, 32, 64], "counts": [1, 1, 2, 2, 1, 0, 0, 1]}
@@ -0,0 +1,47 @@
+"""ReadyQueue against a plain list model."""
+
+import random
+
+from kernel.ready_queue import ReadyQueue
+
+
+def test_keyed_and_levelled_selection_match_a_list_scan():
+    rng = random.Random(5)
+    keys = {pid: rng.randint(0, 6) for pid in range(200)}
+    levels = {pid: rng.randrange(3) for pid in range(200)}
+    queue = ReadyQueue(key=keys.get)
+    queue.set_levels(levels.get, 3)
+    model: list[int] = []
+    for _ in range(5000):
+        op = rng.random()
+        if op < 0.5:
+            pid = rng.randrange(200)
+            queue.enqueue(pid)
+            if pid not in model:
+                model.append(pid)
+        elif op < 0.75 and model:
+            pid = rng.choice(model)
+            queue.remove(pid)
+            model.remove(pid)
+        elif op < 0.9:
+            assert queue.dequeue() == (model.pop(0) if model else -1)
+        assert queue.as_list() == model
+        assert len(queue) == len(model)
+        assert queue.peek_last() == (model[-1] if model else -1)
+        # min() keeps the first of equal keys, i.e. the earliest enqueued
+        assert queue.peek_best() == (min(model, key=keys.get) if model else -1)
+        occupied = sorted({levels[pid] for pid in model})
+        assert queue.highest_level() == (occupied[0] if occupied else -1)
+        for level in range(3):
+            assert queue.level_list(level) == [pid for pid in model if levels[pid] == level]
+
+
+def test_set_key_reindexes_queued_pids():
+    queue = ReadyQueue()
+    for pid in (3, 1, 2):
+        queue.enqueue(pid)
+    assert queue.peek_best() == 3
+    queue.set_key(lambda pid: -pid)
+    assert queue.peek_best() == 3
+    queue.set_key(lambda pid: pid)
+    assert queue.peek_best() == 1
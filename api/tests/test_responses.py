@@ -0,0 +1,41 @@
+"""Fast JSON encoding, compression and conditional GETs."""
+
+import gzip
+import json
+
+import numpy as np
+
+from kernel import SimulationEngine
+
+
+HEADERS = {"X-Session-ID": "responses"}
+
+
+def test_fast_json_matches_the_stdlib():
+    from index import app
+    engine = SimulationEngine(columnar=True)
+    engine.set_policy("RR")
+    engine.add_processes(np.arange(50) % 7, np.arange(50) % 5 + 1)
+    engine.run_to_completion()
+    state = engine.get_state()
+    payload = app.json.dumps_bytes({**state, "array": np.arange(3), "big": 2**70})
+    assert json.loads(payload) == {**json.loads(json.dumps(state)), "array": [0, 1, 2], "big": 2**70}
+
+
+def test_large_state_is_gzipped_and_revalidated():
+    from index import app
+    client = app.test_client()
+    client.post("/api/v2/init", json={"algorithm": 4}, headers=HEADERS)
+    client.post("/api/v2/add-processes", json=[{"arrival": i, "burst": 3} for i in range(200)], headers=HEADERS)
+    client.post("/api/v2/run-all", headers=HEADERS)
+    plain = client.get("/api/v2/state", headers=HEADERS)
+    packed = client.get("/api/v2/state", headers={**HEADERS, "Accept-Encoding": "gzip"})
+    assert packed.headers["Content-Encoding"] == "gzip"
+    unpacked = json.loads(gzip.decompress(packed.get_data()))
+    assert {**unpacked, "seq": 0} == {**plain.get_json(), "seq": 0}   # Every full state takes a new seq
+    assert len(packed.get_data()) < len(plain.get_data()) / 4
+    again = client.get("/api/v2/state", headers={**HEADERS, "If-None-Match": plain.headers["ETag"]})
+    assert again.status_code == 304 and not again.get_data()
+    client.post("/api/v2/add-process", json={"arrival": 0, "burst": 1}, headers=HEADERS)
+    changed = client.get("/api/v2/state", headers={**HEADERS, "If-None-Match": plain.headers["ETag"]})
+    assert changed.status_code == 200
@@ -0,0 +1,17 @@
+"""Legacy v1 Scheduler."""
+
+from scheduler import Scheduler
+
+
+def test_run_to_completion_without_processes_returns():
+    scheduler = Scheduler()
+    assert scheduler.run_to_completion() is False
+    assert scheduler.current_time == 0
+
+
+def test_run_to_completion_stops_at_horizon():
+    scheduler = Scheduler()
+    scheduler.add_process(0, 50, 0)
+    scheduler.set_horizon(10)
+    assert scheduler.run_to_completion() is False
+    assert scheduler.is_truncated
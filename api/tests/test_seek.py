@@ -0,0 +1,60 @@
+"""Checkpoints and seek against a fresh tick-by-tick replay."""
+
+import copy
+import random
+
+import pytest
+
+from kernel import SimulationEngine, SMPSimulationEngine
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+def build(algorithm, workload, cores=1, **options):
+    if cores > 1:
+        engine = SMPSimulationEngine(num_cores=cores, balance_interval=3, **options)
+    else:
+        engine = SimulationEngine(**options)
+    engine.set_policy(algorithm)
+    engine.set_time_quantum(2)
+    for process in workload:
+        engine.add_process(*process)
+    return engine
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("cores", [1, 3])
+def test_seek_reproduces_every_tick(algorithm, cores):
+    rng = random.Random(ALGORITHMS.index(algorithm) * 10 + cores)
+    for _ in range(6):
+        workload = [(rng.randint(0, 40), rng.randint(1, 15), rng.randint(0, 4)) for _ in range(rng.randint(1, 12))]
+        reference = build(algorithm, workload, cores, log_capacity=20)
+        states = [copy.deepcopy(reference.get_state())]
+        while reference.tick():
+            states.append(copy.deepcopy(reference.get_state()))
+        engine = build(algorithm, workload, cores, log_capacity=20)
+        engine.checkpoint_interval = rng.choice([1, 3, 7])
+        engine.seek(len(states))
+        for _ in range(15):
+            tick = rng.randint(0, len(states) - 1)
+            engine.seek(tick)
+            assert engine.get_state() == states[tick], (workload, tick)
+
+
+def test_seek_costs_at_most_one_checkpoint_interval():
+    engine = build("RR", [(0, 5_000), (0, 5_000)])
+    engine.checkpoint_interval = 100
+    engine.run_to_completion()
+    ticks = 0
+    original = engine.tick
+
+    def counting_tick():
+        nonlocal ticks
+        ticks += 1
+        return original()
+
+    engine.tick = counting_tick
+    engine.seek(4_321)
+    assert engine.current_time == 4_321
+    assert ticks <= 100
@@ -0,0 +1,40 @@
+"""SessionRegistry eviction."""
+
+import time
+
+from sessions import SessionRegistry
+
+
+def test_busy_session_is_not_evicted():
+    registry = SessionRegistry(max_sessions=1)
+    busy = registry.get("busy")
+    other = registry.get("other")
+    assert "busy" in registry and len(registry) == 2
+    registry.release(other)
+    assert "busy" in registry
+    assert busy.engine.kernel_log._rows is not None
+    # Evictable once released
+    registry.release(busy)
+    registry.release(registry.get("next"))
+    assert "busy" not in registry and "next" in registry
+
+
+def test_held_session_survives_ttl_and_memory_pressure():
+    registry = SessionRegistry(ttl=0, memory_budget=0)
+    streaming = registry.get("streaming")
+    registry.hold(streaming)           # An open stream
+    registry.release(streaming)        # Its request ended
+    streaming.last_used = time.monotonic() - 10
+    registry.release(registry.get("other"))
+    assert "streaming" in registry
+    registry.release(streaming)        # The stream closed
+    registry.release(registry.get("other"))
+    assert "streaming" not in registry
+
+
+def test_idle_sessions_expire():
+    registry = SessionRegistry(ttl=60)
+    registry.release(registry.get("idle"))
+    registry._sessions["idle"].last_used -= 120
+    registry.release(registry.get("active"))
+    assert "idle" not in registry and "active" in registry
@@ -0,0 +1,66 @@
+"""SMPSimulationEngine: one core equals the single-CPU engine; fast-forward equals ticking."""
+
+import random
+
+import pytest
+
+from kernel.engine import SimulationEngine
+from kernel.smp_engine import SMPSimulationEngine
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+def workloads(seed: int, count: int = 15):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield rng.randint(1, 4), [
+            (rng.choice([0, rng.randint(0, 40)]), rng.randint(1, 30), rng.randint(0, 5))
+            for _ in range(rng.randint(1, 14))
+        ]
+
+
+def run(engine, algorithm, quantum, workload, event_driven=False):
+    engine.set_policy(algorithm)
+    engine.set_time_quantum(quantum)
+    for process in workload:
+        engine.add_process(*process)
+    engine.run_to_completion(event_driven=event_driven)
+    return engine
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_one_core_matches_the_single_cpu_engine(algorithm):
+    for quantum, workload in workloads(seed=ALGORITHMS.index(algorithm)):
+        single = run(SimulationEngine(), algorithm, quantum, workload).get_state()
+        smp = run(SMPSimulationEngine(num_cores=1), algorithm, quantum, workload).get_state()
+        for process in smp["processes"]:
+            del process["coreId"], process["migrations"]
+        for key in ("processes", "gantt", "currentTime", "contextSwitches"):
+            assert smp[key] == single[key], (algorithm, workload, key)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_event_driven_matches_tick_loop_on_many_cores(algorithm):
+    rng = random.Random(100 + ALGORITHMS.index(algorithm))
+    for quantum, workload in workloads(seed=100 + ALGORITHMS.index(algorithm)):
+        cores, interval = rng.randint(2, 5), rng.choice([3, 10])
+        results = []
+        for event_driven in (False, True):
+            engine = SMPSimulationEngine(num_cores=cores, balance_interval=interval)
+            run(engine, algorithm, quantum, workload, event_driven)
+            state = engine.get_state()
+            assert state["isCompleted"]
+            final = engine.get_final_metrics()
+            total = final["totalExecutionTime"]
+            busy = sum(final["coreUtilization"]) * total / 100
+            assert busy == pytest.approx(sum(burst for _, burst, _ in workload), abs=cores * total / 10_000)
+            gantt = sorted(state["gantt"], key=lambda g: (g["coreId"], g["startTime"]))
+            results.append((gantt, state["processes"], engine.get_final_metrics()))
+        assert results[0] == results[1], (algorithm, cores, workload)
+
+
+def test_work_spreads_across_cores():
+    engine = run(SMPSimulationEngine(num_cores=4), "FCFS", 1, [(0, 10, 0)] * 4)
+    assert engine.current_time == 10
+    assert engine.get_final_metrics()["coreUtilization"] == [100.0] * 4
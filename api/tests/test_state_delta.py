@@ -0,0 +1,96 @@
+"""StateDeltas: merged deltas reproduce get_state()."""
+
+import copy
+import json
+import random
+
+import pytest
+
+from kernel import SimulationEngine, SMPSimulationEngine, StateDeltas
+from kernel.engine import KERNEL_LOG_TAIL
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+def apply(client, message):
+    """What the frontend's mergeDelta does."""
+    if not message["delta"]:
+        return {k: v for k, v in message.items() if k not in ("seq", "delta")}
+    for key, value in message.items():
+        if key in ("seq", "delta", "baseSeq"):
+            continue
+        if key == "processes":
+            for d in value:
+                if d["pid"] < len(client["processes"]):
+                    client["processes"][d["pid"]] = d
+                else:
+                    client["processes"].append(d)
+        elif key in ("gantt", "metricsHistory"):
+            rows = value["entries"] if key == "gantt" else value["rows"]
+            client[key] = client[key][:value["from"]] + rows
+        elif key == "kernelLog":
+            client[key] = (client[key] + value)[-KERNEL_LOG_TAIL:]
+        else:
+            client[key] = value
+    return client
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_merged_deltas_match_get_state(seed):
+    rng = random.Random(seed)
+    for algorithm in ALGORITHMS:
+        columnar = rng.random() < 0.5
+        if rng.random() < 0.3:
+            engine = SMPSimulationEngine(num_cores=rng.randint(2, 3), balance_interval=3, columnar=columnar)
+        else:
+            engine = SimulationEngine(columnar=columnar)
+        engine.set_policy(algorithm)
+        for _ in range(rng.randint(1, 10)):
+            engine.add_process(rng.randint(0, 30), rng.randint(1, 12), rng.randint(0, 4))
+        deltas = StateDeltas(window=3)
+        client, seq = None, None
+        for _ in range(60):
+            r = rng.random()
+            if r < 0.05:
+                engine.seek(rng.randint(0, 40))
+            elif r < 0.1:
+                engine.update_process(rng.randrange(len(engine.processes)), burst=rng.randint(1, 9))
+            elif r < 0.15:
+                engine.add_process(rng.randint(0, 50), rng.randint(1, 9))
+            else:
+                engine.tick()
+            message = json.loads(json.dumps(deltas.since(engine, seq, None)))
+            if rng.random() < 0.1:
+                continue            # Response lost: the next delta builds on an older state
+            client, seq = apply(client, message), message["seq"]
+            assert client == json.loads(json.dumps(engine.get_state()))
+
+
+def test_deltas_send_only_changed_and_ready_processes():
+    engine = SimulationEngine()
+    engine.set_policy("FCFS")
+    engine.add_processes([0] * 1000 + [10_000], [50] * 1001)
+    deltas = StateDeltas()
+    seq = deltas.full(engine)["seq"]
+    engine.tick()
+    message = deltas.since(engine, seq)
+    # The process that was dispatched, plus the queued ones (waitTime grew)
+    assert message["delta"] and len(message["processes"]) == 1000
+    engine.tick()
+    message = deltas.since(engine, message["seq"])
+    assert [d["pid"] for d in message["processes"]][0] == 0
+    assert 10_000 not in [d["pid"] for d in message["processes"]]
+
+
+def test_unrecorded_full_state_is_not_a_base():
+    engine = SimulationEngine()
+    engine.add_process(0, 5)
+    deltas = StateDeltas(window=1)
+    seq = deltas.full(engine)["seq"]
+    polled = deltas.full(engine, record=False)["seq"]
+    assert polled > seq
+    engine.tick()
+    assert deltas.since(engine, seq)["delta"]             # The window still holds it
+    assert not deltas.since(engine, polled)["delta"]
+    assert deltas.nbytes < 1024
@@ -0,0 +1,66 @@
+"""Multi-tick step() and /api/v2/tick batching against single ticks."""
+
+import random
+
+import pytest
+
+from kernel import SimulationEngine, SMPSimulationEngine
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_step_matches_single_ticks(algorithm):
+    rng = random.Random(ALGORITHMS.index(algorithm))
+    for _ in range(20):
+        workload = [(rng.randint(0, 30), rng.randint(1, 12), rng.randint(0, 4)) for _ in range(rng.randint(1, 10))]
+        cores, horizon = rng.choice([1, 2]), rng.choice([None, 15])
+        stop_on = rng.choice([None, ["complete"], ["preempt"], ["dispatch", "complete"]])
+
+        def build():
+            engine = SMPSimulationEngine(num_cores=2, balance_interval=3) if cores > 1 else SimulationEngine()
+            engine.set_policy(algorithm)
+            engine.set_time_quantum(2)
+            engine.set_horizon(horizon)
+            for process in workload:
+                engine.add_process(*process)
+            return engine
+
+        stepped, ticked = build(), build()
+        while not (stepped.is_completed or stepped.is_truncated):
+            k = rng.randint(1, 6)
+            start = stepped.current_time
+            if rng.random() < 0.5:
+                got = stepped.step(ticks=k, stop_on=stop_on)
+            else:
+                got = stepped.step(until=start + k, stop_on=stop_on)
+            expected = None
+            for _ in range(k):
+                seen = ticked.kernel_log.total
+                if not ticked.tick() and ticked.current_time == start:
+                    break
+                hits = [e["event"] for e in ticked.kernel_log.render(ticked.kernel_log.rows(seen))
+                        if stop_on and e["event"] in stop_on]
+                if hits:
+                    expected = hits[0]
+                    break
+                if ticked.is_completed or ticked.is_truncated:
+                    break
+            assert stepped.get_state() == ticked.get_state(), (workload, k, stop_on)
+            assert (got.name.lower() if got else None) == expected
+
+
+def test_tick_endpoint_runs_a_batch():
+    from index import app
+    client = app.test_client()
+    headers = {"X-Session-ID": "step"}
+    client.post("/api/v2/init", json={"algorithm": 0}, headers=headers)
+    client.post("/api/v2/add-processes", json=[{"arrival": 0, "burst": 5}, {"arrival": 0, "burst": 5}],
+                headers=headers)
+    body = client.post("/api/v2/tick", json={"n": 3}, headers=headers).get_json()
+    assert body["ticks"] == 3
+    body = client.post("/api/v2/tick", json={"stopOn": ["complete"]}, headers=headers).get_json()
+    assert (body["stoppedOn"], body["ticks"]) == ("complete", 2)
+    state = client.get("/api/v2/state", headers=headers).get_json()
+    assert state["currentTime"] == 5
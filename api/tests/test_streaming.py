@@ -0,0 +1,59 @@
+"""/api/v2/stream: event ids and delta bases."""
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def client():
+    from index import app
+    client = app.test_client()
+    client.post("/api/v2/init", json={"algorithm": 4}, headers={"X-Session-ID": "stream"})
+    client.post("/api/v2/add-processes", json=[{"arrival": 0, "burst": 300}, {"arrival": 2, "burst": 200}],
+                headers={"X-Session-ID": "stream"})
+    return client
+
+
+def events(response):
+    """Parse SSE messages into (event, id, data) tuples as they arrive."""
+    for chunk in response.response:
+        chunk = chunk.decode() if isinstance(chunk, bytes) else chunk
+        for message in chunk.strip().split("\n\n"):
+            fields = dict(line.split(": ", 1) for line in message.split("\n") if not line.startswith(":"))
+            if fields:
+                yield fields["event"], fields.get("id"), json.loads(fields["data"])
+
+
+def test_deltas_chain_despite_other_requests(client):
+    response = client.get("/api/v2/stream?sessionId=stream&interval=1", buffered=False)
+    stream = events(response)
+    name, event_id, first = next(stream)
+    assert name == "tick" and not first["delta"] and event_id == str(first["seq"])
+    previous = first["seq"]
+    for _ in range(5):
+        # Same-session requests advance the session's seq, not the stream's base
+        client.get("/api/v2/state", headers={"X-Session-ID": "stream"})
+        name, event_id, data = next(stream)
+        assert data["delta"] and data["baseSeq"] == previous
+        assert event_id == str(data["seq"])
+        previous = data["seq"]
+    response.close()
+
+
+def test_reconnect_resumes_from_last_event_id(client):
+    response = client.get("/api/v2/stream?sessionId=stream&interval=1", buffered=False)
+    _, event_id, _ = next(events(response))
+    response.close()
+    response = client.get("/api/v2/stream?sessionId=stream&interval=1", buffered=False,
+                          headers={"Last-Event-ID": event_id})
+    _, _, data = next(events(response))
+    assert data["delta"] and data["baseSeq"] == int(event_id)
+    response.close()
+
+
+def test_unknown_base_gets_full_state(client):
+    response = client.get("/api/v2/stream?sessionId=stream&interval=1&sinceSeq=999999", buffered=False)
+    _, _, data = next(events(response))
+    assert data["delta"] is False
+    response.close()
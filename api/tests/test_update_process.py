@@ -0,0 +1,102 @@
+"""SimulationEngine.update_process and /api/v2/update-process validation."""
+
+import random
+
+import pytest
+
+from kernel.engine import SimulationEngine
+
+
+@pytest.fixture
+def engine():
+    engine = SimulationEngine()
+    engine.set_policy("FCFS")
+    engine.add_process(arrival=0, burst=4)
+    engine.add_process(arrival=1, burst=3)
+    engine.run_to_completion()
+    return engine
+
+
+@pytest.mark.parametrize("fields", [
+    {"burst": -3},
+    {"burst": 0},
+    {"arrival": -1},
+    {"priority": 1.5},
+])
+def test_invalid_edit_is_rejected_unchanged(engine, fields):
+    before = engine.get_state()
+    version = engine.version
+    with pytest.raises(ValueError):
+        engine.update_process(1, **fields)
+    assert engine.version == version
+    assert engine.get_state() == before
+
+
+def test_valid_edit_resimulates(engine):
+    engine.update_process(1, burst=5)
+    assert engine.processes[1].burst_time == 5
+    assert engine.get_final_metrics()["avgTurnaroundTime"] == (4 + 8) / 2
+
+
+@pytest.fixture
+def client():
+    from index import app
+    client = app.test_client()
+    client.post("/api/v2/add-processes", json=[{"arrival": 0, "burst": 4}],
+                headers={"X-Session-ID": "update-process"})
+    return client
+
+
+@pytest.mark.parametrize("body", [
+    {"pid": 0, "burst": -3},
+    {"pid": 0, "burstTime": 0},
+    {"pid": 0, "arrivalTime": -2},
+    {"pid": 0, "priority": 2.5},
+    {"pid": 7, "burst": 2},
+])
+def test_endpoint_rejects_invalid_edit(client, body):
+    response = client.post("/api/v2/update-process", json=body,
+                           headers={"X-Session-ID": "update-process"})
+    assert response.status_code == 400
+    assert response.get_json()["ok"] is False
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_incremental_resimulation_matches_from_scratch(algorithm):
+    rng = random.Random(ALGORITHMS.index(algorithm))
+
+    def build(workload):
+        engine = SimulationEngine()
+        engine.set_policy(algorithm)
+        engine.checkpoint_interval = rng.choice([1, 4, 9])
+        for process in workload:
+            engine.add_process(*process)
+        return engine
+
+    for _ in range(15):
+        workload = [[rng.randint(0, 40), rng.randint(1, 15), rng.randint(0, 4)] for _ in range(rng.randint(1, 10))]
+        engine = build(workload)
+        for _ in range(3):
+            if rng.random() < 0.3:
+                engine.run_to_completion()
+            else:
+                engine.seek(rng.randint(0, 80))
+            completed, now = engine.is_completed, engine.current_time
+            if rng.random() < 0.5:
+                workload.append([rng.randint(0, 50), rng.randint(1, 10), rng.randint(0, 4)])
+                engine.add_process(*workload[-1])
+            else:
+                pid = rng.randrange(len(workload))
+                workload[pid][1] = rng.randint(1, 12)
+                engine.update_process(pid, burst=workload[pid][1])
+            fresh = build(workload)
+            if completed:
+                fresh.run_to_completion(event_driven=True)
+            else:
+                fresh.seek(now)
+            expected, actual = fresh.get_state(), engine.get_state()
+            for key in ("currentTime", "isCompleted", "processes", "gantt", "readyQueue", "contextSwitches"):
+                assert actual[key] == expected[key], (workload, key)
@@ -0,0 +1,37 @@
+"""Engine versions and the /state ETag."""
+
+from kernel.engine import SimulationEngine
+
+
+def test_tick_on_a_finished_engine_keeps_the_version():
+    engine = SimulationEngine()
+    engine.add_process(arrival=0, burst=2)
+    engine.run_to_completion()
+    version = engine.version
+    assert engine.tick() is False
+    assert engine.version == version
+
+
+def test_reaching_the_horizon_changes_the_version_once():
+    engine = SimulationEngine()
+    engine.add_process(arrival=0, burst=10)
+    engine.set_horizon(3)
+    while engine.tick():
+        pass
+    version = engine.version
+    assert engine.is_truncated
+    engine.tick()
+    assert engine.version == version
+
+
+def test_redundant_tick_keeps_the_etag():
+    from index import app
+    client = app.test_client()
+    headers = {"X-Session-ID": "versioning"}
+    client.post("/api/v2/init", json={"algorithm": 0}, headers=headers)
+    client.post("/api/v2/add-processes", json=[{"arrival": 0, "burst": 1}], headers=headers)
+    client.post("/api/v2/run-all", headers=headers)
+    etag = client.get("/api/v2/state", headers=headers).headers["ETag"]
+    client.post("/api/v2/tick", json={}, headers=headers)
+    response = client.get("/api/v2/state", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
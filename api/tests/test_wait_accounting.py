@@ -0,0 +1,37 @@
+"""Lazy wait-time accounting against the eager per-tick definition."""
+
+import random
+
+import pytest
+
+from kernel.engine import SimulationEngine
+
+
+ALGORITHMS = ["FCFS", "SJF", "SRTF", "Priority", "RR", "LJF", "LRTF", "MLFQ"]
+
+
+def eager_wait(process: dict, now: int) -> int:
+    """Ticks spent READY: time since arrival not spent running."""
+    if process["stateName"] == "TERMINATED":
+        return process["turnaroundTime"] - process["burstTime"]
+    if process["arrivalTime"] >= now:
+        return 0
+    return now - process["arrivalTime"] - (process["burstTime"] - process["remainingTime"])
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_wait_times_match_eager_accounting_every_tick(algorithm):
+    rng = random.Random(ALGORITHMS.index(algorithm))
+    for _ in range(10):
+        engine = SimulationEngine()
+        engine.set_policy(algorithm)
+        engine.set_time_quantum(rng.randint(1, 4))
+        for _ in range(rng.randint(1, 10)):
+            engine.add_process(rng.randint(0, 30), rng.randint(1, 12), rng.randint(0, 5))
+        while engine.tick():
+            state = engine.get_state()
+            for process in state["processes"]:
+                assert process["waitTime"] == eager_wait(process, state["currentTime"]), process
+        final = engine.get_final_metrics()
+        processes = engine.get_state()["processes"]
+        assert final["avgWaitTime"] == pytest.approx(sum(p["waitTime"] for p in processes) / len(processes), abs=0.01)
@@ -31,12 +31,44 @@ export const ALGORITHM_DESCRIPTIONS = {
 
 const API = 'https://cpu-scheduling-visualizer-euxn.onrender.com/api/v2';
 
+// One backend simulation per browser tab: the server keys its engines by
+// this header (its session cookie doesn't reach a cross-origin API)
+const SESSION_ID = sessionStorage.getItem('sessionId') || crypto.randomUUID();
+sessionStorage.setItem('sessionId', SESSION_ID);
+export const SESSION_HEADERS = { 'X-Session-ID': SESSION_ID };
+
+// Charts can't draw more points than they have pixels; the server keeps
+// each metric's min/max envelope when thinning metricsHistory to this
+const MAX_POINTS = 1000;
+
 const emptyMetrics = {
   avgWaitTime: 0, avgTurnaroundTime: 0, avgResponseTime: 0,
   cpuUtilization: 0, throughput: 0, contextSwitches: 0,
   totalIdleTime: 0, totalExecutionTime: 0,
 };
 
+const KERNEL_LOG_TAIL = 50;
+
+/**
+ * Apply a /tick delta (see api/kernel/state_delta.py) to the previous
+ * state: changed PCBs replace theirs by pid, gantt and metricsHistory
+ * are replaced from the given index on, new kernel events are appended.
+ */
+function mergeDelta(prev, data) {
+  const processes = [...prev.processes];
+  for (const p of data.processes) processes[p.pid] = p;
+  return {
+    ...data,
+    processes,
+    gantt: [...prev.gantt.slice(0, data.gantt.from), ...data.gantt.entries],
+    metricsHistory: [
+      ...prev.metricsHistory.slice(0, data.metricsHistory.from),
+      ...data.metricsHistory.rows,
+    ],
+    kernelLog: [...prev.kernelLog, ...data.kernelLog].slice(-KERNEL_LOG_TAIL),
+  };
+}
+
 export default function useScheduler() {
   const [state, setState] = useState({
     currentTime: 0,
@@ -57,29 +89,54 @@ export default function useScheduler() {
   const [speed, setSpeed] = useState(500);
   const [isInitialized, setIsInitialized] = useState(false);
   const [error, setError] = useState(null);
-  const intervalRef = useRef(null);
-
-  const applyState = useCallback((data) => {
-    setState(prev => ({
-      ...prev,
-      currentTime: data.currentTime ?? prev.currentTime,
-      runningPid: data.runningPid ?? prev.runningPid,
-      isCompleted: data.isCompleted ?? prev.isCompleted,
-      processes: data.processes ?? prev.processes,
-      gantt: data.gantt ?? prev.gantt,
-      readyQueue: data.readyQueue ?? prev.readyQueue,
-      metrics: data.metrics ?? prev.metrics,
-      metricsHistory: data.metricsHistory ?? prev.metricsHistory,
-      kernelLog: data.kernelLog ?? prev.kernelLog,
-      mlfqState: data.mlfqState ?? prev.mlfqState,
-      contextSwitches: data.contextSwitches ?? prev.contextSwitches,
-      algorithm: data.algorithm ?? prev.algorithm,
-    }));
+  const streamRef = useRef(null);   // EventSource while playing
+  const speedRef = useRef(speed);
+  const seqRef = useRef(null);   // Sequence number of the last state applied
+  const resyncRef = useRef(false);   // A full /state resync is in flight
+  const [streamEpoch, setStreamEpoch] = useState(0);   // Bumped to reopen the stream
+
+  const applyState = useCallback(function apply(data) {
+    if (data.delta && data.baseSeq !== seqRef.current) {
+      // Older than what we hold (a late response): nothing to do
+      if (seqRef.current !== null && data.seq <= seqRef.current) return;
+      // Built on a state we never applied: fetch the full state, then
+      // reopen the stream so its deltas build on that
+      if (resyncRef.current) return;
+      resyncRef.current = true;
+      fetch(`${API}/state?maxPoints=${MAX_POINTS}`, { headers: SESSION_HEADERS, cache: 'no-store' })
+        .then(res => res.json())
+        .then((full) => {
+          apply(full);
+          if (streamRef.current) setStreamEpoch(n => n + 1);
+        })
+        .catch((e) => setError(`Resync failed: ${e.message}`))
+        .finally(() => { resyncRef.current = false; });
+      return;
+    }
+    if (data.seq !== undefined) seqRef.current = data.seq;
+    setState(prev => {
+      const next = data.delta ? mergeDelta(prev, data) : data;
+      return {
+        ...prev,
+        currentTime: next.currentTime ?? prev.currentTime,
+        runningPid: next.runningPid ?? prev.runningPid,
+        isCompleted: next.isCompleted ?? prev.isCompleted,
+        processes: next.processes ?? prev.processes,
+        gantt: next.gantt ?? prev.gantt,
+        readyQueue: next.readyQueue ?? prev.readyQueue,
+        metrics: next.metrics ?? prev.metrics,
+        metricsHistory: next.metricsHistory ?? prev.metricsHistory,
+        kernelLog: next.kernelLog ?? prev.kernelLog,
+        mlfqState: next.mlfqState ?? prev.mlfqState,
+        contextSwitches: next.contextSwitches ?? prev.contextSwitches,
+        algorithm: next.algorithm ?? prev.algorithm,
+      };
+    });
     if (data.isCompleted) {
       setIsRunning(false);
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current);
-        intervalRef.current = null;
+      if (streamRef.current) {
+        streamRef.current.close();
+        streamRef.current = null;
       }
     }
   }, []);
@@ -91,25 +148,23 @@ export default function useScheduler() {
       // 1. Init engine with algorithm
       await fetch(`${API}/init`, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: { ...SESSION_HEADERS, 'Content-Type': 'application/json' },
         body: JSON.stringify({ algorithm: algo, quantum: q }),
       });
 
-      // 2. Add all processes
-      for (const p of masterWorkload) {
-        await fetch(`${API}/add-process`, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({
-            arrivalTime: p.arrival,
-            burstTime: p.burst,
-            priority: p.priority,
-          }),
-        });
-      }
+      // 2. Add all processes in one request
+      await fetch(`${API}/add-processes`, {
+        method: 'POST',
+        headers: { ...SESSION_HEADERS, 'Content-Type': 'application/json' },
+        body: JSON.stringify(masterWorkload.map(p => ({
+          arrivalTime: p.arrival,
+          burstTime: p.burst,
+          priority: p.priority,
+        }))),
+      });
 
       // 3. Get initial state
-      const res = await fetch(`${API}/state`);
+      const res = await fetch(`${API}/state?maxPoints=${MAX_POINTS}`, { headers: SESSION_HEADERS });
       const data = await res.json();
       applyState(data);
       setIsInitialized(true);
@@ -118,10 +173,17 @@ export default function useScheduler() {
     }
   }, [applyState]);
 
-  /** Execute one tick */
-  const tick = useCallback(async () => {
+  /**
+   * Execute one tick, or a batch: options may set n (ticks), until (a
+   * clock value) or stopOn (kernel events such as 'complete', 'preempt')
+   */
+  const tick = useCallback(async (options = {}) => {
     try {
-      const res = await fetch(`${API}/tick`, { method: 'POST' });
+      const res = await fetch(`${API}/tick`, {
+        method: 'POST',
+        headers: { ...SESSION_HEADERS, 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ...options, maxPoints: MAX_POINTS, sinceSeq: seqRef.current }),
+      });
       const data = await res.json();
       if (data.ok) applyState(data);
       return data;
@@ -138,12 +200,12 @@ export default function useScheduler() {
     setIsRunning(true);
   }, [state.isCompleted]);
 
-  /** Pause auto-ticking */
+  /** Pause auto-ticking (closing the stream ends server-side playback) */
   const pause = useCallback(() => {
     setIsRunning(false);
-    if (intervalRef.current) {
-      clearInterval(intervalRef.current);
-      intervalRef.current = null;
+    if (streamRef.current) {
+      streamRef.current.close();
+      streamRef.current = null;
     }
   }, []);
 
@@ -154,10 +216,21 @@ export default function useScheduler() {
     await tick();
   }, [state.isCompleted, pause, tick]);
 
+  /** Step to the next completion or preemption (or other kernel events) */
+  const stepToEvent = useCallback(async (stopOn = ['complete', 'preempt']) => {
+    if (state.isCompleted) return;
+    pause();
+    await tick({ stopOn });
+  }, [state.isCompleted, pause, tick]);
+
   /** Run to completion */
   const runToEnd = useCallback(async () => {
     try {
-      const res = await fetch(`${API}/run-all`, { method: 'POST' });
+      const res = await fetch(`${API}/run-all`, {
+        method: 'POST',
+        headers: { ...SESSION_HEADERS, 'Content-Type': 'application/json' },
+        body: JSON.stringify({ maxPoints: MAX_POINTS }),
+      });
       const data = await res.json();
       if (data.ok) applyState(data);
       setIsRunning(false);
@@ -170,9 +243,9 @@ export default function useScheduler() {
   const resetSim = useCallback(async () => {
     pause();
     try {
-      const res = await fetch(`${API}/reset`, { method: 'POST' });
+      const res = await fetch(`${API}/reset`, { method: 'POST', headers: SESSION_HEADERS });
       if (res.ok) {
-        const stateRes = await fetch(`${API}/state`);
+        const stateRes = await fetch(`${API}/state?maxPoints=${MAX_POINTS}`, { headers: SESSION_HEADERS });
         const data = await stateRes.json();
         applyState(data);
       }
@@ -181,16 +254,55 @@ export default function useScheduler() {
     }
   }, [pause, applyState]);
 
-  // Auto-tick interval
-  useEffect(() => {
-    if (isRunning && !state.isCompleted) {
-      intervalRef.current = setInterval(tick, speed);
-      return () => clearInterval(intervalRef.current);
+  /** Jump to a tick (server restores the nearest checkpoint) */
+  const seek = useCallback(async (t) => {
+    pause();
+    try {
+      const res = await fetch(`${API}/seek`, {
+        method: 'POST',
+        headers: { ...SESSION_HEADERS, 'Content-Type': 'application/json' },
+        body: JSON.stringify({ tick: t, maxPoints: MAX_POINTS }),
+      });
+      const data = await res.json();
+      if (data.ok) applyState(data);
+    } catch (e) {
+      setError(`Seek failed: ${e.message}`);
     }
+  }, [pause, applyState]);
+
+  // Auto-tick: the server runs the engine and pushes states over SSE,
+  // instead of one POST /tick per tick
+  useEffect(() => {
+    if (!isRunning || state.isCompleted) return undefined;
+    const params = new URLSearchParams({
+      sessionId: SESSION_ID,
+      interval: speedRef.current,
+      maxPoints: MAX_POINTS,
+    });
+    if (seqRef.current !== null) params.set('sinceSeq', seqRef.current);
+    const source = new EventSource(`${API}/stream?${params}`);
+    streamRef.current = source;
+    source.addEventListener('tick', (e) => applyState(JSON.parse(e.data)));
+    source.addEventListener('end', () => {
+      source.close();
+      setIsRunning(false);
+    });
     return () => {
-      if (intervalRef.current) clearInterval(intervalRef.current);
+      source.close();
+      if (streamRef.current === source) streamRef.current = null;
     };
-  }, [isRunning, speed, tick, state.isCompleted]);
+  }, [isRunning, state.isCompleted, streamEpoch, applyState]);
+
+  // Speed changes apply to the open stream without reconnecting
+  useEffect(() => {
+    speedRef.current = speed;
+    if (!streamRef.current) return;
+    fetch(`${API}/stream/control`, {
+      method: 'POST',
+      headers: { ...SESSION_HEADERS, 'Content-Type': 'application/json' },
+      body: JSON.stringify({ interval: speed }),
+    }).catch((e) => setError(`Speed change failed: ${e.message}`));
+  }, [speed]);
 
   return {
     state,
@@ -204,7 +316,9 @@ export default function useScheduler() {
     start,
     pause,
     step,
+    stepToEvent,
     runToEnd,
     resetSim,
+    seek,
   };
 }
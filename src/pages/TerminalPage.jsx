@@ -4,6 +4,7 @@
  */
 
 import { useEffect, useRef, useState } from 'react';
+import { SESSION_HEADERS } from '../hooks/useScheduler';
 
 export default function TerminalPage() {
     const termRef = useRef(null);
@@ -147,7 +148,7 @@ async function handleCommand(term, cmd) {
         case 'status': {
             term.writeln('\x1b[33mChecking api status...\x1b[0m');
             try {
-                const res = await fetch(`${API}/state`);
+                const res = await fetch(`${API}/state`, { headers: SESSION_HEADERS });
                 const data = await res.json();
                 term.writeln(`\x1b[32m✓\x1b[0m Backend is \x1b[1mONLINE\x1b[0m`);
                 term.writeln(`  Algorithm: \x1b[36m${data.algorithm}\x1b[0m`);
@@ -186,7 +187,7 @@ async function handleCommand(term, cmd) {
         case 'predict': {
             term.writeln('\x1b[33mPredicting best algorithm for current workload...\x1b[0m');
             try {
-                const stateRes = await fetch(`${API}/state`);
+                const stateRes = await fetch(`${API}/state`, { headers: SESSION_HEADERS });
                 const stateData = await stateRes.json();
                 const procs = stateData.processes?.map(p => ({
                     arrival: p.arrivalTime, burst: p.burstTime, priority: p.priority,
@@ -225,7 +226,7 @@ async function handleCommand(term, cmd) {
         case 'compare': {
             term.writeln('\x1b[33mComparing all algorithms...\x1b[0m');
             try {
-                const stateRes = await fetch(`${API}/state`);
+                const stateRes = await fetch(`${API}/state`, { headers: SESSION_HEADERS });
                 const stateData = await stateRes.json();
                 const procs = stateData.processes?.map(p => ({
                     arrival: p.arrivalTime, burst: p.burstTime, priority: p.priority,